@@ -16,7 +16,7 @@ from singer_sdk.schema.source import (
     StreamSchema,
 )
 from singer_sdk.sinks import BatchSink, RecordSink, Sink
-from singer_sdk.streams import GraphQLStream, RESTStream, Stream
+from singer_sdk.streams import AsyncRESTStream, GraphQLStream, RESTStream, Stream
 from singer_sdk.tap_base import Tap
 from singer_sdk.target_base import Target
 
@@ -30,6 +30,7 @@ if t.TYPE_CHECKING:
     )
 
 __all__ = [
+    "AsyncRESTStream",
     "BatchSink",
     "GraphQLStream",
     "InlineMapper",
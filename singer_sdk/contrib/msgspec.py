@@ -11,8 +11,12 @@ import typing as t
 import msgspec
 import msgspec.json
 
-from singer_sdk.singerlib.encoding.base import GenericSingerReader, GenericSingerWriter
-from singer_sdk.singerlib.encoding.simple import Message
+from singer_sdk.singerlib.encoding.base import (
+    GenericSingerReader,
+    GenericSingerWriter,
+    SingerMessageType,
+)
+from singer_sdk.singerlib.encoding.simple import Message, _to_utc_time_extracted
 from singer_sdk.singerlib.exceptions import InvalidInputLine
 
 logger = logging.getLogger(__name__)
@@ -46,6 +50,8 @@ def dec_hook(type: type, obj: t.Any) -> t.Any:  # noqa: ARG001, A002, ANN401
 encoder = msgspec.json.Encoder(enc_hook=enc_hook, decimal_format="number")
 decoder = msgspec.json.Decoder(dec_hook=dec_hook, float_hook=decimal.Decimal)
 _jsonl_msg_buffer = bytearray(64)
+_BUFFERED_MESSAGE_TYPES = frozenset((SingerMessageType.RECORD, SingerMessageType.BATCH))
+_MESSAGE_TYPES = frozenset(message_type.value for message_type in SingerMessageType)
 
 
 def serialize_jsonl(obj: object, **kwargs: t.Any) -> bytes:  # noqa: ARG001
@@ -63,6 +69,113 @@ def serialize_jsonl(obj: object, **kwargs: t.Any) -> bytes:  # noqa: ARG001
     return _jsonl_msg_buffer
 
 
+class DecodedMessage(dict):
+    """A message dictionary built from a struct validated by the typed decoder."""
+
+    __slots__ = ()
+
+
+class MessageStruct(msgspec.Struct, tag_field="type"):
+    """Base class for typed Singer messages, tagged by their ``type`` key."""
+
+    def to_dict(self) -> DecodedMessage:
+        """Return a dictionary representation of the message.
+
+        Optional fields that are not set are left out, as in the JSON line.
+
+        Returns:
+            A dictionary with the message fields, including ``type``.
+        """
+        message = DecodedMessage(type=self.__struct_config__.tag)
+        for name in self.__struct_fields__:
+            value = getattr(self, name)
+            if value is not None:
+                message[name] = value
+        return message
+
+
+class RecordMessageStruct(MessageStruct, tag=SingerMessageType.RECORD.value):
+    """Typed Singer record message."""
+
+    stream: str
+    record: dict[str, t.Any]
+    version: int | None = None
+    time_extracted: str | None = None
+
+    def to_dict(self) -> DecodedMessage:
+        """Return a dictionary representation of the record message.
+
+        Returns:
+            A dictionary with the message fields, including ``type``.
+        """
+        message = DecodedMessage(
+            {"type": "RECORD", "stream": self.stream, "record": self.record},
+        )
+        if self.version is not None:
+            message["version"] = self.version
+        if self.time_extracted is not None:
+            message["time_extracted"] = self.time_extracted
+        return message
+
+
+class SchemaMessageStruct(MessageStruct, tag=SingerMessageType.SCHEMA.value):
+    """Typed Singer schema message."""
+
+    stream: str
+    schema: dict[str, t.Any]
+    key_properties: list[str] | None = None
+    bookmark_properties: list[str] | str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the schema.
+
+        Raises:
+            ValueError: If the schema has no properties.
+        """
+        if "properties" not in self.schema:
+            msg = "Schema is missing required properties key"
+            raise ValueError(msg)
+
+
+class StateMessageStruct(MessageStruct, tag=SingerMessageType.STATE.value):
+    """Typed Singer state message."""
+
+    value: dict[str, t.Any]
+
+
+class ActivateVersionMessageStruct(
+    MessageStruct,
+    tag=SingerMessageType.ACTIVATE_VERSION.value,
+):
+    """Typed Singer activate version message."""
+
+    stream: str
+    version: int
+
+
+class BatchMessageStruct(MessageStruct, tag=SingerMessageType.BATCH.value):
+    """Typed Singer batch message."""
+
+    stream: str
+    encoding: dict[str, t.Any]
+    manifest: list[str]
+    version: int | None = None
+
+
+SingerMessageStruct = (
+    RecordMessageStruct
+    | SchemaMessageStruct
+    | StateMessageStruct
+    | ActivateVersionMessageStruct
+    | BatchMessageStruct
+)
+typed_decoder = msgspec.json.Decoder(
+    SingerMessageStruct,
+    dec_hook=dec_hook,
+    float_hook=decimal.Decimal,
+)
+
+
 class MsgSpecReader(GenericSingerReader[str]):
     """Base class for all plugins reading Singer messages as strings from stdin."""
 
@@ -87,10 +200,99 @@ class MsgSpecReader(GenericSingerReader[str]):
             msg = f"Unable to parse line as JSON: {line}"
             raise InvalidInputLine(msg) from exc
 
+    def deserialize_lines(self, data: str | memoryview) -> list[dict]:
+        """Deserialize a block of newline-delimited json in a single call.
+
+        Args:
+            data: One or more lines of json.
+
+        Returns:
+            A list of the deserialized messages. Blank lines are skipped.
+        """
+        try:
+            return decoder.decode_lines(data)
+        except msgspec.DecodeError:
+            # Decode line by line to report the offending line
+            return super().deserialize_lines(data)
+
+
+class TypedMsgSpecReader(MsgSpecReader):
+    """Reader that decodes Singer messages into typed msgspec structs.
+
+    Required keys and the message type are validated by the msgspec decoder, so
+    decoded messages skip the per-message key checks. Callbacks still receive
+    dictionaries shaped like the JSON lines, but keys not defined by the Singer spec
+    are dropped. Messages of unknown types are passed through untyped and checked
+    like in `MsgSpecReader`.
+    """
+
+    def deserialize_json(self, line: str | bytes) -> dict:
+        """Deserialize a line of json into a validated Singer message.
+
+        Args:
+            line: A single line of json.
+
+        Returns:
+            A dictionary of the deserialized message.
+
+        Raises:
+            InvalidInputLine: If the line cannot be parsed or is not a valid message.
+        """
+        try:
+            message_struct: MessageStruct = typed_decoder.decode(line)
+        except msgspec.ValidationError as exc:
+            message = super().deserialize_json(line)  # type: ignore[arg-type]
+            if message.get("type") not in _MESSAGE_TYPES:
+                # Let the caller handle unknown or missing message types
+                return message
+            msg = f"Invalid Singer message ({exc}): {line!s}"
+            raise InvalidInputLine(msg) from exc
+        except msgspec.DecodeError as exc:
+            logger.exception("Unable to parse:\n%s", line)
+            msg = f"Unable to parse line as JSON: {line!s}"
+            raise InvalidInputLine(msg) from exc
+        return message_struct.to_dict()
+
+    def deserialize_lines(self, data: str | memoryview) -> list[dict]:
+        """Deserialize a block of newline-delimited json in a single call.
+
+        Args:
+            data: One or more lines of json.
+
+        Returns:
+            A list of the deserialized messages. Blank lines are skipped.
+        """
+        try:
+            messages: list[MessageStruct] = typed_decoder.decode_lines(data)
+        except msgspec.DecodeError:
+            # Decode line by line to handle or report the offending line
+            return GenericSingerReader.deserialize_lines(self, data)
+        return [message.to_dict() for message in messages]
+
+    @staticmethod
+    def assert_line_requires(line_dict: dict, requires: set[str]) -> None:
+        """Check required keys, unless the decoder has already validated them.
+
+        Args:
+            line_dict: The message to check.
+            requires: The required keys.
+        """
+        if type(line_dict) is not DecodedMessage:
+            GenericSingerReader.assert_line_requires(line_dict, requires)
+
 
 class MsgSpecWriter(GenericSingerWriter[bytes, Message]):
     """Interface for all plugins writing Singer messages to stdout."""
 
+    def __init__(self, **kwargs: t.Any) -> None:
+        """Initialize the writer.
+
+        Args:
+            kwargs: Keyword arguments passed to the base writer.
+        """
+        super().__init__(**kwargs)
+        self._record_prefixes: dict[str, bytes] = {}
+
     def serialize_message(self, message: Message) -> bytes:  # noqa: PLR6301
         """Serialize a dictionary into a line of json.
 
@@ -108,5 +310,57 @@ class MsgSpecWriter(GenericSingerWriter[bytes, Message]):
         Args:
             message: The message to write.
         """
-        sys.stdout.buffer.write(self.format_message(message))
+        line = self.format_message(message)
+        self._write_line(
+            # The serialized line lives in a shared buffer, so copy it if it has to
+            # outlive this call.
+            bytes(line) if self.is_buffered else line,
+            force_flush=message.type not in _BUFFERED_MESSAGE_TYPES,
+        )
+
+    def write_record(
+        self,
+        stream: str,
+        record: dict[str, t.Any],
+        *,
+        version: int | None = None,
+        time_extracted: datetime.datetime | None = None,
+    ) -> None:
+        """Write a RECORD message to stdout.
+
+        The message envelope is encoded directly into a reusable buffer, starting
+        from a cached prefix for the stream.
+
+        Args:
+            stream: The stream name.
+            record: The record data.
+            version: The record version.
+            time_extracted: The time the record was extracted.
+        """
+        prefix = self._record_prefixes.get(stream)
+        if prefix is None:
+            prefix = b'{"type":"RECORD","stream":%b,"record":' % encoder.encode(stream)
+            self._record_prefixes[stream] = prefix
+
+        line = _jsonl_msg_buffer
+        line[:] = prefix
+        encoder.encode_into(record, line, -1)
+        if version is not None:
+            line += b',"version":%d' % version
+        if time_extracted is not None:
+            line += b',"time_extracted":'
+            encoder.encode_into(_to_utc_time_extracted(time_extracted), line, -1)
+        line += b"}\n"
+        self._write_line(
+            bytes(line) if self.is_buffered else line,  # type: ignore[arg-type]
+            force_flush=False,
+        )
+
+    def _empty_output(self) -> bytes:  # noqa: PLR6301
+        return b""
+
+    def _write_output(self, data: bytes) -> None:  # noqa: PLR6301
+        sys.stdout.buffer.write(data)
+
+    def _flush_output(self) -> None:  # noqa: PLR6301
         sys.stdout.flush()
@@ -0,0 +1,57 @@
+"""Record validator using the fastjsonschema library."""
+
+from __future__ import annotations
+
+import typing as t
+
+import fastjsonschema
+
+from singer_sdk.exceptions import InvalidJSONSchema, InvalidRecord
+from singer_sdk.sinks.core import BaseJSONSchemaValidator
+
+__all__ = ["FastJSONSchemaValidator"]
+
+
+class FastJSONSchemaValidator(BaseJSONSchemaValidator):
+    """Validate records with code generated from the schema by ``fastjsonschema``."""
+
+    def __init__(
+        self,
+        schema: dict[str, t.Any],
+        *,
+        validate_formats: bool = False,
+    ) -> None:
+        """Compile the validator.
+
+        Args:
+            schema: Schema of the stream to sink.
+            validate_formats: Whether JSON string formats (e.g. ``date-time``) should
+                be validated.
+
+        Raises:
+            InvalidJSONSchema: If the schema provided from tap or mapper is invalid.
+        """
+        super().__init__(schema)
+        try:
+            self.validator = fastjsonschema.compile(
+                schema,
+                use_default=False,
+                use_formats=validate_formats,
+            )
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            error_message = f"Schema Validation Error: {e}"
+            raise InvalidJSONSchema(error_message) from e
+
+    def validate(self, record: dict[str, t.Any]) -> None:
+        """Validate a record message.
+
+        Args:
+            record: Record message to validate.
+
+        Raises:
+            InvalidRecord: If the record is invalid.
+        """
+        try:
+            self.validator(record)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise InvalidRecord(e.message, record) from e
@@ -0,0 +1,158 @@
+"""Record validator using msgspec structs derived from the schema."""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import operator
+import typing as t
+
+import msgspec
+import msgspec.json
+
+from singer_sdk.exceptions import InvalidRecord
+from singer_sdk.sinks.core import BaseJSONSchemaValidator
+
+__all__ = ["MsgSpecValidator"]
+
+# Like jsonschema, accept floats with a zero fractional part as integers
+_INTEGER = int | t.Annotated[float, msgspec.Meta(multiple_of=1)]
+_PRIMITIVE_TYPES: dict[str, t.Any] = {
+    "null": None,
+    "boolean": bool,
+    "integer": _INTEGER,
+    "number": float,
+    "string": str,
+}
+
+
+class MsgSpecValidator(BaseJSONSchemaValidator):
+    """Validate records by converting them to ``msgspec`` structs.
+
+    The schema is translated once into a tree of struct types, which checks the types
+    of values, required properties and whether additional properties are allowed.
+    Other JSON schema keywords, such as ``enum``, ``format``, ``pattern`` or numeric
+    bounds, are not enforced. Subschemas that cannot be expressed as ``msgspec``
+    types accept any value.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, t.Any],
+        *,
+        validate_formats: bool = False,  # noqa: ARG002
+    ) -> None:
+        """Build the struct types for the schema.
+
+        Args:
+            schema: Schema of the stream to sink.
+            validate_formats: Not supported by this validator.
+        """
+        super().__init__(schema)
+        self._counter = itertools.count()
+        self.record_type = self._to_type(schema)
+        self.batch_type = list[self.record_type]  # type: ignore[name-defined]
+
+    def validate(self, record: dict[str, t.Any]) -> None:
+        """Validate a record message.
+
+        Args:
+            record: Record message to validate.
+
+        Raises:
+            InvalidRecord: If the record is invalid.
+        """
+        try:
+            msgspec.convert(record, self.record_type)
+        except msgspec.ValidationError as e:
+            raise InvalidRecord(str(e), record) from e
+
+    def validate_batch(
+        self,
+        records: t.Sequence[dict[str, t.Any]],
+    ) -> list[InvalidRecord]:
+        """Validate a batch of record messages in a single call.
+
+        Records are only checked one by one if the batch contains invalid records.
+
+        Args:
+            records: Record messages to validate.
+
+        Returns:
+            The errors of the invalid records, in input order.
+        """
+        try:
+            msgspec.convert(records, self.batch_type)
+        except msgspec.ValidationError:
+            return super().validate_batch(records)
+        return []
+
+    def _to_type(self, schema: dict[str, t.Any]) -> t.Any:  # noqa: ANN401
+        """Translate a JSON schema into a type supported by msgspec.
+
+        Args:
+            schema: A JSON schema.
+
+        Returns:
+            The equivalent type, or ``typing.Any`` if it cannot be expressed.
+        """
+        if "anyOf" in schema:
+            types = [self._to_type(option) for option in schema["anyOf"]]
+        elif "type" in schema:
+            schema_types = schema["type"]
+            if isinstance(schema_types, str):
+                schema_types = [schema_types]
+            types = [
+                self._to_single_type(schema, schema_type)
+                for schema_type in schema_types
+            ]
+        else:
+            return t.Any
+
+        if any(type_ is t.Any for type_ in types):
+            return t.Any
+
+        union = functools.reduce(operator.or_, types) if len(types) > 1 else types[0]
+        try:
+            # Fail early on unions msgspec does not support, e.g. multiple structs
+            msgspec.json.Decoder(union)
+        except TypeError:
+            return t.Any
+        return union
+
+    def _to_single_type(self, schema: dict[str, t.Any], schema_type: str) -> t.Any:  # noqa: ANN401
+        if schema_type in _PRIMITIVE_TYPES:
+            return _PRIMITIVE_TYPES[schema_type]
+
+        if schema_type == "array":
+            items = schema.get("items")
+            if isinstance(items, dict) and "prefixItems" not in schema:
+                return list[self._to_type(items)]  # type: ignore[misc]
+            return list
+
+        if schema_type == "object":
+            if "properties" not in schema:
+                return dict
+            return self._to_struct(schema)
+
+        return t.Any
+
+    def _to_struct(self, schema: dict[str, t.Any]) -> type[msgspec.Struct]:
+        required = set(schema.get("required", []))
+        fields = []
+        for i, (name, property_schema) in enumerate(schema["properties"].items()):
+            type_ = self._to_type(property_schema)
+            if name in required:
+                field = msgspec.field(name=name)
+            else:
+                # Missing optional properties are fine, but explicit nulls are not
+                # unless the property schema allows them
+                field = msgspec.field(name=name, default=None)
+            fields.append((f"field_{i}", type_, field))
+
+        return msgspec.defstruct(
+            f"Record{next(self._counter)}",
+            fields,
+            kw_only=True,
+            forbid_unknown_fields=schema.get("additionalProperties") is False,
+        )
@@ -0,0 +1,228 @@
+"""Helpers for accumulating records in Apache Arrow columns."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import typing as t
+
+import pyarrow as pa
+
+from singer_sdk.helpers._compat import (
+    date_fromisoformat,
+    datetime_fromisoformat,
+    time_fromisoformat,
+)
+from singer_sdk.singerlib.json import serialize_json
+
+_PRIMITIVE_TYPES: dict[str, pa.DataType] = {
+    "boolean": pa.bool_(),
+    "integer": pa.int64(),
+    "number": pa.float64(),
+    "string": pa.string(),
+}
+_STRING_FORMAT_TYPES: dict[str, pa.DataType] = {
+    "date-time": pa.timestamp("us", tz="UTC"),
+    "date": pa.date32(),
+    "time": pa.time64("us"),
+}
+
+
+def json_schema_to_arrow_schema(schema: dict[str, t.Any]) -> pa.Schema:
+    """Convert the JSON schema of a stream to an Arrow schema.
+
+    Properties that do not map to a single Arrow type, such as objects without
+    properties or unions of several types, are stored as JSON strings.
+
+    Args:
+        schema: The JSON schema of the stream.
+
+    Returns:
+        An Arrow schema with a field for each property.
+    """
+    return pa.schema(_json_schema_to_arrow_fields(schema))
+
+
+def _json_schema_to_arrow_fields(schema: dict[str, t.Any]) -> list[pa.Field]:
+    return [
+        pa.field(name, _json_schema_to_arrow_type(property_schema))
+        for name, property_schema in schema.get("properties", {}).items()
+    ]
+
+
+def _json_schema_to_arrow_type(schema: dict[str, t.Any]) -> pa.DataType:  # noqa: PLR0911
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        if len(options) != 1:
+            return pa.string()
+        return _json_schema_to_arrow_type(options[0])
+
+    schema_types = schema.get("type", [])
+    if isinstance(schema_types, str):
+        schema_types = [schema_types]
+    schema_types = [type_ for type_ in schema_types if type_ != "null"]
+    if len(schema_types) != 1:
+        return pa.string()
+
+    schema_type = schema_types[0]
+    if schema_type == "string" and schema.get("format") in _STRING_FORMAT_TYPES:
+        return _STRING_FORMAT_TYPES[schema["format"]]
+    if schema_type == "array" and isinstance(schema.get("items"), dict):
+        return pa.list_(_json_schema_to_arrow_type(schema["items"]))
+    if schema_type == "object" and schema.get("properties"):
+        return pa.struct(_json_schema_to_arrow_fields(schema))
+    return _PRIMITIVE_TYPES.get(schema_type, pa.string())
+
+
+def _coerce_value(value: t.Any, arrow_type: pa.DataType) -> t.Any:  # noqa: ANN401, C901, PLR0911
+    """Coerce a value that Arrow could not convert as-is to the column type.
+
+    Args:
+        value: The value to coerce.
+        arrow_type: The type of the column.
+
+    Returns:
+        The coerced value.
+
+    """
+    if value is None:
+        return None
+    if pa.types.is_floating(arrow_type):
+        return float(value)
+    if pa.types.is_integer(arrow_type):
+        return _coerce_integer(value)
+    if isinstance(value, str):
+        # For example, the placeholder values of unparseable timestamps
+        if pa.types.is_timestamp(arrow_type):
+            return datetime_fromisoformat(value)
+        if pa.types.is_date(arrow_type):
+            return date_fromisoformat(value)
+        if pa.types.is_time(arrow_type):
+            return time_fromisoformat(value)
+    if pa.types.is_time(arrow_type) and isinstance(value, datetime.time):
+        return value.replace(tzinfo=None)
+    if pa.types.is_string(arrow_type):
+        return value if isinstance(value, str) else serialize_json(value)
+    if pa.types.is_list(arrow_type) and isinstance(value, list):
+        return [_coerce_value(item, arrow_type.value_type) for item in value]
+    if pa.types.is_struct(arrow_type) and isinstance(value, dict):
+        return {
+            field.name: _coerce_value(value.get(field.name), field.type)
+            for field in arrow_type
+        }
+    return value
+
+
+def _coerce_integer(value: t.Any) -> int:  # noqa: ANN401
+    """Convert an integral number to an integer.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The integer.
+
+    Raises:
+        ValueError: If the value is not an integral number.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if (
+        isinstance(value, decimal.Decimal)
+        and value.is_finite()
+        and value == value.to_integral_value()
+    ):
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    msg = f"Expected an integer, got {value!r}"
+    raise ValueError(msg)
+
+
+def _to_arrow_array(
+    values: list[t.Any],
+    arrow_type: pa.DataType,
+    name: str,
+) -> pa.Array:
+    try:
+        if pa.types.is_integer(arrow_type):
+            # Arrow truncates floats converted to integers, so only cast the values
+            # as-is if they are all integers
+            array = pa.array(values)
+            if pa.types.is_integer(array.type) or pa.types.is_null(array.type):
+                return array.cast(arrow_type)  # type: ignore[no-any-return]
+        else:
+            return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    try:
+        return pa.array(
+            [_coerce_value(value, arrow_type) for value in values],
+            type=arrow_type,
+        )
+    except (ValueError, TypeError, pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        msg = f"Cannot convert the values of property {name!r} to {arrow_type}: {e}"
+        raise ValueError(msg) from e
+
+
+class ArrowTableBuilder:
+    """Accumulate records and build an Arrow table from them.
+
+    Records are converted to an Arrow record batch, one column at a time, every
+    ``chunk_size`` records, so at most one chunk of records is held as Python
+    objects. Record keys that are not in the Arrow schema are dropped.
+    """
+
+    def __init__(self, arrow_schema: pa.Schema, *, chunk_size: int) -> None:
+        """Initialize the builder.
+
+        Args:
+            arrow_schema: The schema of the table to build.
+            chunk_size: Number of records to buffer before converting them to Arrow.
+        """
+        self.arrow_schema = arrow_schema
+        self.chunk_size = chunk_size
+        self._chunk: list[dict[str, t.Any]] = []
+        self._batches: list[pa.RecordBatch] = []
+        self._num_rows = 0
+
+    def __len__(self) -> int:
+        """Get the number of records appended so far.
+
+        Returns:
+            The number of records.
+        """
+        return self._num_rows
+
+    def append(self, record: dict[str, t.Any]) -> None:
+        """Append a record to the current chunk.
+
+        Args:
+            record: The record to append.
+        """
+        self._chunk.append(record)
+        self._num_rows += 1
+        if len(self._chunk) >= self.chunk_size:
+            self._flush()
+
+    def finish(self) -> pa.Table:
+        """Build a table with all the appended records.
+
+        Returns:
+            The Arrow table.
+        """
+        self._flush()
+        return pa.Table.from_batches(self._batches, schema=self.arrow_schema)
+
+    def _flush(self) -> None:
+        if not self._chunk:
+            return
+        chunk, schema = self._chunk, self.arrow_schema
+        arrays = [
+            # Bind the field name once, reading it from the field is comparatively slow
+            _to_arrow_array([record.get(name) for record in chunk], field.type, name)
+            for name, field in zip(schema.names, schema, strict=True)
+        ]
+        self._batches.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        self._chunk = []
@@ -0,0 +1,408 @@
+"""Helpers for syncing streams from several threads."""
+
+from __future__ import annotations
+
+import copy
+import queue
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from singer_sdk.helpers._state import StateWriter
+from singer_sdk.singerlib.encoding.base import GenericSingerWriter
+
+if t.TYPE_CHECKING:
+    import datetime
+    import sys
+    from collections.abc import Callable, Iterable, Iterator
+
+    from singer_sdk.helpers import types
+    from singer_sdk.pagination import BaseAPIPaginator
+
+    if sys.version_info >= (3, 11):
+        from typing import Self  # noqa: ICN003
+    else:
+        from typing_extensions import Self
+
+_RECORD = "RECORD"
+_MESSAGE = "MESSAGE"
+_STATE = "STATE"
+_DONE = object()
+
+_T = t.TypeVar("_T")
+_R = t.TypeVar("_R")
+_H = t.TypeVar("_H")
+
+
+class MessageSerializer:
+    """Write the messages of streams synced from several threads, in a single thread.
+
+    Streams write to :attr:`message_writer` and :attr:`state_writer`, which put the
+    messages on a bounded queue. A serializer thread takes them off the queue, in
+    order, and writes them with the tap's message writer. Messages of each stream keep
+    their order and only the serializer thread writes to the output.
+
+    Each thread claims the streams it syncs. When a thread writes a STATE message, only
+    the bookmarks of its own streams are copied, after its records were queued. The
+    serializer merges them into the state it emits, so a STATE message never covers
+    records that have not been written yet.
+    """
+
+    def __init__(
+        self,
+        message_writer: GenericSingerWriter,
+        state_writer: StateWriter,
+        state: types.TapState,
+        *,
+        max_queue_size: int = 10_000,
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            message_writer: The writer for the tap output.
+            state_writer: The state writer for the tap output.
+            state: The tap state at the start of the sync.
+            max_queue_size: Number of messages threads can queue before they block.
+        """
+        self._message_writer = message_writer
+        self._state_writer = state_writer
+        self._state = copy.deepcopy(state)
+        self._queue: queue.Queue[t.Any] = queue.Queue(maxsize=max_queue_size)
+        self._local = threading.local()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name="singer-serializer",
+            daemon=True,
+        )
+        self.message_writer = _QueuedMessageWriter(self)
+        self.state_writer = _QueuedStateWriter(self)
+
+    def __enter__(self) -> Self:
+        """Start the serializer thread.
+
+        Returns:
+            The serializer.
+        """
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Write out the queued messages and stop the serializer thread.
+
+        Args:
+            args: Exception info, if any.
+
+        Raises:
+            BaseException: The error raised while writing a message, if any.
+        """
+        self._queue.put(_DONE)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    @contextmanager
+    def claim_streams(self, stream_names: Iterable[str]) -> Iterator[None]:
+        """Mark the given streams as synced by the current thread.
+
+        Args:
+            stream_names: Names of the streams.
+
+        Yields:
+            Nothing.
+        """
+        self._local.stream_names = frozenset(stream_names)
+        try:
+            yield
+        finally:
+            del self._local.stream_names
+
+    def put(self, kind: str, payload: t.Any) -> None:  # noqa: ANN401
+        """Queue a message to be written.
+
+        Args:
+            kind: The kind of message.
+            payload: The message data.
+
+        Raises:
+            BaseException: The error raised while writing an earlier message, if any.
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put((kind, payload))
+
+    def put_state(self, state: types.TapState) -> None:
+        """Queue the bookmarks of the streams synced by the current thread.
+
+        Args:
+            state: The tap state.
+        """
+        bookmarks = state.get("bookmarks", {})
+        stream_names = getattr(self._local, "stream_names", None)
+        if stream_names is None:
+            stream_names = list(bookmarks)
+        self.put(
+            _STATE,
+            {
+                name: copy.deepcopy(bookmarks[name])
+                for name in stream_names
+                if name in bookmarks
+            },
+        )
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not _DONE:
+            if self._error is not None:
+                # Keep draining the queue so that producers don't block
+                continue
+            try:
+                self._write(*item)
+            except BaseException as e:  # noqa: BLE001
+                self._error = e
+
+    def _write(self, kind: str, payload: t.Any) -> None:  # noqa: ANN401
+        if kind == _RECORD:
+            stream, record, version, time_extracted = payload
+            self._message_writer.write_record(
+                stream,
+                record,
+                version=version,
+                time_extracted=time_extracted,
+            )
+        elif kind == _STATE:
+            self._state.setdefault("bookmarks", {}).update(payload)
+            self._state_writer.write_state(self._state)
+        else:
+            self._message_writer.write_message(payload)
+
+
+class _QueuedMessageWriter(GenericSingerWriter):
+    """A message writer that hands messages over to a serializer thread."""
+
+    def __init__(self, serializer: MessageSerializer) -> None:
+        super().__init__()
+        self._serializer = serializer
+
+    def serialize_message(self, message: t.Any) -> t.Any:  # noqa: ANN401
+        return self._serializer._message_writer.serialize_message(message)  # noqa: SLF001
+
+    def write_message(self, message: t.Any) -> None:  # noqa: ANN401
+        self._serializer.put(_MESSAGE, message)
+
+    def write_record(
+        self,
+        stream: str,
+        record: dict[str, t.Any],
+        *,
+        version: int | None = None,
+        time_extracted: datetime.datetime | None = None,
+    ) -> None:
+        self._serializer.put(_RECORD, (stream, record, version, time_extracted))
+
+    def flush(self) -> None:
+        """Do nothing, the tap flushes its output once the sync completes."""
+
+
+class _QueuedStateWriter(StateWriter):
+    """A state writer that hands state over to a serializer thread."""
+
+    def __init__(self, serializer: MessageSerializer) -> None:
+        super().__init__(serializer.message_writer)
+        self._serializer = serializer
+
+    def write_state(self, state: types.TapState) -> None:
+        self._serializer.put_state(state)
+
+
+@dataclass(frozen=True)
+class _Failure:
+    """An error raised while producing the items of a buffer."""
+
+    error: BaseException
+
+
+class _ItemBuffer(t.Generic[_R]):
+    """A bounded queue of items, filled by a worker thread and read by another."""
+
+    def __init__(self, maxsize: int, stop: threading.Event) -> None:
+        self._queue: queue.Queue[t.Any] = queue.Queue(maxsize=maxsize)
+        self._stop = stop
+
+    def fill(self, items: Callable[[], Iterable[_R]]) -> None:
+        """Put the items on the queue, followed by a sentinel or the error raised.
+
+        Args:
+            items: Function that returns the items.
+        """
+        try:
+            for item in items():
+                if not self._put(item):
+                    return
+        except BaseException as e:  # noqa: BLE001
+            self._put(_Failure(e))
+        else:
+            self._put(_DONE)
+
+    def __iter__(self) -> Iterator[_R]:
+        """Get the items, as they are produced.
+
+        Yields:
+            Each item.
+
+        Raises:
+            BaseException: The error raised while producing the items.
+        """
+        while (item := self._queue.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+
+    def _put(self, item: t.Any) -> bool:  # noqa: ANN401
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+
+class OrderedPrefetcher(t.Generic[_T, _R]):
+    """Produce the results of items in worker threads and hand them back in order.
+
+    The results of each item are put on a bounded buffer, so at most ``buffer_size``
+    results per item are held in memory. At most ``max_pending`` items are submitted
+    and not handed back at a time. Once that limit is reached, submitting another item
+    hands back the oldest one, whose results can be iterated over while they are
+    produced.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[_T], Iterable[_R]],
+        *,
+        max_workers: int,
+        max_pending: int,
+        buffer_size: int,
+        thread_name_prefix: str = "",
+    ) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            fn: The function that produces the results of an item.
+            max_workers: Number of worker threads.
+            max_pending: Number of items to hold before submitting hands them back.
+            buffer_size: Number of results of an item to hold before its worker
+                blocks.
+            thread_name_prefix: Prefix for the names of the worker threads.
+        """
+        self._fn = fn
+        self.max_pending = max_pending
+        self.buffer_size = buffer_size
+        self._stop = threading.Event()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+        )
+        self._pending: deque[tuple[_T, _ItemBuffer[_R]]] = deque()
+
+    def __len__(self) -> int:
+        """Get the number of pending items.
+
+        Returns:
+            The number of items submitted and not handed back yet.
+        """
+        return len(self._pending)
+
+    def submit(self, item: _T) -> list[tuple[_T, Iterable[_R]]]:
+        """Submit an item.
+
+        Args:
+            item: The item to produce the results of.
+
+        Returns:
+            The oldest items and their results, if too many items are pending.
+        """
+        buffer: _ItemBuffer[_R] = _ItemBuffer(self.buffer_size, self._stop)
+        self._executor.submit(buffer.fill, lambda: self._fn(item))
+        self._pending.append((item, buffer))
+        return [
+            self._pending.popleft()
+            for _ in range(len(self._pending) - self.max_pending)
+        ]
+
+    def drain(self) -> Iterator[tuple[_T, Iterable[_R]]]:
+        """Hand back all pending items.
+
+        Yields:
+            Each pending item and its results, in the order they were submitted.
+        """
+        while self._pending:
+            yield self._pending.popleft()
+
+    def close(self) -> None:
+        """Stop producing results and stop the worker threads."""
+        self._stop.set()
+        self._pending.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class PagePrefetcher(t.Generic[_H]):
+    """Send the requests of the pages a paginator predicts, ahead of time.
+
+    Requests are sent through ``submit``, which returns a handle such as a future or a
+    task. Once the paginator advances, the predicted token is checked against it, and
+    the requests sent ahead are discarded if they differ.
+    """
+
+    def __init__(
+        self,
+        paginator: BaseAPIPaginator,
+        submit: Callable[[t.Any], _H],
+        cancel: Callable[[_H], object],
+        *,
+        max_in_flight: int,
+    ) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            paginator: The paginator, advanced by the caller after each response.
+            submit: Function that sends the request of a page token.
+            cancel: Function that discards the request of a page token.
+            max_in_flight: Number of requests sent and not handed back at a time.
+        """
+        self.paginator = paginator
+        self.max_in_flight = max(max_in_flight, 1)
+        self._submit = submit
+        self._cancel = cancel
+        self._in_flight: deque[tuple[t.Any, _H]] = deque()
+
+    def next(self) -> _H:
+        """Get the request of the current page, and send the following ones ahead.
+
+        Returns:
+            The handle of the request of the current page of the paginator.
+        """
+        token = self.paginator.current_value
+        in_flight = self._in_flight
+        if not in_flight or in_flight[0][0] != token:
+            # The paginator did not follow the predicted tokens
+            self.discard()
+            in_flight.append((token, self._submit(token)))
+
+        next_token = in_flight[-1][0]
+        while len(in_flight) < self.max_in_flight and (
+            (next_token := self.paginator.predict_next(next_token)) is not None
+        ):
+            in_flight.append((next_token, self._submit(next_token)))
+
+        return in_flight.popleft()[1]
+
+    def discard(self) -> None:
+        """Discard the requests sent ahead."""
+        for _, handle in self._in_flight:
+            self._cancel(handle)
+        self._in_flight.clear()
@@ -0,0 +1,255 @@
+"""On-disk cache of HTTP responses, revalidated with conditional requests."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing as t
+import zlib
+from dataclasses import dataclass
+from http import HTTPStatus
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+DEFAULT_MAX_SIZE_BYTES = 100 * 1024 * 1024
+
+# Headers that describe the stored body rather than the resource
+_BODY_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response stored in the cache."""
+
+    key: str
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server to only send the response if it changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def replay(self, not_modified: requests.Response) -> requests.Response:
+        """Build a full response from a ``304 Not Modified`` response.
+
+        Args:
+            not_modified: The response to the conditional request.
+
+        Returns:
+            A ``200 OK`` response with the cached body, and the cached headers updated
+            with those of the new response.
+        """
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.headers.update(
+            (name, value)
+            for name, value in not_modified.headers.items()
+            if name.lower() not in _BODY_HEADERS
+        )
+        response._content = self.body  # noqa: SLF001
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+
+class ResponseCache:
+    """An on-disk cache of HTTP responses, with least recently used eviction.
+
+    Responses with an ``ETag`` or ``Last-Modified`` header are stored in a SQLite
+    database, with their body compressed. Requests for a cached response are sent with
+    ``If-None-Match`` and ``If-Modified-Since`` headers, and a ``304 Not Modified``
+    response is replaced with the cached one.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ) -> None:
+        """Create a new response cache.
+
+        Args:
+            path: Path of the cache database file.
+            max_size_bytes: Maximum size of the compressed responses held in the cache.
+        """
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.hits: collections.Counter[str] = collections.Counter()
+        self.misses: collections.Counter[str] = collections.Counter()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, t.Any], tap_name: str) -> ResponseCache:
+        """Create a response cache from the ``http_cache`` setting of a tap.
+
+        Args:
+            config: The value of the setting.
+            tap_name: Name of the tap, for the default cache path.
+
+        Returns:
+            A response cache.
+        """
+        return cls(
+            config.get("path") or f"{tap_name}-http-cache.sqlite",
+            max_size_bytes=config.get("max_size_bytes") or DEFAULT_MAX_SIZE_BYTES,
+        )
+
+    def count(self, stream: str, *, hit: bool) -> None:
+        """Count a cache hit or miss.
+
+        Args:
+            stream: Name of the stream that sent the request.
+            hit: Whether the cached response was used.
+        """
+        with self._lock:
+            (self.hits if hit else self.misses)[stream] += 1
+
+    @staticmethod
+    def key(request: requests.PreparedRequest) -> str:
+        """Get the cache key of a request.
+
+        Args:
+            request: The request.
+
+        Returns:
+            A hash of the method, URL and body of the request.
+        """
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        digest = hashlib.sha256()
+        digest.update(f"{request.method} {request.url}\n".encode())
+        digest.update(body)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            The cached response, if any.
+        """
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, headers, body FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        etag, last_modified, headers, body = row
+        return CachedResponse(
+            key=key,
+            etag=etag,
+            last_modified=last_modified,
+            headers=json.loads(headers),
+            body=zlib.decompress(body),
+        )
+
+    def put(self, key: str, response: requests.Response) -> bool:
+        """Store a response, if the server can tell whether it changed.
+
+        Args:
+            key: The cache key of the request.
+            response: A successful response.
+
+        Returns:
+            True if the response was stored.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != HTTPStatus.OK or not (etag or last_modified):
+            return False
+
+        body = zlib.compress(response.content)
+        if len(body) > self.max_size_bytes:
+            return False
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _BODY_HEADERS
+        }
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    etag,
+                    last_modified,
+                    json.dumps(headers),
+                    body,
+                    len(body),
+                    time.time(),
+                ),
+            )
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Delete the least recently used responses until the cache fits its size."""
+        (size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if size <= self.max_size_bytes:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        )
+        evicted = []
+        for key, entry_size in rows:
+            if size <= self.max_size_bytes:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
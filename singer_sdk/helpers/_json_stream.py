@@ -0,0 +1,185 @@
+"""Incremental parsing of large JSON documents."""
+
+from __future__ import annotations
+
+import codecs
+import decimal
+import json
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class _JSONReader:
+    """Decode JSON values from chunks of text, reading more chunks as needed."""
+
+    def __init__(self, chunks: Iterable[bytes | str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder(parse_float=decimal.Decimal)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer.
+
+        Returns:
+            False if there are no chunks left.
+        """
+        for chunk in self._chunks:
+            text = chunk if isinstance(chunk, str) else self._text_decoder.decode(chunk)
+            if text:
+                if self._pos > _COMPACT_THRESHOLD:
+                    # Drop the text already parsed
+                    self._buffer = self._buffer[self._pos :]
+                    self._pos = 0
+                self._buffer += text
+                return True
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and get the next character, without consuming it.
+
+        Returns:
+            The next character, or an empty string at the end of the document.
+        """
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._read():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next character.
+
+        Args:
+            char: The expected character.
+
+        Raises:
+            ValueError: If the next character is a different one.
+        """
+        if (found := self.peek()) != char:
+            msg = f"Expected {char!r} at position {self._pos}, found {found!r}"
+            raise ValueError(msg)
+        self._pos += 1
+
+    def find_key(self, key: str) -> bool:
+        """Move to the value of a key in the next object.
+
+        Args:
+            key: The key to find.
+
+        Returns:
+            False if the next value is not an object or does not have the key.
+        """
+        if self.peek() != "{":
+            return False
+        self.expect("{")
+        while self.peek() != "}":
+            found = self.value() == key
+            self.expect(":")
+            if found:
+                return True
+            self.value()
+            if self.peek() != ",":
+                return False
+            self.expect(",")
+        return False
+
+    def _may_continue(self, end: int) -> bool:
+        """Check whether the text after a decoded value could still be part of it.
+
+        Args:
+            end: Position after the decoded value.
+
+        Returns:
+            True if the buffer has only number characters after the value.
+        """
+        buffer = self._buffer
+        while end < len(buffer):
+            if buffer[end] not in _NUMBER_CHARS:
+                return False
+            end += 1
+        return True
+
+    def value(self) -> t.Any:  # noqa: ANN401
+        """Decode the next value.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the value is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Read at least as much text again, so that a large value is not
+                # decoded over and over for each new chunk
+                pending = len(self._buffer) - self._pos
+                while self._read() and len(self._buffer) - self._pos < 2 * pending:
+                    pass
+                if not self._eof or len(self._buffer) - self._pos > pending:
+                    continue
+                raise
+
+            # A number may continue in the next chunk if only characters that can
+            # be part of it follow, e.g. the buffer ends with "0." or "1e"
+            if not self._eof and self._may_continue(end) and self._read():
+                continue
+
+            self._pos = end
+            return value
+
+
+def iter_json_items(
+    chunks: Iterable[bytes | str],
+    keys: t.Sequence[str],
+) -> Iterator[t.Any]:
+    """Iterate over the items of an array in a JSON document, as they are parsed.
+
+    Only the current item is held in memory, along with the chunk being parsed. This
+    matches the JSONPath expression ``$.key1.key2[*]``: nothing is returned if a key is
+    missing or ``null``, and any other value that is not an array is returned as a
+    single item.
+
+    Args:
+        chunks: The JSON document, in chunks of UTF-8 bytes or text.
+        keys: Keys of the nested objects that lead to the array.
+
+    Yields:
+        Each item of the array.
+    """
+    reader = _JSONReader(chunks)
+
+    for key in keys:
+        if not reader.find_key(key):
+            return
+
+    if reader.peek() != "[":
+        if (value := reader.value()) is not None:
+            yield value
+        return
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() != ",":
+            reader.expect("]")
+            return
+        reader.expect(",")
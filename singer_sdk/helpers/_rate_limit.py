@@ -0,0 +1,361 @@
+"""Rate limiting of HTTP requests."""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    import requests
+
+# X-RateLimit-Reset values above this are Unix timestamps rather than delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class TokenBucket:
+    """A token bucket that spaces out requests.
+
+    Requests reserve a token and wait until it is available, so concurrent callers are
+    served in the order they reserved. A bucket without a rate only delays requests
+    while it is paused or paced.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a new token bucket.
+
+        Args:
+            rate: Number of tokens added per second, or None for no limit.
+            burst: Maximum number of tokens held by the bucket.
+            clock: A monotonic clock, in seconds.
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._paced_rate: float | None = None
+        self._paced_until = 0.0
+
+    def _current_rate(self, now: float) -> float | None:
+        if self._paced_rate is None or now >= self._paced_until:
+            return self.rate
+        if self.rate is None:
+            return self._paced_rate
+        return min(self.rate, self._paced_rate)
+
+    def reserve(self) -> float:
+        """Take a token from the bucket.
+
+        Returns:
+            The number of seconds to wait before the token can be used.
+        """
+        with self._lock:
+            now = self._clock()
+            delay = max(self._paused_until - now, 0.0)
+            rate = self._current_rate(now)
+            if rate is None:
+                return delay
+
+            self._tokens = min(
+                self._tokens + (now - self._updated) * rate,
+                float(self.burst),
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                delay = max(delay, -self._tokens / rate)
+            return delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for a while.
+
+        Args:
+            seconds: Number of seconds to pause for.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def pace(self, remaining: int, seconds: float) -> None:
+        """Spread the requests left in a quota window until the window resets.
+
+        Args:
+            remaining: Number of requests left in the window.
+            seconds: Number of seconds until the window resets.
+        """
+        if remaining <= 0:
+            self.pause(seconds)
+            return
+
+        if seconds <= 0:
+            return
+
+        with self._lock:
+            self._paced_rate = remaining / seconds
+            self._paced_until = self._clock() + seconds
+
+
+class AdaptiveConcurrency:
+    """A limit on the requests in flight, adjusted to the responses.
+
+    The limit grows by one request once a full limit's worth of requests succeeded,
+    and is halved when a request is throttled (additive increase, multiplicative
+    decrease).
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1) -> None:
+        """Create a new concurrency limit.
+
+        Args:
+            max_limit: The maximum and initial number of requests in flight.
+            min_limit: The minimum number of requests in flight.
+        """
+        self.max_limit = max(max_limit, 1)
+        self.min_limit = max(min(min_limit, self.max_limit), 1)
+        self._limit = float(self.max_limit)
+        self._in_flight = 0
+        # The first throttled request always halves the limit
+        self._since_decrease = self.max_limit
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """Claim a request slot if one is free.
+
+        Returns:
+            True if the request can be sent.
+        """
+        with self._condition:
+            if self._in_flight >= self.limit:
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """Free the slot of a request that completed."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def update(self, *, throttled: bool) -> int | None:
+        """Adjust the limit after a response.
+
+        Args:
+            throttled: Whether the request was throttled by the server.
+
+        Returns:
+            The new limit, if it changed.
+        """
+        with self._condition:
+            previous = self.limit
+            self._since_decrease += 1
+            if not throttled:
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+            elif self._since_decrease >= previous:
+                # Only back off once for the requests that were already in flight
+                self._limit = max(self._limit / 2, self.min_limit)
+                self._since_decrease = 0
+
+            if self.limit == previous:
+                return None
+            self._condition.notify_all()
+            return self.limit
+
+
+def _parse_seconds(value: str | None, now: float) -> float | None:
+    """Parse a delay from a rate limit header.
+
+    Args:
+        value: A number of seconds, a Unix timestamp or an HTTP date.
+        now: The current Unix time.
+
+    Returns:
+        The number of seconds, or None if the value is missing or invalid.
+    """
+    if value is None:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            return parsedate_to_datetime(value).timestamp() - now
+        except (TypeError, ValueError):
+            return None
+
+    return seconds - now if seconds > _EPOCH_THRESHOLD else seconds
+
+
+class RateLimiter:
+    """Pace the HTTP requests of the streams of a tap.
+
+    Requests wait for a token from the bucket of their endpoint, or from the default
+    bucket for endpoints without their own limit. Rate limit headers of the responses
+    pause or pace the bucket they came from:
+
+    - ``Retry-After`` pauses requests for the given delay.
+    - ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset``, or ``RateLimit-Remaining``
+      and ``RateLimit-Reset``, spread the remaining requests until the quota resets.
+
+    If ``max_concurrent_requests`` is set, the number of requests in flight is also
+    adapted to the responses, see :class:`AdaptiveConcurrency`.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        *,
+        max_concurrent_requests: int | None = None,
+        endpoints: Mapping[str, Mapping[str, t.Any]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a new rate limiter.
+
+        Args:
+            requests_per_second: Default number of requests per second, if limited.
+            burst: Default number of requests that can be sent at once.
+            max_concurrent_requests: Maximum number of requests in flight, if limited.
+            endpoints: ``requests_per_second`` and ``burst`` overrides, by endpoint.
+            clock: A monotonic clock, in seconds.
+        """
+        self.default_bucket = TokenBucket(requests_per_second, burst, clock=clock)
+        self.endpoint_buckets = {
+            endpoint: TokenBucket(
+                limits.get("requests_per_second"),
+                limits.get("burst") or 1,
+                clock=clock,
+            )
+            for endpoint, limits in (endpoints or {}).items()
+        }
+        self.concurrency = (
+            AdaptiveConcurrency(max_concurrent_requests)
+            if max_concurrent_requests
+            else None
+        )
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, t.Any]) -> RateLimiter:
+        """Create a rate limiter from the ``rate_limit`` setting of a tap.
+
+        Args:
+            config: The value of the setting.
+
+        Returns:
+            A rate limiter.
+        """
+        return cls(
+            config.get("requests_per_second"),
+            config.get("burst") or 1,
+            max_concurrent_requests=config.get("max_concurrent_requests"),
+            endpoints=config.get("endpoints"),
+        )
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Get the token bucket of an endpoint.
+
+        Args:
+            endpoint: The endpoint of the request.
+
+        Returns:
+            The bucket of the endpoint, or the default one.
+        """
+        return self.endpoint_buckets.get(endpoint, self.default_bucket)
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve a request to an endpoint.
+
+        Args:
+            endpoint: The endpoint of the request.
+
+        Returns:
+            The number of seconds to wait before the request can be sent.
+        """
+        return self.bucket(endpoint).reserve()
+
+    def acquire(self, endpoint: str) -> float:
+        """Wait until a request to an endpoint can be sent.
+
+        :meth:`release` must be called once the request completes.
+
+        Args:
+            endpoint: The endpoint of the request.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        waited = 0.0
+        if self.concurrency and not self.concurrency.try_acquire():
+            start = time.perf_counter()
+            self.concurrency.acquire()
+            waited = time.perf_counter() - start
+        if (delay := self.reserve(endpoint)) > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    def release(self) -> None:
+        """Free the concurrency slot of a completed request."""
+        if self.concurrency:
+            self.concurrency.release()
+
+    def update(self, endpoint: str, response: requests.Response) -> int | None:
+        """Adapt to the rate limit headers and status of a response.
+
+        Args:
+            endpoint: The endpoint of the request.
+            response: The response.
+
+        Returns:
+            The new concurrency limit, if it changed.
+        """
+        bucket = self.bucket(endpoint)
+        headers = response.headers
+        now = time.time()
+
+        retry_after = _parse_seconds(headers.get("Retry-After"), now)
+        if retry_after is not None and retry_after > 0:
+            bucket.pause(retry_after)
+
+        remaining = headers.get(
+            "X-RateLimit-Remaining", headers.get("RateLimit-Remaining")
+        )
+        reset = _parse_seconds(
+            headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset")),
+            now,
+        )
+        if remaining is not None and reset is not None:
+            with contextlib.suppress(ValueError):
+                bucket.pace(int(float(remaining)), reset)
+
+        if self.concurrency is None:
+            return None
+
+        throttled = response.status_code == HTTPStatus.TOO_MANY_REQUESTS or (
+            response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            and retry_after is not None
+        )
+        return self.concurrency.update(throttled=throttled)
@@ -0,0 +1,97 @@
+"""In-memory cache of the metadata reflected from database tables."""
+
+from __future__ import annotations
+
+import collections
+import threading
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = t.TypeVar("_T")
+
+
+class ReflectionCache:
+    """A cache of table metadata, such as whether a table exists and its columns.
+
+    Entries are grouped by table, so that all the metadata of a table can be
+    forgotten at once after the table changes. Entries older than ``ttl`` seconds are
+    reflected again.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a new reflection cache.
+
+        Args:
+            ttl: Number of seconds entries are valid for, or `None` to keep them until
+                they are invalidated.
+            clock: Function that returns the current time, in seconds.
+        """
+        self.ttl = ttl
+        self.hits: collections.Counter[str] = collections.Counter()
+        self.misses: collections.Counter[str] = collections.Counter()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, tuple[float, t.Any]]] = {}
+
+    def get(self, table: str, kind: str, load: Callable[[], _T]) -> _T:
+        """Get an entry, or load and store it if it is missing or expired.
+
+        Args:
+            table: Fully qualified name of the table.
+            kind: Kind of metadata, for example ``"columns"``.
+            load: Function that reflects the metadata from the database.
+
+        Returns:
+            The metadata.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(table, {}).get(kind)
+            if entry is not None and (self.ttl is None or now - entry[0] < self.ttl):
+                self.hits[table] += 1
+                return entry[1]  # type: ignore[no-any-return]
+            self.misses[table] += 1
+
+        value = load()
+        self.put(table, kind, value, loaded_at=now)
+        return value
+
+    def put(
+        self,
+        table: str,
+        kind: str,
+        value: t.Any,  # noqa: ANN401
+        *,
+        loaded_at: float | None = None,
+    ) -> None:
+        """Store an entry.
+
+        Args:
+            table: Fully qualified name of the table.
+            kind: Kind of metadata, for example ``"columns"``.
+            value: The metadata.
+            loaded_at: Time the metadata was reflected at, by default the current time.
+        """
+        if loaded_at is None:
+            loaded_at = self._clock()
+        with self._lock:
+            self._entries.setdefault(table, {})[kind] = (loaded_at, value)
+
+    def invalidate(self, table: str | None = None) -> None:
+        """Forget the entries of a table, or of all tables.
+
+        Args:
+            table: Fully qualified name of the table, or `None` for all tables.
+        """
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(table, None)
@@ -0,0 +1,154 @@
+"""Shared HTTP sessions."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+def _session_key(url: str) -> str:
+    """Get the scheme and host of a URL.
+
+    Args:
+        url: A URL.
+
+    Returns:
+        The URL without its path.
+    """
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+class SessionRegistry:
+    """HTTP sessions shared by the streams of a tap, by base URL.
+
+    Streams with the same scheme and host in their ``url_base`` share a session, and
+    so a pool of connections that are kept alive between their requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = 0,
+        compression: bool = True,
+    ) -> None:
+        """Create a new session registry.
+
+        Args:
+            pool_connections: Number of hosts to keep connection pools for, in each
+                session.
+            pool_maxsize: Number of connections to keep alive for each host.
+            max_retries: Number of times to retry requests that fail to connect.
+            compression: Whether to accept compressed responses.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.compression = compression
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, t.Any]) -> SessionRegistry:
+        """Create a session registry from the ``http_session`` setting of a tap.
+
+        Args:
+            config: The value of the setting.
+
+        Returns:
+            A session registry.
+        """
+        return cls(
+            pool_connections=config.get("pool_connections") or DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=config.get("pool_maxsize") or DEFAULT_POOL_MAXSIZE,
+            max_retries=config.get("max_retries") or 0,
+            compression=config.get("compression", True),
+        )
+
+    def get(self, url: str) -> requests.Session:
+        """Get the session for a URL, creating it if needed.
+
+        Args:
+            url: The base URL of a stream.
+
+        Returns:
+            The session shared by the streams with the same scheme and host.
+        """
+        key = _session_key(url)
+        with self._lock:
+            if (session := self._sessions.get(key)) is None:
+                session = self._sessions[key] = self._new_session()
+            return session
+
+    def _new_session(self) -> requests.Session:
+        """Create a session with the configured connection pools.
+
+        Returns:
+            A new session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            # Only retry connection errors: the request was not sent yet, and other
+            # errors are retried by the stream's backoff
+            max_retries=Retry(
+                total=self.max_retries,
+                connect=self.max_retries,
+                read=0,
+                status=0,
+                other=0,
+                redirect=None,
+                backoff_factor=0.1,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.compression:
+            session.headers["Accept-Encoding"] = "identity"
+        return session
+
+    def connection_counts(self) -> dict[str, tuple[int, int]]:
+        """Count the connections opened, and requests sent, by each session.
+
+        Only the connection pools still held by the sessions are counted.
+
+        Returns:
+            The number of connections and requests, by base URL.
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        counts = {}
+        for key, session in sessions.items():
+            connections = requests_sent = 0
+            # The same adapter is mounted for both schemes
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools  # type: ignore[attr-defined]
+                for pool_key in pools.keys():  # noqa: SIM118
+                    if (pool := pools.get(pool_key)) is not None:
+                        connections += pool.num_connections
+                        requests_sent += pool.num_requests
+            counts[key] = (connections, requests_sent)
+        return counts
+
+    def close(self) -> None:
+        """Close all sessions."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
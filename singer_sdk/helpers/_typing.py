@@ -549,3 +549,155 @@ def _conform_primitive_property(  # noqa: PLR0911
     if _is_exclusive_boolean_type(property_schema):
         return None if elem is None else elem != 0
     return elem
+
+
+_PASSTHROUGH_TYPES = frozenset((str, int, bool, type(None)))
+_ObjectConformer: t.TypeAlias = t.Callable[[dict, list], dict]
+_ValueConformer: t.TypeAlias = t.Callable[[t.Any, list], t.Any]
+
+
+class RecordConformer:
+    """Translate record values to singer-compatible data types for a given schema.
+
+    The schema is compiled once into a plan of per-property converters, so conforming
+    a record does not need to walk the schema again. Properties whose values are
+    already JSON-compatible are passed through without any conversion.
+
+    Any property names not found in the schema catalog are removed and returned as
+    unmapped properties, as in `conform_record_data_types`.
+    """
+
+    def __init__(self, schema: dict, level: TypeConformanceLevel) -> None:
+        """Compile the conformance plan.
+
+        Args:
+            schema: JSON schema the records are expected to meet.
+            level: Specifies how recursive the conformance process should be.
+        """
+        self.schema = schema
+        self.level = level
+        self._conform_object: _ObjectConformer | None = (
+            None
+            if level == TypeConformanceLevel.NONE
+            else _compile_object_conformer(schema, level, None)
+        )
+
+    def conform(self, record: dict[str, t.Any]) -> tuple[dict[str, t.Any], list[str]]:
+        """Translate values in a record to singer-compatible data types.
+
+        Args:
+            record: A single record.
+
+        Returns:
+            The conformed record and the paths of any unmapped properties.
+        """
+        unmapped_properties: list[str] = []
+        if self._conform_object is None:
+            return record, unmapped_properties
+        return self._conform_object(record, unmapped_properties), unmapped_properties
+
+
+def _compile_object_conformer(
+    schema: dict,
+    level: TypeConformanceLevel,
+    parent: str | None,
+) -> _ObjectConformer:
+    properties: dict[str, dict] = schema.get("properties", {})
+    additional_properties = bool(schema.get("additionalProperties"))
+    converters = {
+        property_name: _compile_property_conformer(
+            property_schema,
+            level,
+            property_name if parent is None else f"{parent}.{property_name}",
+        )
+        for property_name, property_schema in properties.items()
+    }
+
+    def conform_object(
+        input_object: dict[str, t.Any],
+        unmapped_properties: list[str],
+    ) -> dict[str, t.Any]:
+        output_object: dict[str, t.Any] = {}
+        for property_name, elem in input_object.items():
+            converter = converters.get(property_name)
+            if converter is not None:
+                output_object[property_name] = converter(elem, unmapped_properties)
+            elif additional_properties:
+                output_object[property_name] = elem
+            else:
+                unmapped_properties.append(
+                    property_name if parent is None else f"{parent}.{property_name}",
+                )
+        return output_object
+
+    return conform_object
+
+
+def _compile_property_conformer(
+    property_schema: dict,
+    level: TypeConformanceLevel,
+    path: str,
+) -> _ValueConformer:
+    passthrough_types = (
+        frozenset()
+        if _is_exclusive_boolean_type(property_schema)
+        else _PASSTHROUGH_TYPES
+    )
+    try:
+        uniform_list = is_uniform_list(property_schema)
+    except (EmptySchemaTypeError, ValueError):
+        # Only fail if a list value is actually found for this property
+        uniform_list = None
+
+    conform_list: _ValueConformer | None = None
+    if uniform_list and level == TypeConformanceLevel.RECURSIVE:
+        conform_list = _compile_list_conformer(property_schema["items"], level, path)
+
+    is_object = (
+        bool(is_object_type(property_schema)) and "properties" in property_schema
+    )
+    conform_object: _ObjectConformer | None = None
+    if is_object and level == TypeConformanceLevel.RECURSIVE:
+        conform_object = _compile_object_conformer(property_schema, level, path)
+
+    def conform_property(elem: t.Any, unmapped_properties: list[str]) -> t.Any:  # noqa: ANN401
+        if type(elem) in passthrough_types:
+            return elem
+        if isinstance(elem, list) and (
+            uniform_list or (uniform_list is None and is_uniform_list(property_schema))
+        ):
+            if conform_list is None:
+                return elem
+            return conform_list(elem, unmapped_properties)
+        if isinstance(elem, dict) and is_object:
+            if conform_object is None:
+                return elem
+            return conform_object(elem, unmapped_properties)
+        return _conform_primitive_property(elem, property_schema)
+
+    return conform_property
+
+
+def _compile_list_conformer(
+    item_schema: dict,
+    level: TypeConformanceLevel,
+    path: str,
+) -> _ValueConformer:
+    passthrough_types = (
+        frozenset() if _is_exclusive_boolean_type(item_schema) else _PASSTHROUGH_TYPES
+    )
+    conform_object: _ObjectConformer | None = None
+    if is_object_type(item_schema) and "properties" in item_schema:
+        conform_object = _compile_object_conformer(item_schema, level, path)
+
+    def conform_item(item: t.Any, unmapped_properties: list[str]) -> t.Any:  # noqa: ANN401
+        if type(item) in passthrough_types:
+            return item
+        if conform_object is not None and isinstance(item, dict):
+            return conform_object(item, unmapped_properties)
+        return _conform_primitive_property(item, item_schema)
+
+    def conform_list(element: list, unmapped_properties: list[str]) -> list:
+        return [conform_item(item, unmapped_properties) for item in element]
+
+    return conform_list
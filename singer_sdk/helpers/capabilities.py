@@ -211,6 +211,147 @@ BATCH_CONFIG = PropertiesList(
         ),
     ),
 ).to_dict()
+TAP_MAX_PARALLEL_STREAMS_CONFIG = PropertiesList(
+    Property(
+        "max_parallel_streams",
+        IntegerType,
+        title="Max Parallel Streams",
+        description=(
+            "Maximum number of top-level streams to sync at the same time. Child "
+            "streams are synced along with their parent. Streams are synced one at a "
+            "time by default."
+        ),
+    ),
+).to_dict()
+TAP_RATE_LIMIT_CONFIG = PropertiesList(
+    Property(
+        "rate_limit",
+        ObjectType(
+            Property(
+                "requests_per_second",
+                DecimalType,
+                title="Requests per Second",
+                description="Maximum number of HTTP requests per second.",
+            ),
+            Property(
+                "burst",
+                IntegerType,
+                title="Burst",
+                description=(
+                    "Number of requests that can be sent at once. Defaults to 1."
+                ),
+            ),
+            Property(
+                "max_concurrent_requests",
+                IntegerType,
+                title="Max Concurrent Requests",
+                description=(
+                    "Maximum number of requests in flight. The limit is lowered when "
+                    "the API throttles requests and raised again as they succeed."
+                ),
+            ),
+            Property(
+                "endpoints",
+                ObjectType(
+                    # Endpoint paths → Rate limit overrides
+                    additional_properties=ObjectType(
+                        Property("requests_per_second", DecimalType),
+                        Property("burst", IntegerType),
+                    ),
+                ),
+                title="Endpoints",
+                description=(
+                    "Rate limits of specific endpoints, by stream path. These "
+                    "replace the default `requests_per_second` and `burst`."
+                ),
+            ),
+        ),
+        title="Rate Limit",
+        description=(
+            "Rate limit for the HTTP requests of all streams. The `Retry-After` and "
+            "`X-RateLimit-*` response headers are also used to pace requests."
+        ),
+    ),
+).to_dict()
+TAP_HTTP_SESSION_CONFIG = PropertiesList(
+    Property(
+        "http_session",
+        ObjectType(
+            Property(
+                "pool_connections",
+                IntegerType,
+                title="Pool Connections",
+                description=(
+                    "Number of hosts to keep connection pools for, in each session. "
+                    "Defaults to 10."
+                ),
+            ),
+            Property(
+                "pool_maxsize",
+                IntegerType,
+                title="Pool Max Size",
+                description=(
+                    "Number of connections to keep alive for each host. Should be at "
+                    "least the number of requests sent at the same time. Defaults to "
+                    "10."
+                ),
+            ),
+            Property(
+                "max_retries",
+                IntegerType,
+                title="Max Retries",
+                description=(
+                    "Number of times to retry requests that fail to connect. "
+                    "Defaults to 0."
+                ),
+            ),
+            Property(
+                "compression",
+                BooleanType,
+                title="Compression",
+                description=(
+                    "Whether to accept compressed responses. Defaults to true."
+                ),
+            ),
+        ),
+        title="HTTP Session",
+        description=(
+            "Share HTTP sessions, and their connection pools, between the streams "
+            "of the tap that request the same host."
+        ),
+    ),
+).to_dict()
+TAP_HTTP_CACHE_CONFIG = PropertiesList(
+    Property(
+        "http_cache",
+        ObjectType(
+            Property(
+                "path",
+                StringType,
+                title="Path",
+                description=(
+                    "Path of the cache file. Defaults to "
+                    "`<tap name>-http-cache.sqlite` in the working directory."
+                ),
+            ),
+            Property(
+                "max_size_bytes",
+                IntegerType,
+                title="Max Size (Bytes)",
+                description=(
+                    "Maximum size of the compressed responses held in the cache. The "
+                    "least recently used responses are evicted first. Defaults to "
+                    "100 MiB."
+                ),
+            ),
+        ),
+        title="HTTP Cache",
+        description=(
+            "Cache HTTP responses that have an `ETag` or `Last-Modified` header on "
+            "disk, and revalidate them with conditional requests in later runs."
+        ),
+    ),
+).to_dict()
 SQL_TAP_USE_SINGER_DECIMAL = PropertiesList(
     Property(
         "use_singer_decimal",
@@ -223,6 +364,18 @@ SQL_TAP_USE_SINGER_DECIMAL = PropertiesList(
         ),
     ),
 ).to_dict()
+SQL_TAP_FETCH_SIZE_CONFIG = PropertiesList(
+    Property(
+        "fetch_size",
+        IntegerType(minimum=1),
+        title="Fetch Size",
+        description=(
+            "Number of rows to fetch from the database at a time. When set, tables "
+            "are read with a server-side cursor, so memory use stays bounded for "
+            "large tables."
+        ),
+    ),
+).to_dict()
 TARGET_SCHEMA_CONFIG = PropertiesList(
     Property(
         "default_target_schema",
@@ -260,6 +413,18 @@ ADD_RECORD_METADATA_CONFIG = PropertiesList(
         description="Whether to add metadata fields to records.",
     ),
 ).to_dict()
+TARGET_BULK_LOAD_METHOD_CONFIG = PropertiesList(
+    Property(
+        "bulk_load_method",
+        StringType,
+        title="Bulk Load Method",
+        description=(
+            "The method used to insert records into SQL tables. Built-in methods are "
+            "`executemany`, `values` (multi-row `INSERT ... VALUES` statements) and "
+            "`sqlite`. Defaults to the fastest method supported by the database."
+        ),
+    ),
+).to_dict()
 TARGET_HARD_DELETE_CONFIG = PropertiesList(
     Property(
         "hard_delete",
@@ -277,6 +442,20 @@ TARGET_VALIDATE_RECORDS_CONFIG = PropertiesList(
         description="Whether to validate the schema of the incoming streams.",
         default=True,
     ),
+    Property(
+        "record_validator",
+        StringType(),
+        title="Record Validator",
+        description=(
+            "The backend used to validate records: `jsonschema`, `fastjsonschema` "
+            "(requires the `fastjsonschema` extra), `msgspec` (requires the "
+            "`msgspec` extra) or another backend registered under the "
+            "`singer_sdk.record_validators` entry point group. The `msgspec` "
+            "backend only checks types, required properties and additional "
+            "properties."
+        ),
+        default="jsonschema",
+    ),
 ).to_dict()
 TARGET_BATCH_SIZE_ROWS_CONFIG = PropertiesList(
     Property(
@@ -286,6 +465,26 @@ TARGET_BATCH_SIZE_ROWS_CONFIG = PropertiesList(
         description="Maximum number of rows in each batch.",
     ),
 ).to_dict()
+TARGET_BATCH_SIZE_BYTES_CONFIG = PropertiesList(
+    Property(
+        "batch_size_bytes",
+        IntegerType,
+        title="Batch Size Bytes",
+        description=(
+            "Maximum estimated size of each batch, in bytes of input. Batches are "
+            "processed when either this or `batch_size_rows` is reached."
+        ),
+    ),
+    Property(
+        "max_buffer_size_bytes",
+        IntegerType,
+        title="Max Buffer Size Bytes",
+        description=(
+            "Maximum estimated size of the records buffered across all streams, in "
+            "bytes of input. When exceeded, the largest batches are processed first."
+        ),
+    ),
+).to_dict()
 
 
 class TargetLoadMethods(str, Enum):
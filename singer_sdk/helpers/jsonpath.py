@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 import logging
+import re
 import typing as t
 from functools import lru_cache
 
 from jsonpath_ng.ext import parse
 
 if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     import jsonpath_ng
 
+    _Extractor = Callable[[t.Any], Iterator[t.Any]]
+
 
 logger = logging.getLogger(__name__)
 
+_SIMPLE_KEY = r"\.([A-Za-z_][A-Za-z0-9_-]*)|\['([^'\\]*)'\]|\[\"([^\"\\]*)\"\]"
+_SIMPLE_PATH = re.compile(rf"\$(?P<keys>(?:{_SIMPLE_KEY})*)(?P<items>\[\*\])?")
+
+# Words that jsonpath_ng does not accept as unquoted keys
+_RESERVED_WORDS = frozenset(("where", "wherenot", "true", "false"))
+
 
 def extract_jsonpath(
     expression: str,
@@ -21,6 +32,10 @@ def extract_jsonpath(
 ) -> t.Generator[t.Any, None, None]:
     """Extract records from an input based on a JSONPath expression.
 
+    Simple expressions made of object keys, optionally followed by a wildcard, such
+    as ``$.data[*]`` or ``$.meta.next``, are evaluated directly on the input. Other
+    expressions are evaluated with ``jsonpath_ng``.
+
     Args:
         expression: JSONPath expression to match against the input.
         input: JSON object or array to extract records from.
@@ -28,15 +43,7 @@ def extract_jsonpath(
     Yields:
         Records matched with JSONPath expression.
     """
-    compiled_jsonpath = _compile_jsonpath(expression)
-
-    match: jsonpath_ng.DatumInContext
-    matches = compiled_jsonpath.find(input)
-
-    logger.debug("JSONPath %s match count: %d", expression, len(matches))
-
-    for match in matches:
-        yield match.value
+    yield from _compile_extractor(expression)(input)
 
 
 @lru_cache
@@ -50,3 +57,115 @@ def _compile_jsonpath(expression: str) -> jsonpath_ng.JSONPath:
         A compiled JSONPath object.
     """
     return parse(expression)
+
+
+@lru_cache
+def _parse_simple_path(expression: str) -> tuple[tuple[str, ...], bool] | None:
+    """Parse a JSONPath expression made of object keys and an optional wildcard.
+
+    Args:
+        expression: A string representing a JSONPath expression.
+
+    Returns:
+        The keys of the expression and whether it ends with a wildcard, or ``None``
+        for other expressions.
+    """
+    match = _SIMPLE_PATH.fullmatch(expression.strip())
+    if match is None:
+        return None
+
+    keys = []
+    for key in re.finditer(_SIMPLE_KEY, match["keys"]):
+        if key.lastindex == 1 and key[1] in _RESERVED_WORDS:
+            return None
+        keys.append(key[t.cast("int", key.lastindex)])
+    return tuple(keys), match["items"] is not None
+
+
+def _simple_items_path(expression: str) -> tuple[str, ...] | None:
+    """Get the keys of a JSONPath expression that selects the items of an array.
+
+    Only expressions made of object keys followed by a wildcard are supported, such
+    as ``$[*]``, ``$.data.items[*]`` or ``$['data'][*]``.
+
+    Args:
+        expression: A string representing a JSONPath expression.
+
+    Returns:
+        The keys that lead to the array, or ``None`` for other expressions.
+    """
+    path = _parse_simple_path(expression)
+    if path is None or not path[1]:
+        return None
+    return path[0]
+
+
+@lru_cache
+def _compile_extractor(expression: str) -> _Extractor:
+    """Compile a JSONPath expression into a function that extracts its matches.
+
+    Args:
+        expression: A string representing a JSONPath expression.
+
+    Returns:
+        A function that takes an input and returns an iterator of the matches.
+    """
+    path = _parse_simple_path(expression)
+    if path is None:
+        return _jsonpath_ng_extractor(expression)
+    return _simple_extractor(*path)
+
+
+def _simple_extractor(keys: tuple[str, ...], items: bool) -> _Extractor:  # noqa: FBT001
+    """Create a function that extracts the value at a path of object keys.
+
+    Matches are the same as with ``jsonpath_ng``: nothing is matched if a key is
+    missing or the value it belongs to is not an object. With a wildcard, the items
+    of an array are matched, ``null`` matches nothing and other values match
+    themselves.
+
+    Args:
+        keys: The keys that lead to the value.
+        items: Whether to match the items of the value.
+
+    Returns:
+        A function that takes an input and returns an iterator of the matches.
+    """
+
+    def extract(value: t.Any) -> Iterator[t.Any]:  # noqa: ANN401
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return
+            value = value[key]
+
+        if not items:
+            yield value
+        elif isinstance(value, (list, tuple)):
+            yield from value
+        elif value is not None:
+            yield value
+
+    return extract
+
+
+def _jsonpath_ng_extractor(expression: str) -> _Extractor:
+    """Create a function that extracts the matches of an expression with jsonpath_ng.
+
+    Args:
+        expression: A string representing a JSONPath expression.
+
+    Returns:
+        A function that takes an input and returns an iterator of the matches.
+    """
+    compiled_jsonpath = _compile_jsonpath(expression)
+
+    def extract(value: t.Any) -> Iterator[t.Any]:  # noqa: ANN401
+        match: jsonpath_ng.DatumInContext
+        matches = compiled_jsonpath.find(value)
+
+        logger.debug("JSONPath %s match count: %d", expression, len(matches))
+
+        for match in matches:
+            yield match.value
+
+    return extract
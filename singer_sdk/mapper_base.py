@@ -69,6 +69,10 @@ class InlineMapper(BaseSingerReader, BaseSingerWriter, metaclass=abc.ABCMeta):
     def _process_batch_message(self, message_dict: dict) -> None:
         self._write_messages(self.map_batch_message(message_dict))
 
+    def process_endofpipe(self) -> None:
+        """Write out any messages held by a buffered message writer."""
+        self.message_writer.flush()
+
     @abc.abstractmethod
     def map_schema_message(self, message_dict: dict) -> t.Iterable[singer.Message]:
         """Map a schema message to zero or more new messages.
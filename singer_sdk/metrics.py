@@ -42,6 +42,7 @@ class Tag(str, enum.Enum):
     STREAM = "stream"
     CONTEXT = "context"
     ENDPOINT = "endpoint"
+    TABLE = "table"
     JOB_TYPE = "job_type"
     HTTP_STATUS_CODE = "http_status_code"
     STATUS = "status"
@@ -55,6 +56,13 @@ class Metric(str, enum.Enum):
     BATCH_COUNT = "batch_count"
     HTTP_REQUEST_DURATION = "http_request_duration"
     HTTP_REQUEST_COUNT = "http_request_count"
+    HTTP_REQUEST_WAIT = "http_request_wait"
+    HTTP_CONCURRENCY_LIMIT = "http_concurrency_limit"
+    HTTP_CONNECTION_COUNT = "http_connection_count"
+    HTTP_CACHE_HIT_COUNT = "http_cache_hit_count"
+    HTTP_CACHE_MISS_COUNT = "http_cache_miss_count"
+    SQL_REFLECTION_CACHE_HIT_COUNT = "sql_reflection_cache_hit_count"
+    SQL_REFLECTION_CACHE_MISS_COUNT = "sql_reflection_cache_miss_count"
     JOB_DURATION = "job_duration"
     SYNC_DURATION = "sync_duration"
     BATCH_PROCESSING_TIME = "batch_processing_time"
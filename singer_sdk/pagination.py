@@ -39,6 +39,14 @@ def first(iterable: t.Iterable[T]) -> T:
 class BaseAPIPaginator(t.Generic[TPageToken], metaclass=ABCMeta):
     """An API paginator object."""
 
+    reads_response_body: t.ClassVar[bool] = True
+    """Whether the paginator reads the body of responses, not only their headers.
+
+    Streams with ``stream_responses`` download the whole body of each response before
+    it is parsed if their paginator reads it. Set this to False in paginators that
+    only read the response headers, so that records are parsed as they are received.
+    """
+
     def __init__(self, start_value: TPageToken) -> None:
         """Create a new paginator.
 
@@ -162,10 +170,30 @@ class BaseAPIPaginator(t.Generic[TPageToken], metaclass=ABCMeta):
         """
         ...
 
+    def predict_next(self, value: TPageToken) -> TPageToken | None:  # noqa: ARG002, PLR6301
+        """Predict the pagination token that follows a given one, without a response.
+
+        Paginators whose tokens can be computed in advance, such as page numbers or
+        offsets, override this method so that streams can request several pages at
+        once. The predicted token is checked against the one returned by
+        :meth:`~singer_sdk.pagination.BaseAPIPaginator.get_next` once the response
+        arrives.
+
+        Args:
+            value: A pagination token.
+
+        Returns:
+            The token of the page after the given one, or `None` if it cannot be
+                predicted.
+        """
+        return None
+
 
 class SinglePagePaginator(BaseAPIPaginator[None]):
     """A paginator that works with single-page endpoints."""
 
+    reads_response_body = False
+
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
         """Create a new paginator.
 
@@ -276,6 +304,8 @@ class HeaderLinkPaginator(BaseHATEOASPaginator):
         - https://datatracker.ietf.org/doc/html/rfc8288#section-3
     """
 
+    reads_response_body = False
+
     @override
     def get_next_url(self, response: requests.Response) -> str | None:
         """Override this method to extract a HATEOAS link from the response.
@@ -326,6 +356,8 @@ class JSONPathPaginator(BaseAPIPaginator[str | None]):
 class SimpleHeaderPaginator(BaseAPIPaginator[str | None]):
     """Paginator class for APIs returning a pagination token in the response headers."""
 
+    reads_response_body = False
+
     def __init__(
         self,
         key: str,
@@ -370,6 +402,18 @@ class BasePageNumberPaginator(BaseAPIPaginator[int], metaclass=ABCMeta):
         """
         return self._value + 1
 
+    @override
+    def predict_next(self, value: int) -> int:
+        """Predict the page number after a given one.
+
+        Args:
+            value: A page number.
+
+        Returns:
+            The next page number.
+        """
+        return value + 1
+
 
 class BaseOffsetPaginator(BaseAPIPaginator[int], metaclass=ABCMeta):
     """Paginator class for APIs that use page offset."""
@@ -404,6 +448,18 @@ class BaseOffsetPaginator(BaseAPIPaginator[int], metaclass=ABCMeta):
         """
         return self._value + self._page_size
 
+    @override
+    def predict_next(self, value: int) -> int:
+        """Predict the page offset after a given one.
+
+        Args:
+            value: A page offset.
+
+        Returns:
+            The next page offset.
+        """
+        return value + self._page_size
+
 
 class LegacyPaginatedStreamProtocol(t.Protocol[TPageToken]):
     """Protocol for legacy paginated streams classes."""
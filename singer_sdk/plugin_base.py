@@ -42,6 +42,7 @@ from singer_sdk.typing import (
 )
 
 if t.TYPE_CHECKING:
+    import datetime
     from types import FrameType, TracebackType
 
     from jsonschema import ValidationError
@@ -846,6 +847,9 @@ class BaseSingerReader(BaseSingerIO, metaclass=abc.ABCMeta):
                 SingerMessageType.ACTIVATE_VERSION: self._process_activate_version_message,  # noqa: E501
                 SingerMessageType.BATCH: self._process_batch_message,
             },
+            batch_callbacks={
+                SingerMessageType.RECORD: self._process_record_messages,
+            },
         )
 
     def process_endofpipe(self) -> None:
@@ -866,6 +870,15 @@ class BaseSingerReader(BaseSingerIO, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def _process_record_message(self, message_dict: dict) -> None: ...
 
+    def _process_record_messages(self, message_dicts: list[dict]) -> None:
+        """Process a run of consecutive RECORD messages for the same stream.
+
+        Args:
+            message_dicts: The RECORD messages, in input order.
+        """
+        for message_dict in message_dicts:
+            self._process_record_message(message_dict)
+
     @abc.abstractmethod
     def _process_state_message(self, message_dict: dict) -> None: ...
 
@@ -913,3 +926,27 @@ class BaseSingerWriter(BaseSingerIO):
     def write_message(self, message: t.Any) -> None:  # noqa: ANN401
         """Write a message to the tap's message writer."""
         self.message_writer.write_message(message)
+
+    @t.final
+    def write_record(
+        self,
+        stream: str,
+        record: dict[str, t.Any],
+        *,
+        version: int | None = None,
+        time_extracted: datetime.datetime | None = None,
+    ) -> None:
+        """Write a RECORD message to the tap's message writer.
+
+        Args:
+            stream: The stream name.
+            record: The record data.
+            version: The record version.
+            time_extracted: The time the record was extracted.
+        """
+        self.message_writer.write_record(
+            stream,
+            record,
+            version=version,
+            time_extracted=time_extracted,
+        )
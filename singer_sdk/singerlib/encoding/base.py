@@ -6,11 +6,15 @@ import abc
 import enum
 import logging
 import sys
+import time
 import typing as t
 from collections import Counter, defaultdict
 
 from singer_sdk.singerlib import exceptions
 
+if t.TYPE_CHECKING:
+    import datetime
+
 if sys.version_info < (3, 11):
     from backports.datetime_fromisoformat import MonkeyPatch
 
@@ -38,29 +42,60 @@ class SingerMessageType(str, enum.Enum):
 class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
     """Interface for all plugins reading Singer messages as strings or bytes."""
 
-    def __init__(self) -> None:
-        """Initialize the reader."""
+    bulk_read_size: int | None = None
+    """Read input in chunks of up to this many bytes. ``None`` reads line by line."""
+
+    def __init__(self, *, bulk_read_size: int | None = None) -> None:
+        """Initialize the reader.
+
+        Args:
+            bulk_read_size: Enable bulk reading with chunks of up to this size. In
+                bulk mode, input is read in large chunks, many lines are decoded per
+                call and runs of consecutive messages for the same stream are
+                dispatched to batch callbacks.
+        """
         super().__init__()
         self._current_message: T | None = None
+        self._current_message_size = 0
+        self.bulk_read_size = bulk_read_size or self.bulk_read_size
+
+    @property
+    def current_message_size(self) -> int:
+        """Estimated size of the raw input line of the message being processed.
+
+        In bulk mode, this is the average line size of the current block.
+
+        Returns:
+            The size in bytes, or characters for text input.
+        """
+        return self._current_message_size
 
     def process_lines(
         self,
         file_input: t.IO[T] | None,
         callbacks: dict[str, t.Callable[[dict], None]],
+        batch_callbacks: dict[str, t.Callable[[list[dict]], None]] | None = None,
     ) -> t.Counter[str]:
         """Internal method to process jsonl lines from a Singer tap.
 
         Args:
             file_input: Readable stream of messages, each on a separate line.
             callbacks: Dictionary of message type to callback function.
+            batch_callbacks: Dictionary of message type to a callback function that
+                accepts a run of consecutive messages for the same stream. Only used
+                in bulk mode.
 
         Returns:
             A counter object for the processed lines.
         """
-        stats: dict[str, int] = defaultdict(int)
         filein = file_input or self.default_input
+        if self.bulk_read_size:
+            return self._process_lines_bulk(filein, callbacks, batch_callbacks or {})
+
+        stats: dict[str, int] = defaultdict(int)
         for line in filein:
             self._current_message = line
+            self._current_message_size = len(line)
 
             line_dict = self.deserialize_json(line)
             self.assert_line_requires(line_dict, requires={"type"})
@@ -75,6 +110,99 @@ class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
 
         return Counter(**stats)
 
+    def _process_lines_bulk(
+        self,
+        filein: t.IO[T],
+        callbacks: dict[str, t.Callable[[dict], None]],
+        batch_callbacks: dict[str, t.Callable[[list[dict]], None]],
+    ) -> t.Counter[str]:
+        """Process jsonl lines, decoding and dispatching many messages at a time.
+
+        Args:
+            filein: Readable stream of messages, each on a separate line.
+            callbacks: Dictionary of message type to callback function.
+            batch_callbacks: Dictionary of message type to batch callback function.
+
+        Returns:
+            A counter object for the processed lines.
+        """
+        stats: t.Counter[str] = Counter()
+        for block in self._read_line_blocks(filein):
+            messages = self.deserialize_lines(block)
+            start = 0
+            count = len(messages)
+            self._current_message_size = len(block) // max(count, 1)
+            while start < count:
+                message = messages[start]
+                if "type" not in message:
+                    self.assert_line_requires(message, requires={"type"})
+
+                record_type = message["type"]
+                batch_callback = batch_callbacks.get(record_type)
+                if batch_callback is None:
+                    if callback := callbacks.get(record_type):
+                        callback(message)
+                    else:
+                        self._process_unknown_message(message)
+                    stats[record_type] += 1
+                    start += 1
+                    continue
+
+                # Collect the run of messages of the same type and stream
+                stream = message.get("stream")
+                end = start + 1
+                while (
+                    end < count
+                    and messages[end].get("type") == record_type
+                    and messages[end].get("stream") == stream
+                ):
+                    end += 1
+                batch_callback(messages[start:end])
+                stats[record_type] += end - start
+                start = end
+
+        return stats
+
+    def _read_line_blocks(self, filein: t.IO[T]) -> t.Iterator[T | memoryview]:
+        """Read the input in large chunks, split at line boundaries.
+
+        Binary input is preferred when the input stream wraps a binary buffer, and
+        blocks are yielded as memory views over the chunk to avoid copying them.
+
+        Args:
+            filein: Readable stream of messages, each on a separate line.
+
+        Yields:
+            Blocks of one or more complete lines.
+        """
+        stream: t.Any = getattr(filein, "buffer", filein)
+        # Prefer `read1` so a slow producer doesn't block us until a chunk is full
+        read = getattr(stream, "read1", stream.read)
+        size = self.bulk_read_size
+        remainder: t.Any = None
+        while chunk := read(size):
+            newline = b"\n" if isinstance(chunk, bytes) else "\n"
+            last = chunk.rfind(newline)
+            if last == -1:
+                remainder = chunk if remainder is None else remainder + chunk
+                continue
+
+            start = 0
+            if remainder is not None:
+                start = chunk.find(newline) + 1
+                yield remainder + chunk[:start]
+                remainder = None
+
+            if start <= last:
+                view = memoryview(chunk) if isinstance(chunk, bytes) else chunk
+                yield view[start : last + 1]
+
+            if last + 1 < len(chunk):
+                remainder = chunk[last + 1 :]
+
+        if remainder:
+            yield remainder
+
     @property
     @abc.abstractmethod
     def default_input(self) -> t.IO[T]:
@@ -100,6 +228,25 @@ class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
     def deserialize_json(self, line: T) -> dict:
         """Deserialize a line of json."""
 
+    def deserialize_lines(self, data: T | memoryview) -> list[dict]:
+        """Deserialize a block of newline-delimited json.
+
+        Readers with a native bulk decoder should override this method.
+
+        Args:
+            data: One or more lines of json.
+
+        Returns:
+            A list of the deserialized messages. Blank lines are skipped.
+        """
+        lines: t.Any = data.tobytes() if isinstance(data, memoryview) else data
+        newline = b"\n" if isinstance(lines, bytes) else "\n"
+        return [
+            self.deserialize_json(line)
+            for line in lines.split(newline)
+            if line and not line.isspace()
+        ]
+
     def _process_unknown_message(self, message_dict: dict) -> None:  # noqa: PLR6301
         """Internal method to process unknown message types from a Singer tap.
 
@@ -114,9 +261,150 @@ class GenericSingerReader(t.Generic[T], metaclass=abc.ABCMeta):
         raise ValueError(msg)
 
 
+class MessageBuffer(t.Generic[T]):
+    """In-memory buffer of serialized messages awaiting a bulk write.
+
+    The buffer is considered full once any of the configured byte, message or time
+    thresholds is reached. Thresholds set to ``None`` are ignored.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        max_messages: int | None = None,
+        max_seconds: float | None = None,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            max_bytes: Maximum size of the buffered data, in bytes or characters.
+            max_messages: Maximum number of buffered messages.
+            max_seconds: Maximum age of the oldest buffered message, in seconds.
+        """
+        self.max_bytes = max_bytes
+        self.max_messages = max_messages
+        self.max_seconds = max_seconds
+        self._chunks: list[T] = []
+        self._size = 0
+        self._started_at: float | None = None
+
+    def __len__(self) -> int:
+        """Get the number of buffered messages.
+
+        Returns:
+            The number of buffered messages.
+        """
+        return len(self._chunks)
+
+    @property
+    def size(self) -> int:
+        """Get the size of the buffered data.
+
+        Returns:
+            The total length of all buffered chunks.
+        """
+        return self._size
+
+    @property
+    def is_full(self) -> bool:
+        """Check the buffer against its thresholds.
+
+        Returns:
+            True if the buffered messages should be written out.
+        """
+        if self.max_bytes is not None and self._size >= self.max_bytes:
+            return True
+        if self.max_messages is not None and len(self._chunks) >= self.max_messages:
+            return True
+        return (
+            self.max_seconds is not None
+            and self._started_at is not None
+            and time.monotonic() - self._started_at >= self.max_seconds
+        )
+
+    def append(self, data: T) -> None:
+        """Add a serialized message to the buffer.
+
+        Args:
+            data: The serialized message, including its line terminator.
+        """
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        self._chunks.append(data)
+        self._size += len(data)
+
+    def drain(self, empty: T) -> T:
+        """Return all buffered data as a single chunk and reset the buffer.
+
+        Args:
+            empty: An empty string or bytes object used to join the chunks.
+
+        Returns:
+            The concatenated buffered data.
+        """
+        data = empty.join(self._chunks)
+        self._chunks = []
+        self._size = 0
+        self._started_at = None
+        return data
+
+
 class GenericSingerWriter(t.Generic[T, M], metaclass=abc.ABCMeta):
     """Interface for all plugins writing Singer messages as strings or bytes."""
 
+    buffer_max_bytes: int | None = None
+    """Write buffered messages once they reach this size. ``None`` disables it."""
+
+    buffer_max_messages: int | None = None
+    """Write buffered messages once this many are pending. ``None`` disables it."""
+
+    buffer_max_seconds: float | None = None
+    """Write buffered messages once the oldest is this old. ``None`` disables it."""
+
+    # Unbuffered by default, also for writers that don't call this class' initializer
+    _buffer: MessageBuffer[T] | None = None
+
+    def __init__(
+        self,
+        *,
+        buffer_max_bytes: int | None = None,
+        buffer_max_messages: int | None = None,
+        buffer_max_seconds: float | None = None,
+    ) -> None:
+        """Initialize the writer.
+
+        Output buffering is enabled when any of the thresholds is set, either here or
+        as a class attribute. Only RECORD and BATCH messages are held in the buffer;
+        any other message type flushes the buffer immediately, so that a STATE message
+        never reaches the output before the records it covers.
+
+        Args:
+            buffer_max_bytes: Maximum size of the output buffer.
+            buffer_max_messages: Maximum number of messages in the output buffer.
+            buffer_max_seconds: Maximum age of the oldest message in the buffer.
+        """
+        super().__init__()
+        max_bytes = buffer_max_bytes or self.buffer_max_bytes
+        max_messages = buffer_max_messages or self.buffer_max_messages
+        max_seconds = buffer_max_seconds or self.buffer_max_seconds
+        self._buffer = None
+        if max_bytes or max_messages or max_seconds:
+            self._buffer = MessageBuffer(
+                max_bytes=max_bytes,
+                max_messages=max_messages,
+                max_seconds=max_seconds,
+            )
+
+    @property
+    def is_buffered(self) -> bool:
+        """Check if output buffering is enabled.
+
+        Returns:
+            True if messages are buffered before being written.
+        """
+        return self._buffer is not None
+
     def format_message(self, message: M) -> T:
         """Format a message as a JSON string.
 
@@ -135,3 +423,80 @@ class GenericSingerWriter(t.Generic[T, M], metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def write_message(self, message: M) -> None:
         """Write a message to stdout."""
+
+    def write_record(
+        self,
+        stream: str,
+        record: dict[str, t.Any],
+        *,
+        version: int | None = None,
+        time_extracted: datetime.datetime | None = None,
+    ) -> None:
+        """Write a RECORD message to stdout.
+
+        Writers can override this to serialize the record envelope directly, without
+        building an intermediate message object.
+
+        Args:
+            stream: The stream name.
+            record: The record data.
+            version: The record version.
+            time_extracted: The time the record was extracted.
+        """
+        from singer_sdk.singerlib.encoding.simple import RecordMessage  # noqa: PLC0415
+
+        self.write_message(
+            RecordMessage(  # type: ignore[arg-type]
+                stream=stream,
+                record=record,
+                version=version,
+                time_extracted=time_extracted,
+            ),
+        )
+
+    def flush(self) -> None:
+        """Write out any buffered messages and flush the output stream."""
+        if self._buffer is not None and len(self._buffer):
+            self._write_output(self._buffer.drain(self._empty_output()))
+        self._flush_output()
+
+    def _write_line(self, line: T, *, force_flush: bool) -> None:
+        """Write a serialized message, buffering it if enabled.
+
+        Args:
+            line: The serialized message, including its line terminator.
+            force_flush: Write out the buffer, regardless of its thresholds.
+        """
+        buffer = self._buffer
+        if buffer is None:
+            self._write_output(line)
+            self._flush_output()
+            return
+
+        buffer.append(line)
+        if force_flush or buffer.is_full:
+            self.flush()
+
+    def _empty_output(self) -> T:
+        """Get an empty chunk of the writer's output type.
+
+        Raises:
+            NotImplementedError: If the writer does not support output buffering.
+        """
+        msg = f"{type(self).__name__} does not support output buffering."
+        raise NotImplementedError(msg)
+
+    def _write_output(self, data: T) -> None:
+        """Write data to the output stream.
+
+        Args:
+            data: The data to write.
+
+        Raises:
+            NotImplementedError: If the writer does not support output buffering.
+        """
+        msg = f"{type(self).__name__} does not support output buffering."
+        raise NotImplementedError(msg)
+
+    def _flush_output(self) -> None:
+        """Flush the output stream."""
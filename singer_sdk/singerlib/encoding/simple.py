@@ -17,6 +17,8 @@ from .base import GenericSingerReader, GenericSingerWriter, SingerMessageType
 
 logger = logging.getLogger(__name__)
 
+_BUFFERED_MESSAGE_TYPES = frozenset((SingerMessageType.RECORD, SingerMessageType.BATCH))
+
 
 def exclude_null_dict(pairs: list[tuple[str, t.Any]]) -> dict[str, t.Any]:
     """Exclude null values from a dictionary.
@@ -30,6 +32,27 @@ def exclude_null_dict(pairs: list[tuple[str, t.Any]]) -> dict[str, t.Any]:
     return {key: value for key, value in pairs if value is not None}
 
 
+def _to_utc_time_extracted(time_extracted: datetime) -> datetime:
+    """Convert a record extraction time to UTC.
+
+    Args:
+        time_extracted: The time the record was extracted.
+
+    Returns:
+        The extraction time in UTC.
+
+    Raises:
+        ValueError: If the time_extracted is not timezone-aware.
+    """
+    if not time_extracted.tzinfo:
+        msg = (
+            "'time_extracted' must be either None or an aware datetime (with a "
+            "time zone)"
+        )
+        raise ValueError(msg)
+    return time_extracted.astimezone(timezone.utc)
+
+
 @dataclass(slots=True)
 class Message:
     """Singer base message."""
@@ -122,21 +145,10 @@ class RecordMessage(Message):
         return result
 
     def __post_init__(self) -> None:
-        """Post-init processing.
-
-        Raises:
-            ValueError: If the time_extracted is not timezone-aware.
-        """
+        """Post-init processing."""
         self.type = SingerMessageType.RECORD
-        if self.time_extracted and not self.time_extracted.tzinfo:
-            msg = (
-                "'time_extracted' must be either None or an aware datetime (with a "
-                "time zone)"
-            )
-            raise ValueError(msg)
-
         if self.time_extracted:
-            self.time_extracted = self.time_extracted.astimezone(timezone.utc)
+            self.time_extracted = _to_utc_time_extracted(self.time_extracted)
 
 
 @dataclass(slots=True)
@@ -225,6 +237,15 @@ class SimpleSingerReader(GenericSingerReader[str]):
 class SimpleSingerWriter(GenericSingerWriter[str, Message]):
     """Interface for all plugins writing Singer messages to stdout."""
 
+    def __init__(self, **kwargs: t.Any) -> None:
+        """Initialize the writer.
+
+        Args:
+            kwargs: Keyword arguments passed to the base writer.
+        """
+        super().__init__(**kwargs)
+        self._record_prefixes: dict[str, str] = {}
+
     def serialize_message(self, message: Message) -> str:  # noqa: PLR6301
         """Serialize a dictionary into a line of json.
 
@@ -242,5 +263,48 @@ class SimpleSingerWriter(GenericSingerWriter[str, Message]):
         Args:
             message: The message to write.
         """
-        sys.stdout.write(self.format_message(message) + "\n")
+        self._write_line(
+            self.format_message(message) + "\n",
+            force_flush=message.type not in _BUFFERED_MESSAGE_TYPES,
+        )
+
+    def write_record(
+        self,
+        stream: str,
+        record: dict[str, t.Any],
+        *,
+        version: int | None = None,
+        time_extracted: datetime | None = None,
+    ) -> None:
+        """Write a RECORD message to stdout.
+
+        The message envelope is serialized directly, starting from a cached prefix for
+        the stream.
+
+        Args:
+            stream: The stream name.
+            record: The record data.
+            version: The record version.
+            time_extracted: The time the record was extracted.
+        """
+        prefix = self._record_prefixes.get(stream)
+        if prefix is None:
+            prefix = f'{{"type":"RECORD","stream":{serialize_json(stream)},"record":'
+            self._record_prefixes[stream] = prefix
+
+        line = prefix + serialize_json(record)
+        if version is not None:
+            line += f',"version":{version}'
+        if time_extracted is not None:
+            utc_time_extracted = _to_utc_time_extracted(time_extracted)
+            line += f',"time_extracted":{serialize_json(utc_time_extracted)}'
+        self._write_line(line + "}\n", force_flush=False)
+
+    def _empty_output(self) -> str:  # noqa: PLR6301
+        return ""
+
+    def _write_output(self, data: str) -> None:  # noqa: PLR6301
+        sys.stdout.write(data)
+
+    def _flush_output(self) -> None:  # noqa: PLR6301
         sys.stdout.flush()
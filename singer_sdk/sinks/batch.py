@@ -4,14 +4,50 @@ from __future__ import annotations
 
 import abc
 import datetime
+import typing as t
 import uuid
 
 from singer_sdk.sinks.core import Sink
 
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
+    from singer_sdk.helpers._arrow import ArrowTableBuilder
+
 
 class BatchSink(Sink):
     """Base class for batched record writers."""
 
+    columnar_batches: bool = False
+    """Accumulate records in Arrow columns instead of a list of dicts.
+
+    When enabled, :meth:`~singer_sdk.BatchSink.process_batch()` receives the batch
+    records as a :class:`pyarrow.Table` in ``context["table"]``, with a column for each
+    property of the stream schema. Requires the ``parquet`` extra.
+    """
+
+    columnar_chunk_size: int = 10_000
+    """Number of records to buffer as Python objects before converting them to Arrow."""
+
+    _arrow_schema_source: dict | None = None
+    _arrow_schema: pa.Schema | None = None
+
+    @property
+    def arrow_schema(self) -> pa.Schema:
+        """Get the Arrow schema of columnar batches, derived from the stream schema.
+
+        Returns:
+            The Arrow schema.
+        """
+        if self._arrow_schema is None or self._arrow_schema_source is not self.schema:
+            from singer_sdk.helpers._arrow import (  # noqa: PLC0415
+                json_schema_to_arrow_schema,
+            )
+
+            self._arrow_schema = json_schema_to_arrow_schema(self.schema)
+            self._arrow_schema_source = self.schema
+        return self._arrow_schema
+
     def _get_context(self, record: dict) -> dict:  # noqa: ARG002
         """Return a batch context. If no batch is active, return a new batch context.
 
@@ -50,7 +86,7 @@ class BatchSink(Sink):
             context: Stream partition or context dictionary.
         """
 
-    def process_record(self, record: dict, context: dict) -> None:  # noqa: PLR6301
+    def process_record(self, record: dict, context: dict) -> None:
         """Load the latest record from the stream.
 
         Developers may either load to the `context` dict for staging (the
@@ -63,15 +99,48 @@ class BatchSink(Sink):
         If duplicates are merged, these can be tracked via
         :meth:`~singer_sdk.Sink.tally_duplicate_merged()`.
 
+        If :attr:`~singer_sdk.BatchSink.columnar_batches` is enabled, records are
+        instead appended to Arrow column builders, and the batch is handed to
+        :meth:`~singer_sdk.BatchSink.process_batch()` as ``context["table"]``.
+
         Args:
             record: Individual record in the stream.
             context: Stream partition or context dictionary.
         """
+        if self.columnar_batches:
+            self._get_table_builder(context).append(record)
+            return
+
         if "records" not in context:
             context["records"] = []
 
         context["records"].append(record)
 
+    def _get_table_builder(self, context: dict) -> ArrowTableBuilder:
+        if "table_builder" not in context:
+            from singer_sdk.helpers._arrow import ArrowTableBuilder  # noqa: PLC0415
+
+            context["table_builder"] = ArrowTableBuilder(
+                self.arrow_schema,
+                chunk_size=self.columnar_chunk_size,
+            )
+        return context["table_builder"]  # type: ignore[no-any-return]
+
+    def start_drain(self) -> dict:
+        """Set and return `self._context_draining`.
+
+        In columnar mode, the accumulated columns are turned into an Arrow table and
+        stored in ``context["table"]``.
+
+        Returns:
+            TODO
+        """
+        context = super().start_drain()
+        if self.columnar_batches:
+            context["table"] = self._get_table_builder(context).finish()
+            del context["table_builder"]
+        return context
+
     @abc.abstractmethod
     def process_batch(self, context: dict) -> None:
         """Process a batch with the given batch context.
@@ -80,7 +149,8 @@ class BatchSink(Sink):
 
         If :meth:`~singer_sdk.BatchSink.process_record()` is not overridden,
         the `context["records"]` list will contain all records from the given batch
-        context.
+        context, or the `context["table"]` Arrow table if
+        :attr:`~singer_sdk.BatchSink.columnar_batches` is enabled.
 
         If duplicates are merged, these can be tracked via
         :meth:`~singer_sdk.Sink.tally_duplicate_merged()`.
@@ -5,10 +5,14 @@ from __future__ import annotations
 import abc
 import copy
 import datetime
+import hashlib
 import importlib.util
+import json
 import sys
 import time
 import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
 from functools import cached_property
 from gzip import open as gzip_open
 from types import MappingProxyType
@@ -25,6 +29,7 @@ from singer_sdk.helpers._batch import BatchConfig, BatchFileFormat, StorageTarge
 from singer_sdk.helpers._compat import (
     date_fromisoformat,
     datetime_fromisoformat,
+    entry_points,
     time_fromisoformat,
 )
 from singer_sdk.helpers._typing import (
@@ -69,9 +74,32 @@ class BaseJSONSchemaValidator(abc.ABC):
             record: Record message to validate.
         """
 
+    def validate_batch(
+        self,
+        records: t.Sequence[dict[str, t.Any]],
+    ) -> list[InvalidRecord]:
+        """Validate a batch of record messages.
+
+        Override this method if the validator can check many records at once faster
+        than one at a time.
+
+        Args:
+            records: Record messages to validate.
+
+        Returns:
+            The errors of the invalid records, in input order.
+        """
+        errors: list[InvalidRecord] = []
+        for record in records:
+            try:
+                self.validate(record)
+            except InvalidRecord as e:  # noqa: PERF203
+                errors.append(e)
+        return errors
+
 
 class JSONSchemaValidator(BaseJSONSchemaValidator):
-    """Validate records using the ``fastjsonschema`` library."""
+    """Validate records using the ``jsonschema`` library."""
 
     def __init__(
         self,
@@ -125,6 +153,135 @@ class JSONSchemaValidator(BaseJSONSchemaValidator):
             raise InvalidRecord(e.message, record) from e
 
 
+def get_validator_class(name: str) -> type[BaseJSONSchemaValidator]:
+    """Get a record validator backend by name.
+
+    Backends are registered under the ``singer_sdk.record_validators`` entry point
+    group. Their constructor must accept the schema as the first argument and a
+    ``validate_formats`` keyword argument.
+
+    Args:
+        name: The name of the validator backend.
+
+    Returns:
+        The validator class.
+
+    Raises:
+        ValueError: If the validator backend is not found.
+    """
+    plugins = entry_points(group="singer_sdk.record_validators")
+
+    try:
+        plugin = next(filter(lambda x: x.name == name, plugins))
+    except StopIteration:
+        message = f"Unsupported record validator: {name}"
+        raise ValueError(message) from None
+
+    return plugin.load()  # type: ignore[no-any-return]
+
+
+_VALIDATOR_CACHE_SIZE = 128
+_validator_cache: OrderedDict[
+    tuple[type[BaseJSONSchemaValidator], str, bool],
+    BaseJSONSchemaValidator,
+] = OrderedDict()
+
+
+def get_cached_validator(
+    validator_class: type[BaseJSONSchemaValidator],
+    schema: dict,
+    *,
+    validate_formats: bool,
+) -> BaseJSONSchemaValidator:
+    """Get a validator for a schema, reusing a previously compiled one if possible.
+
+    Validators are cached by backend, schema hash and format validation setting, so
+    sinks for streams with the same schema share a compiled validator.
+
+    Args:
+        validator_class: The validator backend.
+        schema: Schema of the records to validate.
+        validate_formats: Whether JSON string formats should be validated.
+
+    Returns:
+        A validator instance.
+    """
+    schema_hash = hashlib.sha256(
+        json.dumps(schema, sort_keys=True, default=str).encode(),
+    ).hexdigest()
+    key = (validator_class, schema_hash, validate_formats)
+    validator = _validator_cache.get(key)
+    if validator is not None:
+        _validator_cache.move_to_end(key)
+        return validator
+
+    validator = validator_class(
+        schema,
+        validate_formats=validate_formats,  # type: ignore[call-arg]
+    )
+    _validator_cache[key] = validator
+    if len(_validator_cache) > _VALIDATOR_CACHE_SIZE:
+        _validator_cache.popitem(last=False)
+    return validator
+
+
+_DATELIKE_PARSERS: dict[str, t.Callable[[str], t.Any]] = {
+    "date-time": datetime_fromisoformat,
+    "date": date_fromisoformat,
+    "time": time_fromisoformat,
+}
+
+
+@dataclass(frozen=True)
+class _TimestampParsingPlan:
+    """The record fields to parse, precomputed from a stream schema."""
+
+    schema: dict
+    """The schema the plan was computed from."""
+
+    properties: frozenset[str]
+    """Names of the properties in the schema."""
+
+    additional_properties: bool
+    """Whether the schema allows additional properties."""
+
+    datelike_fields: tuple[tuple[str, str, t.Callable[[str], t.Any]], ...]
+    """Name, datelike type and parser of each date, time and date-time field."""
+
+    @classmethod
+    def from_schema(cls, schema: dict) -> _TimestampParsingPlan:
+        """Compute the plan for a schema.
+
+        Args:
+            schema: The stream schema.
+
+        Returns:
+            The parsing plan.
+        """
+        datelike_fields = []
+        for key, property_schema in schema["properties"].items():
+            if datelike_type := get_datelike_property_type(property_schema):
+                parser = _DATELIKE_PARSERS.get(datelike_type, datetime_fromisoformat)
+                datelike_fields.append((key, datelike_type, parser))
+        return cls(
+            schema=schema,
+            properties=frozenset(schema["properties"]),
+            additional_properties=bool(schema.get("additionalProperties")),
+            datelike_fields=tuple(datelike_fields),
+        )
+
+
+@dataclass(frozen=True)
+class _DetachedBatch:
+    """A batch handed over for processing while the sink starts a new batch."""
+
+    context: dict
+    """The batch context, as returned by `Sink.start_drain`."""
+
+    records_written: int
+    """Number of records the batch writes once processed."""
+
+
 class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     """Abstract base class for target sinks."""
 
@@ -140,6 +297,20 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     fail_on_record_validation_exception: bool = True
     """Interrupt the target execution when a record fails schema validation."""
 
+    validate_records_at_drain: bool = False
+    """Validate all records of a batch at once, when the sink is drained.
+
+    Only enable this for sinks that do not write records before they are drained.
+    """
+
+    max_inflight_batches: int = 1
+    """Maximum number of batches of this stream processed in the background at once.
+
+    Only used if the target processes batches in the background, see
+    :attr:`~singer_sdk.Target.max_inflight_batches`. Batches of the same stream may
+    be processed out of order if this is greater than 1.
+    """
+
     def __init__(
         self,
         target: Target,
@@ -182,17 +353,23 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         self._total_dupe_records_merged: int = 0
         self._total_records_read: int = 0
         self._batch_records_read: int = 0
+        self._batch_bytes_read: int = 0
         self._batch_dupe_records_merged: int = 0
 
         # Batch full markers
         self._batch_size_rows: int | None = target.config.get(
             "batch_size_rows",
         )
+        self._batch_size_bytes: int | None = target.config.get(
+            "batch_size_bytes",
+        )
 
         # Track fields we've already warned about missing from schema
         self._warned_missing_fields: set[str] = set()
+        self._timestamp_parsing_plan = _TimestampParsingPlan.from_schema(self.schema)
 
         self._validator: BaseJSONSchemaValidator | None = self.get_validator()
+        self._records_to_validate: list[dict] = []
         self._record_counter: metrics.Counter = self.get_sink_record_counter()
         self._batch_timer = self.get_batch_processing_timer()
 
@@ -287,9 +464,13 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
                        raise InvalidRecord(error_message, record) from e
 
         .. _fastjsonschema: https://pypi.org/project/fastjsonschema/
+
+        By default, the validator backend is selected with the ``record_validator``
+        setting, and compiled validators are shared by sinks with the same schema.
         """
         if self.validate_schema:
-            return JSONSchemaValidator(
+            return get_cached_validator(
+                get_validator_class(self.config.get("record_validator", "jsonschema")),
                 self.schema,
                 validate_formats=self.validate_field_string_format,
             )
@@ -319,14 +500,28 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         return self._batch_records_read
 
+    @property
+    def current_size_bytes(self) -> int:
+        """Get the estimated size of the current batch.
+
+        The estimate is based on the size of the input lines of the batch records.
+
+        Returns:
+            The estimated number of bytes to drain.
+        """
+        return self._batch_bytes_read
+
     @property
     def is_full(self) -> bool:
-        """Check against the batch size limit.
+        """Check against the batch size limits.
 
         Returns:
             True if the sink needs to be drained.
         """
-        return self.current_size >= self.max_size
+        return self.current_size >= self.max_size or (
+            self.batch_size_bytes is not None
+            and self.current_size_bytes >= self.batch_size_bytes
+        )
 
     @property
     def batch_size_rows(self) -> int | None:
@@ -337,6 +532,15 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         return self._batch_size_rows
 
+    @property
+    def batch_size_bytes(self) -> int | None:
+        """The maximum estimated size of a batch before being processed.
+
+        Returns:
+            The max number of bytes or None if not set.
+        """
+        return self._batch_size_bytes
+
     @property
     def max_size(self) -> int:
         """Get max batch size.
@@ -358,16 +562,18 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     # Tally methods
 
     @t.final
-    def tally_record_read(self, count: int = 1) -> None:
+    def tally_record_read(self, count: int = 1, *, size_bytes: int = 0) -> None:
         """Increment the records read tally.
 
         This method is called automatically by the SDK when records are read.
 
         Args:
             count: Number to increase record count by.
+            size_bytes: Estimated size of the records read.
         """
         self._total_records_read += count
         self._batch_records_read += count
+        self._batch_bytes_read += size_bytes
 
     @t.final
     def tally_record_written(self, count: int = 1) -> None:
@@ -472,7 +678,10 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
             message: The record message.
             context: Stream partition or context dictionary.
         """
-        record["_sdc_extracted_at"] = message.get("time_extracted")
+        time_extracted = message.get("time_extracted")
+        if isinstance(time_extracted, datetime.datetime):
+            time_extracted = time_extracted.isoformat()
+        record["_sdc_extracted_at"] = time_extracted
         record["_sdc_received_at"] = datetime.datetime.now(
             tz=datetime.timezone.utc,
         ).isoformat()
@@ -555,14 +764,16 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
             InvalidRecord: If the record is invalid.
         """
         if self._validator is not None:
-            # TODO: Check the performance impact of this try/except block. It runs
-            # on every record, so it's probably bad and should be moved up the stack.
-            try:
-                self._validator.validate(record)
-            except InvalidRecord:
-                self.logger.exception("Record validation failed")
-                if self.fail_on_record_validation_exception:
-                    raise
+            if self.validate_records_at_drain:
+                # Timestamps are parsed in place, so keep a copy of the raw record
+                self._records_to_validate.append(record.copy())
+            else:
+                try:
+                    self._validator.validate(record)
+                except InvalidRecord:
+                    self.logger.exception("Record validation failed")
+                    if self.fail_on_record_validation_exception:
+                        raise
 
         self._parse_timestamps_in_record(
             record=record,
@@ -571,6 +782,22 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         )
         return record
 
+    def _validate_pending_records(self) -> None:
+        """Validate the records held back until the sink is drained.
+
+        If any record is invalid and `fail_on_record_validation_exception` is set,
+        the first ``InvalidRecord`` error is raised.
+        """
+        if self._validator is None or not self._records_to_validate:
+            return
+
+        records, self._records_to_validate = self._records_to_validate, []
+        errors = self._validator.validate_batch(records)
+        for error in errors:
+            self.logger.error("Record validation failed", exc_info=error)
+        if errors and self.fail_on_record_validation_exception:
+            raise errors[0]
+
     def _singer_validate_message(self, record: dict) -> None:
         """Ensure record conforms to Singer Spec.
 
@@ -602,44 +829,45 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
         is out of range, repair logic will be driven by the `treatment` input arg:
         MAX, NULL, or ERROR.
 
+        The datelike fields are found once per schema, so only those keys are
+        visited for each record.
+
         Args:
             record: Individual record in the stream.
             schema: TODO
             treatment: TODO
         """
-        for key, value in record.items():
-            additional_properties = schema.get("additionalProperties", False)
-            if key not in schema["properties"]:
-                if (
-                    value is not None
-                    and not additional_properties
-                    and key not in self._warned_missing_fields
-                ):
+        plan = self._timestamp_parsing_plan
+        if plan.schema is not schema:
+            # The schema changed, so the fields to parse have to be found again
+            plan = self._timestamp_parsing_plan = _TimestampParsingPlan.from_schema(
+                schema,
+            )
+
+        if not plan.additional_properties and not record.keys() <= plan.properties:
+            for key in record.keys() - plan.properties:
+                if record[key] is not None and key not in self._warned_missing_fields:
                     self.logger.warning("No schema for record field '%s'", key)
                     self._warned_missing_fields.add(key)
-                continue
 
-            if datelike_type := get_datelike_property_type(schema["properties"][key]):
-                date_val = value
-                try:
-                    if value is not None:
-                        if datelike_type == "time":
-                            date_val = time_fromisoformat(date_val)
-                        elif datelike_type == "date":
-                            date_val = date_fromisoformat(date_val)
-                        else:
-                            date_val = datetime_fromisoformat(date_val)
-                except ValueError as ex:
-                    date_val = handle_invalid_timestamp_in_record(
-                        record,
-                        [key],
-                        date_val,
-                        datelike_type,
-                        ex,
-                        treatment,
-                        self.logger,
-                    )
-                record[key] = date_val
+        for key, datelike_type, parser in plan.datelike_fields:
+            if key not in record:
+                continue
+            date_val = record[key]
+            if date_val is None:
+                continue
+            try:
+                record[key] = parser(date_val)
+            except ValueError as ex:
+                record[key] = handle_invalid_timestamp_in_record(
+                    record,
+                    [key],
+                    date_val,
+                    datelike_type,
+                    ex,
+                    treatment,
+                    self.logger,
+                )
 
     def _after_process_record(self, context: dict) -> None:
         """Perform post-processing and record keeping. Internal hook.
@@ -686,9 +914,12 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
     def start_drain(self) -> dict:
         """Set and return `self._context_draining`.
 
+        Records held back for validation are validated first.
+
         Returns:
             TODO
         """
+        self._validate_pending_records()
         self._context_draining = self._pending_batch or {}
         self._pending_batch = None
         return self._context_draining
@@ -719,6 +950,34 @@ class Sink(metaclass=abc.ABCMeta):  # noqa: PLR0904
                 self._batch_records_read - self._batch_dupe_records_merged,
             )
         self._batch_records_read = 0
+        self._batch_bytes_read = 0
+
+    def _detach_batch(self) -> _DetachedBatch:
+        """Start draining the current batch so that a new batch can start right away.
+
+        The batch counters are handed over to the returned batch and reset.
+
+        Returns:
+            The batch to process.
+        """
+        context = self.start_drain()
+        self._context_draining = None
+        batch = _DetachedBatch(
+            context=context,
+            records_written=self._batch_records_read - self._batch_dupe_records_merged,
+        )
+        self._batch_records_read = 0
+        self._batch_bytes_read = 0
+        return batch
+
+    def _mark_batch_drained(self, batch: _DetachedBatch) -> None:
+        """Update the tallies once a detached batch has been processed.
+
+        Args:
+            batch: The processed batch.
+        """
+        if batch.records_written:
+            self.tally_record_written(batch.records_written)
 
     def activate_version(self, new_version: int) -> None:
         """Bump the active version of the target table.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import logging
 import typing as t
@@ -16,12 +17,19 @@ import sqlalchemy.types
 from sqlalchemy.engine import reflection
 from sqlalchemy.sql import ddl
 
+from singer_sdk import metrics
 from singer_sdk import typing as th
 from singer_sdk.exceptions import ConfigValidationError
 from singer_sdk.helpers._compat import SingerSDKDeprecationWarning, deprecated
+from singer_sdk.helpers._reflection_cache import ReflectionCache
 from singer_sdk.helpers._util import dump_json, load_json
 from singer_sdk.helpers.capabilities import TargetLoadMethods
 from singer_sdk.singerlib import CatalogEntry, MetadataMapping, Schema
+from singer_sdk.sql.loaders import (
+    ExecuteManyBulkLoader,
+    MultiRowValuesBulkLoader,
+    SQLiteBulkLoader,
+)
 
 __all__ = [
     "FullyQualifiedName",
@@ -39,6 +47,8 @@ if t.TYPE_CHECKING:
         ReflectedPrimaryKeyConstraint,
     )
 
+    from singer_sdk.sql.loaders import BulkLoader
+
 
 class FullyQualifiedName(UserString):
     """A fully qualified table name.
@@ -591,6 +601,19 @@ class SQLConnector:  # noqa: PLR0904
     #: a custom mapping for your SQL dialect.
     jsonschema_to_sql_converter: type[JSONSchemaToSQL] = JSONSchemaToSQL
 
+    #: The bulk loader classes this connector can insert records with, in order of
+    #: preference. See :meth:`~singer_sdk.sql.SQLConnector.get_bulk_loader`.
+    bulk_loader_classes: t.Sequence[type[BulkLoader]] = (
+        SQLiteBulkLoader,
+        ExecuteManyBulkLoader,
+        MultiRowValuesBulkLoader,
+    )
+
+    #: Number of seconds the reflected metadata of a table is cached for, or ``None``
+    #: to cache it until the connector changes the table. See
+    #: :meth:`~singer_sdk.sql.SQLConnector.clear_reflection_cache`.
+    reflection_cache_ttl: float | None = None
+
     def __init__(
         self,
         config: dict | None = None,
@@ -604,6 +627,7 @@ class SQLConnector:  # noqa: PLR0904
         """
         self._config: dict[str, t.Any] = config or {}
         self._sqlalchemy_url: str | None = sqlalchemy_url or None
+        self._reflection_cache = ReflectionCache(ttl=self.reflection_cache_ttl)
 
     @property
     def config(self) -> dict:
@@ -646,6 +670,32 @@ class SQLConnector:  # noqa: PLR0904
             max_varchar_length=self.max_varchar_length,
         )
 
+    def get_bulk_loader(self) -> BulkLoader:
+        """Get the loader to insert records in bulk with.
+
+        The loader named by the ``bulk_load_method`` setting is used if set. Otherwise,
+        the first automatic loader of ``bulk_loader_classes`` that supports the
+        dialect is used.
+
+        Returns:
+            A bulk loader.
+
+        Raises:
+            ConfigValidationError: If the configured loader does not support the
+                dialect.
+        """
+        method = self.config.get("bulk_load_method")
+        for loader_class in self.bulk_loader_classes:
+            if not loader_class.is_supported(self._dialect):
+                continue
+            if (loader_class.name == method) if method else loader_class.automatic:
+                return loader_class()
+
+        if method:
+            msg = f"Bulk load method '{method}' is not supported by this connector"
+            raise ConfigValidationError(msg)
+        return ExecuteManyBulkLoader()
+
     @contextmanager
     def _connect(self) -> t.Iterator[sa.Connection]:
         with self._engine.connect().execution_options(stream_results=True) as conn:
@@ -1189,9 +1239,18 @@ class SQLConnector:  # noqa: PLR0904
         Returns:
             True if table exists, False if not, None if unsure or undetectable.
         """
-        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+        key = str(full_table_name)
 
-        return sa.inspect(self._engine).has_table(table_name, schema_name)
+        def has_table() -> bool:
+            _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+            return sa.inspect(self._engine).has_table(table_name, schema_name)
+
+        exists = self._reflection_cache.get(key, "exists", has_table)
+        if not exists:
+            # Don't cache missing tables, which may be created by overridden methods
+            # without clearing the cache
+            self._reflection_cache.invalidate(key)
+        return exists
 
     def schema_exists(self, schema_name: str) -> bool:
         """Determine if the target database schema already exists.
@@ -1219,14 +1278,13 @@ class SQLConnector:  # noqa: PLR0904
         Returns:
             An ordered list of column objects.
         """
-        _, schema_name, table_name = self.parse_full_table_name(full_table_name)
-        inspector = sa.inspect(self._engine)
-        columns = inspector.get_columns(table_name, schema_name)
+        columns = self._reflect_columns(full_table_name)
 
         columns_dict: dict[str, sa.Column] = {
             col_meta["name"]: sa.Column(
                 col_meta["name"],
-                col_meta["type"],
+                # Callers may change the type, e.g. to remove its collation
+                copy.copy(col_meta["type"]),
                 nullable=col_meta.get("nullable", False),
             )
             for col_meta in columns
@@ -1236,6 +1294,66 @@ class SQLConnector:  # noqa: PLR0904
 
         return columns_dict
 
+    def _reflect_columns(
+        self,
+        full_table_name: str | FullyQualifiedName,
+    ) -> list[ReflectedColumn]:
+        """Reflect the columns of a table, or get them from the reflection cache.
+
+        Args:
+            full_table_name: Fully qualified table name.
+
+        Returns:
+            The reflected columns.
+        """
+        key = str(full_table_name)
+
+        def get_columns() -> list[ReflectedColumn]:
+            _, schema_name, table_name = self.parse_full_table_name(full_table_name)
+            columns = sa.inspect(self._engine).get_columns(table_name, schema_name)
+            self._reflection_cache.put(key, "exists", True)  # noqa: FBT003
+            return columns
+
+        return self._reflection_cache.get(key, "columns", get_columns)
+
+    def clear_reflection_cache(
+        self,
+        full_table_name: str | FullyQualifiedName | None = None,
+    ) -> None:
+        """Forget the reflected metadata of a table, or of all tables.
+
+        The connector clears the cache after preparing tables and columns. Call this
+        method after changing tables by other means.
+
+        Args:
+            full_table_name: Fully qualified table name, or `None` for all tables.
+        """
+        self._reflection_cache.invalidate(
+            None if full_table_name is None else str(full_table_name),
+        )
+
+    def log_reflection_cache_metrics(self, logger: logging.Logger) -> None:
+        """Log how many times the reflected metadata of each table was reused.
+
+        Args:
+            logger: The metrics logger.
+        """
+        cache = self._reflection_cache
+        for metric, counts in (
+            (metrics.Metric.SQL_REFLECTION_CACHE_HIT_COUNT, cache.hits),
+            (metrics.Metric.SQL_REFLECTION_CACHE_MISS_COUNT, cache.misses),
+        ):
+            for table, count in counts.items():
+                metrics.log(
+                    logger,
+                    metrics.Point(
+                        "counter",
+                        metric=metric,
+                        value=count,
+                        tags={metrics.Tag.TABLE: table},
+                    ),
+                )
+
     def get_table(
         self,
         full_table_name: str | FullyQualifiedName,
@@ -1402,9 +1520,11 @@ class SQLConnector:  # noqa: PLR0904
                 partition_keys=partition_keys,
                 as_temp_table=as_temp_table,
             )
+            self.clear_reflection_cache(full_table_name)
             return
         if self.config["load_method"] == TargetLoadMethods.OVERWRITE:
             self.get_table(full_table_name=full_table_name).drop(self._engine)
+            self.clear_reflection_cache(full_table_name)
             self.create_empty_table(
                 full_table_name=full_table_name,
                 schema=schema,
@@ -1412,20 +1532,102 @@ class SQLConnector:  # noqa: PLR0904
                 partition_keys=partition_keys,
                 as_temp_table=as_temp_table,
             )
+            self.clear_reflection_cache(full_table_name)
             return
 
-        for property_name, property_def in schema["properties"].items():
-            self.prepare_column(
-                full_table_name,
-                property_name,
-                self.to_sql_type(property_def),
-            )
+        if self._prepares_columns_in_batch():
+            statements = self.get_column_ddl_statements(full_table_name, schema)
+            if statements:
+                with self._connect() as conn, conn.begin():
+                    for statement in statements:
+                        conn.execute(statement)
+                self.clear_reflection_cache(full_table_name)
+        else:
+            for property_name, property_def in schema["properties"].items():
+                self.prepare_column(
+                    full_table_name,
+                    property_name,
+                    self.to_sql_type(property_def),
+                )
+            self.clear_reflection_cache(full_table_name)
 
         self.prepare_primary_key(
             full_table_name=full_table_name,
             primary_keys=primary_keys,
         )
 
+    def _prepares_columns_in_batch(self) -> bool:
+        """Check whether columns can be prepared with batched DDL statements.
+
+        Returns:
+            False if the connector customizes how single columns are prepared.
+        """
+        cls = type(self)
+        return all(
+            getattr(cls, name) is getattr(SQLConnector, name)
+            for name in (
+                "prepare_column",
+                "column_exists",
+                "_create_empty_column",
+                "_adapt_column_type",
+                "_get_column_type",
+            )
+        )
+
+    def get_column_ddl_statements(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        schema: dict,
+    ) -> list[sa.DDL]:
+        """Get the DDL statements that adapt the columns of a table to a schema.
+
+        The table is reflected once, and compared with every property of the schema.
+
+        Args:
+            full_table_name: the target table name.
+            schema: the JSON Schema for the table.
+
+        Returns:
+            The statements that add missing columns and alter column types, in the
+            order of the schema properties.
+
+        Raises:
+            NotImplementedError: if a column is missing and adding columns is not
+                supported.
+        """
+        columns = self.get_table_columns(full_table_name)
+        statements: list[sa.DDL] = []
+        for property_name, property_def in schema["properties"].items():
+            sql_type = self.to_sql_type(property_def)
+            if property_name not in columns:
+                if not self.allow_column_add:
+                    msg = "Adding columns is not supported."
+                    raise NotImplementedError(msg)
+                statements.append(
+                    self.get_column_add_ddl(
+                        table_name=full_table_name,
+                        column_name=property_name,
+                        column_type=sql_type,
+                    ),
+                )
+                continue
+
+            new_type = self._get_column_type_change(
+                full_table_name,
+                property_name,
+                current_type=columns[property_name].type,
+                sql_type=sql_type,
+            )
+            if new_type is not None:
+                statements.append(
+                    self.get_column_alter_ddl(
+                        table_name=full_table_name,
+                        column_name=property_name,
+                        column_type=new_type,
+                    ),
+                )
+        return statements
+
     def prepare_primary_key(
         self,
         *,
@@ -1462,13 +1664,13 @@ class SQLConnector:  # noqa: PLR0904
                 column_name=column_name,
                 sql_type=sql_type,
             )
-            return
-
-        self._adapt_column_type(
-            full_table_name,
-            column_name=column_name,
-            sql_type=sql_type,
-        )
+        else:
+            self._adapt_column_type(
+                full_table_name,
+                column_name=column_name,
+                sql_type=sql_type,
+            )
+        self.clear_reflection_cache(full_table_name)
 
     def rename_column(
         self, full_table_name: str | FullyQualifiedName, old_name: str, new_name: str
@@ -1494,6 +1696,7 @@ class SQLConnector:  # noqa: PLR0904
         )
         with self._connect() as conn, conn.begin():
             conn.execute(column_rename_ddl)
+        self.clear_reflection_cache(full_table_name)
 
     def merge_sql_types(
         self,
@@ -1756,15 +1959,51 @@ class SQLConnector:  # noqa: PLR0904
             full_table_name: The target table name.
             column_name: The target column name.
             sql_type: The new SQLAlchemy type.
-
-        Raises:
-            NotImplementedError: if altering columns is not supported.
         """
         current_type: sqlalchemy.types.TypeEngine = self._get_column_type(
             full_table_name,
             column_name,
         )
+        compatible_sql_type = self._get_column_type_change(
+            full_table_name,
+            column_name,
+            current_type=current_type,
+            sql_type=sql_type,
+        )
+        if compatible_sql_type is None:
+            return
+
+        alter_column_ddl = self.get_column_alter_ddl(
+            table_name=full_table_name,
+            column_name=column_name,
+            column_type=compatible_sql_type,
+        )
+        with self._connect() as conn, conn.begin():
+            conn.execute(alter_column_ddl)
+
+    def _get_column_type_change(
+        self,
+        full_table_name: str | FullyQualifiedName,
+        column_name: str,
+        *,
+        current_type: sqlalchemy.types.TypeEngine,
+        sql_type: sqlalchemy.types.TypeEngine,
+    ) -> sqlalchemy.types.TypeEngine | None:
+        """Get the type a column must be altered to, to support a new type.
+
+        Args:
+            full_table_name: The target table name.
+            column_name: The target column name.
+            current_type: The current SQLAlchemy type of the column.
+            sql_type: The new SQLAlchemy type.
 
+        Returns:
+            The type to alter the column to, or `None` if the column supports the new
+            type.
+
+        Raises:
+            NotImplementedError: if altering columns is not supported.
+        """
         # remove collation if present and save it
         current_type_collation = self.remove_collation(current_type)
 
@@ -1772,7 +2011,7 @@ class SQLConnector:  # noqa: PLR0904
         if str(sql_type) == str(current_type):
             # The current column and sql type are the same
             # Nothing to do
-            return
+            return None
 
         # Not the same type, generic type or compatible types
         # calling merge_sql_types for assistnace
@@ -1780,7 +2019,7 @@ class SQLConnector:  # noqa: PLR0904
 
         if str(compatible_sql_type) == str(current_type):
             # Nothing to do
-            return
+            return None
 
         # Put the collation level back before altering the column
         if current_type_collation:
@@ -1794,13 +2033,7 @@ class SQLConnector:  # noqa: PLR0904
             )
             raise NotImplementedError(msg)
 
-        alter_column_ddl = self.get_column_alter_ddl(
-            table_name=full_table_name,
-            column_name=column_name,
-            column_type=compatible_sql_type,
-        )
-        with self._connect() as conn, conn.begin():
-            conn.execute(alter_column_ddl)
+        return compatible_sql_type
 
     def serialize_json(self, obj: object) -> str:  # noqa: PLR6301
         """Serialize an object to a JSON string.
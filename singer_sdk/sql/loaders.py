@@ -0,0 +1,348 @@
+"""Strategies to insert records into SQL tables in bulk."""
+
+from __future__ import annotations
+
+import abc
+import datetime
+import itertools
+import json
+import tempfile
+import typing as t
+
+import sqlalchemy as sa
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from sqlalchemy.engine.interfaces import Dialect
+    from sqlalchemy.sql import Executable
+
+__all__ = [
+    "BulkLoader",
+    "ExecuteManyBulkLoader",
+    "MultiRowValuesBulkLoader",
+    "SQLiteBulkLoader",
+    "StagedFileBulkLoader",
+]
+
+# Characters escaped in the PostgreSQL text format, also read by most COPY commands
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _chunks(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    """Split rows into lists of at most a given size.
+
+    Args:
+        rows: The rows.
+        size: Maximum number of rows in each list.
+
+    Yields:
+        Lists of rows.
+    """
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class BulkLoader(abc.ABC):
+    """Inserts rows into a table in bulk.
+
+    Loaders receive the rows of a batch as tuples of values, in the order of the
+    columns of the insert statement. Rows are produced as they are consumed, so
+    loaders that send them in chunks only hold one chunk of rows in memory.
+    """
+
+    name: t.ClassVar[str]
+    """Name of the loader, as used in the ``bulk_load_method`` setting."""
+
+    automatic: t.ClassVar[bool] = True
+    """Whether the loader may be used without being named in the settings."""
+
+    chunk_size: int = 10_000
+    """Number of rows sent to the database at a time."""
+
+    @classmethod
+    def is_supported(cls, dialect: Dialect) -> bool:  # noqa: ARG003
+        """Check whether the loader can be used with a database.
+
+        Args:
+            dialect: The SQLAlchemy dialect of the database.
+
+        Returns:
+            True if the loader supports the dialect.
+        """
+        return True
+
+    @abc.abstractmethod
+    def load(
+        self,
+        conn: sa.Connection,
+        statement: Executable,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> int | None:
+        """Insert rows into a table.
+
+        Args:
+            conn: A connection with an open transaction.
+            statement: The insert statement of the table.
+            columns: The column names, in the order of the values of each row.
+            rows: The rows to insert.
+
+        Returns:
+            The number of rows inserted, if the database reports it.
+        """
+
+
+class ExecuteManyBulkLoader(BulkLoader):
+    """Executes the insert statement once for each chunk of rows.
+
+    Rows are passed to the DBAPI ``executemany`` method, or batched into multi-row
+    statements by SQLAlchemy for dialects that support "insertmanyvalues".
+    """
+
+    name = "executemany"
+
+    def load(
+        self,
+        conn: sa.Connection,
+        statement: Executable,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> int | None:
+        """Insert rows with one ``executemany`` call for each chunk.
+
+        Args:
+            conn: A connection with an open transaction.
+            statement: The insert statement of the table.
+            columns: The column names, in the order of the values of each row.
+            rows: The rows to insert.
+
+        Returns:
+            The number of rows inserted, if the database reports it.
+        """
+        count: int | None = 0
+        for chunk in _chunks(rows, self.chunk_size):
+            result = conn.execute(
+                statement,
+                [dict(zip(columns, row, strict=True)) for row in chunk],
+            )
+            if count is not None:
+                count = count + result.rowcount if result.rowcount >= 0 else None
+        return count
+
+
+class MultiRowValuesBulkLoader(BulkLoader):
+    """Inserts each chunk of rows with a single ``INSERT ... VALUES`` statement."""
+
+    name = "values"
+    automatic = False
+
+    max_parameters: int = 32_766
+    """Maximum number of bound parameters in a statement.
+
+    Lower it for databases with a lower limit, such as SQL Server (2,100).
+    """
+
+    def load(
+        self,
+        conn: sa.Connection,
+        statement: Executable,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> int | None:
+        """Insert rows with one multi-row statement for each chunk.
+
+        Args:
+            conn: A connection with an open transaction.
+            statement: The insert statement of the table.
+            columns: The column names, in the order of the values of each row.
+            rows: The rows to insert.
+
+        Returns:
+            The number of rows inserted.
+
+        Raises:
+            TypeError: If the statement is not an insert statement.
+        """
+        if not isinstance(statement, sa.Insert):  # pragma: no cover
+            msg = "Multi-row VALUES inserts require an SQLAlchemy Insert statement"
+            raise TypeError(msg)
+
+        size = max(1, min(self.chunk_size, self.max_parameters // max(len(columns), 1)))
+        count = 0
+        for chunk in _chunks(rows, size):
+            conn.execute(
+                statement.values(
+                    [dict(zip(columns, row, strict=True)) for row in chunk],
+                ),
+            )
+            count += len(chunk)
+        return count
+
+
+class SQLiteBulkLoader(BulkLoader):
+    """Passes the rows straight to the ``executemany`` method of the SQLite driver.
+
+    The driver reads the rows as they are produced, without building a parameter
+    dict for each row.
+    """
+
+    name = "sqlite"
+
+    @classmethod
+    def is_supported(cls, dialect: Dialect) -> bool:
+        """Check whether the database is SQLite.
+
+        Args:
+            dialect: The SQLAlchemy dialect of the database.
+
+        Returns:
+            True for SQLite databases.
+        """
+        return dialect.name == "sqlite"
+
+    def load(  # noqa: PLR6301
+        self,
+        conn: sa.Connection,
+        statement: Executable,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> int | None:
+        """Insert rows with the ``executemany`` method of the SQLite cursor.
+
+        Args:
+            conn: A connection with an open transaction.
+            statement: The insert statement of the table.
+            columns: The column names, in the order of the values of each row.
+            rows: The rows to insert.
+
+        Returns:
+            The number of rows inserted, if the database reports it.
+
+        Raises:
+            TypeError: If the statement is not an insert statement.
+        """
+        if not isinstance(statement, sa.Insert):  # pragma: no cover
+            msg = "SQLite bulk inserts require an SQLAlchemy Insert statement"
+            raise TypeError(msg)
+
+        preparer = conn.dialect.identifier_preparer
+        sql = "INSERT INTO {} ({}) VALUES ({})".format(  # noqa: S608
+            preparer.format_table(statement.table),
+            ", ".join(preparer.quote(column) for column in columns),
+            ", ".join("?" for _ in columns),
+        )
+        cursor = conn.connection.cursor()
+        try:
+            # The sqlite3 module reads the rows from any iterable
+            cursor.executemany(sql, rows)  # type: ignore[arg-type]
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+
+class StagedFileBulkLoader(BulkLoader):
+    r"""Writes the rows to a file, then loads the file with a native bulk command.
+
+    Rows are written in the tab-separated text format of PostgreSQL's ``COPY``:
+    ``\N`` stands for null, and backslashes, tabs and line breaks in values are
+    escaped with a backslash. The file is held in memory up to ``spool_size`` bytes,
+    and on disk beyond that.
+
+    Subclasses implement :meth:`copy_file` with the command of their database, for
+    example ``COPY ... FROM STDIN`` or a stage upload followed by ``COPY INTO``.
+    """
+
+    automatic = False
+
+    spool_size: int = 64 * 1024 * 1024
+    """Size of the file held in memory before it is written to disk."""
+
+    @staticmethod
+    def format_value(value: t.Any) -> str:  # noqa: ANN401
+        """Format a value for the staged file.
+
+        Args:
+            value: A value of a row.
+
+        Returns:
+            The escaped text of the value.
+        """
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            text = "true" if value else "false"
+        elif isinstance(value, (dict, list)):
+            text = json.dumps(value, default=str)
+        elif isinstance(value, (datetime.date, datetime.time)):
+            text = value.isoformat()
+        else:
+            text = str(value)
+        return text.translate(_TEXT_ESCAPES)
+
+    def write_rows(self, file: t.IO[bytes], rows: Iterable[tuple]) -> int:
+        """Write rows to the staged file.
+
+        Args:
+            file: A binary file.
+            rows: The rows to write.
+
+        Returns:
+            The number of rows written.
+        """
+        count = 0
+        format_value = self.format_value
+        for chunk in _chunks(rows, self.chunk_size):
+            lines = ("\t".join(map(format_value, row)) + "\n" for row in chunk)
+            file.write("".join(lines).encode())
+            count += len(chunk)
+        return count
+
+    def load(
+        self,
+        conn: sa.Connection,
+        statement: Executable,
+        columns: Sequence[str],
+        rows: Iterable[tuple],
+    ) -> int | None:
+        """Write rows to a staged file and load it.
+
+        Args:
+            conn: A connection with an open transaction.
+            statement: The insert statement of the table.
+            columns: The column names, in the order of the values of each row.
+            rows: The rows to insert.
+
+        Returns:
+            The number of rows inserted.
+
+        Raises:
+            TypeError: If the statement is not an insert statement.
+        """
+        if not isinstance(statement, sa.Insert):  # pragma: no cover
+            msg = "Staged file loads require an SQLAlchemy Insert statement"
+            raise TypeError(msg)
+
+        with tempfile.SpooledTemporaryFile(max_size=self.spool_size) as file:
+            count = self.write_rows(file, rows)
+            file.seek(0)
+            self.copy_file(conn, statement.table, columns, file)  # type: ignore[arg-type]
+        return count
+
+    @abc.abstractmethod
+    def copy_file(
+        self,
+        conn: sa.Connection,
+        table: sa.Table,
+        columns: Sequence[str],
+        file: t.IO[bytes],
+    ) -> None:
+        """Load the staged file into a table.
+
+        Args:
+            conn: A connection with an open transaction.
+            table: The table to load.
+            columns: The column names, in the order of the values of each line.
+            file: The staged file, positioned at its start.
+        """
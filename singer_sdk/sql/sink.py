@@ -18,6 +18,7 @@ from singer_sdk.helpers._conformers import replace_leading_digit
 from singer_sdk.helpers._util import utc_now
 from singer_sdk.sinks.batch import BatchSink
 from singer_sdk.sql.connector import SQLConnector
+from singer_sdk.sql.loaders import ExecuteManyBulkLoader
 
 if t.TYPE_CHECKING:
     from sqlalchemy.sql import Executable
@@ -29,6 +30,12 @@ __all__ = ["SQLSink"]
 
 _C = t.TypeVar("_C", bound=SQLConnector)
 
+# Stands for a property missing from a record
+_MISSING = object()
+
+# Number of distinct sets of record keys to remember the conformed names of
+_MAX_CACHED_KEY_SETS = 1000
+
 
 class SQLSink(BatchSink, t.Generic[_C]):
     """SQL-type sink type."""
@@ -320,9 +327,11 @@ class SQLSink(BatchSink, t.Generic[_C]):
     ) -> int | None:
         """Bulk insert records to an existing destination table.
 
-        The default implementation uses a generic SQLAlchemy bulk insert operation.
-        This method may optionally be overridden by developers in order to provide
-        faster, native bulk uploads.
+        Records are converted to rows one at a time, and inserted by the loader from
+        :meth:`~singer_sdk.sql.SQLConnector.get_bulk_loader`, or with ``executemany``
+        if the insert statement is not an SQLAlchemy ``Insert``. This method may
+        optionally be overridden by developers in order to provide faster, native bulk
+        uploads.
 
         Args:
             full_table_name: the target table name.
@@ -346,21 +355,61 @@ class SQLSink(BatchSink, t.Generic[_C]):
             )
             insert_sql = sa.text(insert_sql)
 
-        conformed_records = [self.conform_record(record) for record in records]
         property_names = list(self.conform_schema(schema)["properties"].keys())
-
-        # Create new record dicts with missing properties filled in with None
-        new_records = [
-            {name: record.get(name) for name in property_names}
-            for record in conformed_records
-        ]
+        loader = (
+            self.connector.get_bulk_loader()
+            if isinstance(insert_sql, sa.Insert)
+            else ExecuteManyBulkLoader()
+        )
 
         self.logger.info("Inserting with SQL: %s", insert_sql)
+        self.logger.debug("Inserting with the '%s' bulk loader", loader.name)
 
         with self.connector._connect() as conn, conn.begin():  # noqa: SLF001
-            result = conn.execute(insert_sql, new_records)
+            return loader.load(
+                conn,
+                insert_sql,
+                property_names,
+                self._iter_rows(records, property_names),
+            )
+
+    def _iter_rows(
+        self,
+        records: t.Iterable[dict[str, t.Any]],
+        property_names: t.Sequence[str],
+    ) -> t.Iterator[tuple]:
+        """Convert records to rows of values, one record at a time.
+
+        Properties missing from a record are null. Unless ``conform_record`` is
+        overridden, property names are only conformed once for each set of record
+        keys, rather than for every record.
+
+        Args:
+            records: The input records.
+            property_names: The conformed property names, in the order of the columns.
+
+        Yields:
+            A tuple of values for each record.
+        """
+        if type(self).conform_record is not SQLSink.conform_record:
+            for record in records:
+                conformed = self.conform_record(record)
+                yield tuple(conformed.get(name) for name in property_names)
+            return
 
-        return result.rowcount
+        # Record keys to use for each column, by set of record keys
+        sources: dict[tuple[str, ...], list[t.Any]] = {}
+        for record in records:
+            keys = tuple(record)
+            if (source := sources.get(keys)) is None:
+                if len(sources) >= _MAX_CACHED_KEY_SETS:
+                    sources.clear()
+                conformed_keys = self.conform_record(dict.fromkeys(keys))
+                conformed = dict(zip(conformed_keys, keys, strict=True))
+                source = sources[keys] = [
+                    conformed.get(name, _MISSING) for name in property_names
+                ]
+            yield tuple(record.get(key) for key in source)
 
     def merge_upsert_from_table(
         self,
@@ -407,6 +456,7 @@ class SQLSink(BatchSink, t.Generic[_C]):
                 self.version_column_name,
                 sql_type=sa.Integer(),
             )
+            self.connector.clear_reflection_cache(self.full_table_name)
 
         if self.config.get("hard_delete", False):
             self.connector.delete_old_versions(
@@ -425,6 +475,7 @@ class SQLSink(BatchSink, t.Generic[_C]):
                 self.soft_delete_column_name,
                 sql_type=sa.DateTime(),
             )
+            self.connector.clear_reflection_cache(self.full_table_name)
 
         query = sa.text(
             f"UPDATE {self.full_table_name}\n"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import abc
+import datetime
 import typing as t
 from functools import cached_property
 
@@ -23,6 +24,27 @@ if t.TYPE_CHECKING:
 
 __all__ = ["SQLStream"]
 
+# Context key naming the column of a key range partition
+_PARTITION_KEY = "partition_key"
+
+
+def _parse_bound(column: sa.Column, value: t.Any) -> t.Any:  # noqa: ANN401
+    """Parse a key range bound read back from the state.
+
+    Args:
+        column: The column of the key range.
+        value: The bound.
+
+    Returns:
+        The bound, as a date or datetime for date and datetime columns.
+    """
+    if isinstance(value, str):
+        if isinstance(column.type, sa.DateTime):
+            return datetime.datetime.fromisoformat(value)
+        if isinstance(column.type, sa.Date):
+            return datetime.date.fromisoformat(value)
+    return value
+
 
 class SQLStream(Stream, metaclass=abc.ABCMeta):
     """Base class for SQLAlchemy-based streams."""
@@ -33,6 +55,39 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
     supports_nulls_first: bool = False
     """Whether the database supports the NULLS FIRST/LAST syntax."""
 
+    fetch_size: int | None = None
+    """Number of rows to fetch from the database at a time.
+
+    When set, results are read with a server-side cursor in batches of this size, so
+    that memory use does not grow with the size of the table. Overridden by the
+    ``fetch_size`` setting of the tap. When unset, the dialect's default buffering is
+    used.
+    """
+
+    partition_count: int = 1
+    """Number of key ranges to split the table into.
+
+    When greater than 1, the table is split into ranges of ``partition_key`` values,
+    each read with its own query and with its own state. Set
+    ``max_parallel_partitions`` to read several ranges at the same time.
+    """
+
+    partition_key: str | None = None
+    """Column to split the table by.
+
+    Defaults to the replication key, or to the primary key if it has a single column.
+    """
+
+    partition_method: t.Literal["minmax", "quantiles"] | None = None
+    """How to choose the bounds of the key ranges.
+
+    ``"minmax"`` splits the values between the smallest and the largest key into
+    ranges of the same width, and only supports numeric keys. ``"quantiles"`` splits
+    the table into ranges of about the same number of rows, at the cost of scanning
+    the key column. Defaults to ``"minmax"`` for numeric keys, and to ``"quantiles"``
+    otherwise.
+    """
+
     def __init__(
         self,
         tap: Tap,
@@ -202,9 +257,50 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
             query = query.order_by(order_by)
 
             start_val = self.get_starting_replication_key_value(context)
+            if (
+                start_val is None
+                and context
+                and _PARTITION_KEY in context
+                and self.stream_state.get("replication_key") == self.replication_key
+            ):
+                # Resume new key ranges from the bookmark of an unpartitioned sync
+                start_val = self.stream_state.get("replication_key_value")
             if start_val is not None:
                 query = query.where(column >= start_val)
 
+        if context and _PARTITION_KEY in context:
+            query = self._apply_key_range(query, table, context)
+
+        return query
+
+    @staticmethod
+    def _apply_key_range(
+        query: selectable.Select,
+        table: sa.Table,
+        context: Context,
+    ) -> selectable.Select:
+        """Filter the query to the key range of a partition.
+
+        The first range also holds the rows with a null key.
+
+        Args:
+            query: The SQLAlchemy Select object.
+            table: The SQLAlchemy Table object.
+            context: A key range partition.
+
+        Returns:
+            A SQLAlchemy Select object.
+        """
+        column = table.columns[context[_PARTITION_KEY]]
+        start = _parse_bound(column, context.get("start"))
+        end = _parse_bound(column, context.get("end"))
+        if start is not None:
+            query = query.where(column >= start)
+        if end is not None:
+            condition = column < end
+            query = query.where(
+                condition if start is not None else sa.or_(condition, column.is_(None))
+            )
         return query
 
     def apply_query_limit(self, query: selectable.Select) -> selectable.Select:
@@ -273,14 +369,100 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
             NotImplementedError: If partition is passed in context and the stream does
                 not support partitioning.
         """
-        if context:  # pragma: no cover
+        if context and _PARTITION_KEY not in context:  # pragma: no cover
             msg = f"Stream '{self.name}' does not support partitioning."
             raise NotImplementedError(msg)
 
+        query = self.build_query(context=context)
+        if fetch_size := self.config.get("fetch_size") or self.fetch_size:
+            query = query.execution_options(stream_results=True, yield_per=fetch_size)
+
+        with self.connector._connect() as conn:  # noqa: SLF001
+            result = conn.execute(query)
+            # Building dicts from the column names and row tuples is faster than
+            # converting each row mapping
+            # https://github.com/sqlalchemy/sqlalchemy/discussions/10053#discussioncomment-6344965
+            keys = tuple(result.keys())
+            for row in result:
+                yield dict(zip(keys, row, strict=False))
+
+    @property
+    def partitions(self) -> list[dict] | None:
+        """Get the key ranges to read the table in, if it is split.
+
+        When ``partition_count`` is greater than 1, the key ranges of the previous
+        sync are reused from the state, so that each range resumes from its own
+        bookmark. Otherwise, the table is split into new ranges.
+
+        Returns:
+            A list of key range dicts, or the partitions in the state.
+        """
+        partitions = super().partitions
+        key = self.partition_key or self.replication_key
+        if key is None and len(self.primary_keys) == 1:
+            key = self.primary_keys[0]
+        if self.partition_count < 2 or key is None:  # noqa: PLR2004
+            return partitions
+
+        if partitions and all(
+            partition.get(_PARTITION_KEY) == key for partition in partitions
+        ):
+            return partitions
+
+        table = self.connector.get_table(
+            full_table_name=self.fully_qualified_name,
+            column_names=[key],
+        )
+        bounds = self.get_partition_bounds(table.columns[key])
+        return [
+            {_PARTITION_KEY: key, "start": start, "end": end}
+            for start, end in zip([None, *bounds], [*bounds, None], strict=True)
+        ]
+
+    def get_partition_bounds(self, column: sa.Column) -> list[t.Any]:
+        """Get the values that split the table into key ranges.
+
+        Args:
+            column: The column to split the table by.
+
+        Returns:
+            The sorted, distinct values that start each key range after the first.
+        """
+        count = self.partition_count
+        method = self.partition_method or (
+            "minmax"
+            if isinstance(column.type, (sa.Integer, sa.Numeric))
+            else "quantiles"
+        )
         with self.connector._connect() as conn:  # noqa: SLF001
-            for row in conn.execute(self.build_query(context=context)).mappings():
-                # https://github.com/sqlalchemy/sqlalchemy/discussions/10053#discussioncomment-6344965
-                yield dict(row)
+            if method == "minmax":
+                low, high = conn.execute(
+                    sa.select(sa.func.min(column), sa.func.max(column))
+                ).one()
+                if low is None:
+                    return []
+                if isinstance(low, int) and isinstance(high, int):
+                    bounds = [low + (high - low) * i // count for i in range(1, count)]
+                else:
+                    bounds = [low + (high - low) * i / count for i in range(1, count)]
+                # The first range would be empty
+                bounds = [bound for bound in bounds if bound > low]
+            else:
+                bucket = sa.func.ntile(count).over(order_by=column).label("bucket")
+                ranked = (
+                    sa.select(column.label("key"), bucket)
+                    .where(column.is_not(None))
+                    .subquery()
+                )
+                bounds = list(
+                    conn.execute(
+                        sa.select(sa.func.min(ranked.c.key))
+                        .group_by(ranked.c.bucket)
+                        .order_by(ranked.c.bucket)
+                        .offset(1)
+                    ).scalars()
+                )
+        return sorted(set(bounds))
 
     @property
     def is_sorted(self) -> bool:
@@ -5,7 +5,10 @@ from __future__ import annotations
 import typing as t
 
 from singer_sdk.configuration._dict_config import merge_missing_config_jsonschema
-from singer_sdk.helpers.capabilities import SQL_TAP_USE_SINGER_DECIMAL
+from singer_sdk.helpers.capabilities import (
+    SQL_TAP_FETCH_SIZE_CONFIG,
+    SQL_TAP_USE_SINGER_DECIMAL,
+)
 from singer_sdk.tap_base import Tap
 
 if t.TYPE_CHECKING:
@@ -57,8 +60,18 @@ class SQLTap(Tap):
             config_jsonschema: [description]
         """
         merge_missing_config_jsonschema(SQL_TAP_USE_SINGER_DECIMAL, config_jsonschema)
+        merge_missing_config_jsonschema(SQL_TAP_FETCH_SIZE_CONFIG, config_jsonschema)
         super().append_builtin_config(config_jsonschema)
 
+    def _log_sync_metrics(self) -> None:
+        """Log the metrics collected over the sync of all streams.
+
+        Also log the hits and misses of the reflection cache of the connector, by table.
+        """
+        super()._log_sync_metrics()
+        if self._tap_connector is not None:
+            self._tap_connector.log_reflection_cache_metrics(self.metrics_logger)
+
     @property
     def tap_connector(self) -> SQLConnector:
         """The connector object.
@@ -5,6 +5,7 @@ from __future__ import annotations
 import typing as t
 
 from singer_sdk.helpers.capabilities import (
+    TARGET_BULK_LOAD_METHOD_CONFIG,
     TARGET_HARD_DELETE_CONFIG,
     TARGET_SCHEMA_CONFIG,
     PluginCapabilities,
@@ -80,8 +81,19 @@ class SQLTarget(Target):
         if TargetCapabilities.HARD_DELETE in capabilities:
             _merge_missing(TARGET_HARD_DELETE_CONFIG, config_jsonschema)
 
+        _merge_missing(TARGET_BULK_LOAD_METHOD_CONFIG, config_jsonschema)
+
         super().append_builtin_config(config_jsonschema)
 
+    def process_endofpipe(self) -> None:
+        """Called after all input lines have been read.
+
+        Also log the hits and misses of the reflection cache of the connector, by table.
+        """
+        super().process_endofpipe()
+        if self._target_connector is not None:
+            self._target_connector.log_reflection_cache_metrics(self.metrics_logger)
+
     @t.final
     def add_sqlsink(
         self,
@@ -0,0 +1,377 @@
+"""Abstract base class for API-type streams that send requests concurrently."""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, contextmanager
+from dataclasses import dataclass
+
+from singer_sdk.helpers._concurrency import PagePrefetcher
+from singer_sdk.pagination import SinglePagePaginator
+from singer_sdk.streams.rest import RESTStream
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
+
+    import requests
+
+    from singer_sdk.helpers._rate_limit import RateLimiter
+    from singer_sdk.helpers.types import Context
+    from singer_sdk.singerlib import Schema
+    from singer_sdk.tap_base import Tap
+
+_TToken = t.TypeVar("_TToken")
+
+_DONE = object()
+_RATE_LIMIT_POLL_INTERVAL = 0.01
+
+
+@dataclass(frozen=True)
+class _PageError:
+    """An error raised while requesting a page."""
+
+    error: BaseException
+
+
+class _EventLoopThread:
+    """An event loop that runs in a background thread while it is in use."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self.semaphore: asyncio.Semaphore | None = None
+        self._lock = threading.Lock()
+        self._users = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @contextmanager
+    def running(self) -> Iterator[asyncio.AbstractEventLoop]:
+        """Start the event loop, unless it is already running.
+
+        The event loop is stopped once no thread uses it anymore.
+
+        Yields:
+            The running event loop.
+        """
+        with self._lock:
+            if self._users == 0:
+                self._start()
+            self._users += 1
+            loop = t.cast("asyncio.AbstractEventLoop", self._loop)
+        try:
+            yield loop
+        finally:
+            with self._lock:
+                self._users -= 1
+                if self._users == 0:
+                    self._stop(loop)
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"{self.name}-request",
+            )
+        )
+        self.semaphore = asyncio.Semaphore(self.max_workers)
+        self._thread = threading.Thread(
+            target=loop.run_forever,
+            name=f"{self.name}-event-loop",
+            daemon=True,
+        )
+        self._loop = loop
+        self._thread.start()
+
+    def _stop(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(loop), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        t.cast("threading.Thread", self._thread).join()
+        loop.close()
+        self._loop = self._thread = self.semaphore = None
+
+    @staticmethod
+    async def _shutdown(loop: asyncio.AbstractEventLoop) -> None:
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await loop.shutdown_asyncgens()
+        await loop.shutdown_default_executor()
+
+
+class AsyncRESTStream(RESTStream, t.Generic[_TToken], metaclass=abc.ABCMeta):
+    """Abstract base class for REST API streams that send requests concurrently.
+
+    Requests are sent from an asyncio event loop that runs in a background thread,
+    while records are handed over to the sync through a bounded queue of pages. For
+    paginators that can predict their next tokens, such as page number and offset
+    paginators, up to :attr:`max_concurrent_requests` pages are requested at once and
+    their records are still returned in page order.
+
+    Partitions can be fetched concurrently as well, by setting
+    :attr:`~singer_sdk.Stream.max_parallel_partitions`. Their requests share the same
+    event loop and :attr:`max_concurrent_requests` limit.
+    """
+
+    max_concurrent_requests: int = 4
+    """Number of requests of this stream to keep in flight."""
+
+    max_buffered_pages: int = 4
+    """Number of parsed pages to hold for each context before requests are paused."""
+
+    def __init__(
+        self,
+        tap: Tap,
+        name: str | None = None,
+        schema: dict[str, t.Any] | Schema | None = None,
+        path: str | None = None,
+        *,
+        http_method: str | None = None,
+    ) -> None:
+        """Initialize the REST stream.
+
+        Args:
+            tap: Singer Tap this stream belongs to.
+            schema: JSON schema for records in this stream.
+            name: Name of this stream.
+            path: URL path for this entity stream.
+            http_method: HTTP method to use for requests
+        """
+        super().__init__(tap, name, schema, path, http_method=http_method)
+        self._event_loop_thread = _EventLoopThread(
+            self.name,
+            max_workers=self.max_concurrent_requests,
+        )
+
+    async def authenticate_request(
+        self,
+        prepared_request: requests.PreparedRequest,
+    ) -> requests.PreparedRequest:
+        """Authenticate a request.
+
+        By default, the stream's authenticator is called in a worker thread, since it
+        may need to request an access token.
+
+        Args:
+            prepared_request: The request to authenticate.
+
+        Returns:
+            The authenticated request.
+        """
+        return await asyncio.to_thread(self.authenticator, prepared_request)
+
+    async def send_request(
+        self,
+        prepared_request: requests.PreparedRequest,
+    ) -> requests.Response:
+        """Send an authenticated request.
+
+        By default, the request is sent with
+        :attr:`~singer_sdk.RESTStream.requests_session` from a worker thread.
+        Developers may override this method to send requests with an async HTTP
+        client instead.
+
+        Args:
+            prepared_request: The authenticated request.
+
+        Returns:
+            The response.
+        """
+        return await asyncio.to_thread(
+            self.requests_session.send,
+            prepared_request,
+            timeout=self.timeout,
+            allow_redirects=self.allow_redirects,
+        )
+
+    async def _request_async(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        """Authenticate and send a request, then validate the response.
+
+        Args:
+            prepared_request: The request to send.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The validated response.
+        """
+        # The cache key is computed before the authenticator changes the request
+        cache_key, cached = self._get_cached_response(prepared_request)
+        authenticated_request = await self.authenticate_request(prepared_request)
+        if cached is not None:
+            authenticated_request.headers.update(cached.conditional_headers)
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            waited = await self._acquire_rate_limit(rate_limiter)
+            self._write_request_wait_log(self.path, waited, context)
+        try:
+            response = await self.send_request(authenticated_request)
+        finally:
+            if rate_limiter is not None:
+                rate_limiter.release()
+        if rate_limiter is not None:
+            self._update_rate_limit(rate_limiter, response, context)
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": authenticated_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        response = self._use_response_cache(cache_key, response, cached)
+        self.validate_response(response)
+        return response
+
+    async def _acquire_rate_limit(self, rate_limiter: RateLimiter) -> float:
+        """Wait until the rate limiter lets a request through, without blocking.
+
+        Args:
+            rate_limiter: The rate limiter of the tap.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        waited = 0.0
+        if rate_limiter.concurrency and not rate_limiter.concurrency.try_acquire():
+            start = time.perf_counter()
+            while not rate_limiter.concurrency.try_acquire():
+                await asyncio.sleep(_RATE_LIMIT_POLL_INTERVAL)
+            waited = time.perf_counter() - start
+        if (delay := rate_limiter.reserve(self.path)) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request records from REST endpoint(s), returning response records.
+
+        Pages are requested by the event loop and handed over in order.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            An item for every record in the response.
+        """
+        with self._event_loop_thread.running() as loop:
+            pages: asyncio.Queue[t.Any] = asyncio.Queue(maxsize=self.max_buffered_pages)
+            producer = asyncio.run_coroutine_threadsafe(
+                self._produce_pages(context, pages),
+                loop,
+            )
+            try:
+                while True:
+                    page = asyncio.run_coroutine_threadsafe(pages.get(), loop).result()
+                    if page is _DONE:
+                        break
+                    if isinstance(page, _PageError):
+                        raise page.error
+                    yield from page
+            finally:
+                producer.cancel()
+
+    async def _produce_pages(
+        self,
+        context: Context | None,
+        pages: asyncio.Queue[t.Any],
+    ) -> None:
+        """Put the records of each page on a queue.
+
+        Args:
+            context: Stream partition or context dictionary.
+            pages: The queue of pages.
+        """
+        try:
+            async with aclosing(self._request_pages(context)) as page_iterator:
+                async for page in page_iterator:
+                    await pages.put(page)
+        except Exception as e:  # noqa: BLE001
+            await pages.put(_PageError(e))
+        else:
+            await pages.put(_DONE)
+
+    async def _request_pages(
+        self,
+        context: Context | None,
+    ) -> AsyncGenerator[list[dict], None]:
+        """Request the pages of a context, several at a time if possible.
+
+        Requests are sent ahead for the tokens predicted by the paginator. Once a
+        response arrives, the predicted token is checked against the paginator, and
+        the requests sent ahead are discarded if they differ or pagination stops.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            The records of each page.
+        """
+        paginator = self.get_new_paginator() or SinglePagePaginator()
+        decorated_request: Callable[..., Awaitable[requests.Response]] = (
+            self.request_decorator(self._request_async)  # type: ignore[arg-type,assignment]
+        )
+        semaphore = t.cast("asyncio.Semaphore", self._event_loop_thread.semaphore)
+        pages = 0
+
+        async def send(
+            token: t.Any,  # noqa: ANN401
+        ) -> tuple[requests.PreparedRequest, requests.Response]:
+            async with semaphore:
+                prepared_request = self.prepare_request(context, next_page_token=token)
+                return prepared_request, await decorated_request(
+                    prepared_request,
+                    context,
+                )
+
+        def cancel(task: asyncio.Task) -> None:
+            if task.done() and not task.cancelled():
+                # Retrieve the error of a discarded page, if any
+                task.exception()
+            task.cancel()
+
+        prefetcher: PagePrefetcher[asyncio.Task] = PagePrefetcher(
+            paginator,
+            lambda token: asyncio.create_task(send(token)),
+            cancel,
+            max_in_flight=self.max_concurrent_requests,
+        )
+
+        with self.get_http_request_counter() as request_counter:
+            request_counter.with_context(context)
+
+            try:
+                while not paginator.finished:
+                    prepared_request, resp = await prefetcher.next()
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, resp, context)
+                    records = list(self.parse_response(resp))
+                    if not records:
+                        if paginator.continue_if_empty(resp):
+                            paginator.advance(resp)
+                            continue
+
+                        self.log(
+                            "Pagination stopped after %d pages because no records "
+                            "were found in the last response",
+                            pages,
+                        )
+                        break
+                    yield records
+                    pages += 1
+
+                    paginator.advance(resp)
+            finally:
+                prefetcher.discard()
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import copy
 import datetime
 import json
 import logging
+import queue
+import threading
 import typing as t
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
 from types import MappingProxyType
@@ -30,6 +35,7 @@ from singer_sdk.helpers._compat import (
     SingerSDKDeprecationWarning,
     datetime_fromisoformat,
 )
+from singer_sdk.helpers._concurrency import OrderedPrefetcher
 from singer_sdk.helpers._flattening import get_flattening_options
 from singer_sdk.helpers._state import (
     finalize_state_progress_markers,
@@ -44,8 +50,9 @@ from singer_sdk.helpers._state import (
     write_starting_replication_value,
 )
 from singer_sdk.helpers._typing import (
+    RecordConformer,
     TypeConformanceLevel,
-    conform_record_data_types,
+    _warn_unmapped_properties,
     is_datetime_type,
 )
 from singer_sdk.helpers._util import utc_now
@@ -64,6 +71,15 @@ REPLICATION_FULL_TABLE = "FULL_TABLE"
 REPLICATION_INCREMENTAL = "INCREMENTAL"
 REPLICATION_LOG_BASED = "LOG_BASED"
 
+_PARTITION_DONE = object()
+
+
+@dataclass(frozen=True)
+class _PartitionError:
+    """An error raised while fetching the records of a partition."""
+
+    error: BaseException
+
 
 class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
     """Abstract base class for tap streams.
@@ -116,7 +132,42 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
     selected_by_default: bool = True
     """Whether this stream is selected by default in the catalog."""
 
-    def __init__(
+    max_parallel_partitions: int = 1
+    """Number of partitions of this stream to fetch at the same time.
+
+    When greater than 1, the records of each partition are fetched by a pool of
+    worker threads, while messages, state and child streams are still handled one
+    record at a time. Only used when the stream has no `state_partitioning_keys`, so
+    each partition keeps its own state.
+    """
+
+    parallel_partitions_queue_size: int = 1000
+    """Number of fetched records to hold before partition worker threads block."""
+
+    max_parallel_contexts: int = 1
+    """Number of contexts of this child stream to fetch at the same time.
+
+    When greater than 1, the records of the contexts generated by parent records are
+    fetched by a pool of worker threads, and the child stream is synced with them in
+    the parent's thread, in the order of the parent records. The parent stream blocks
+    once this many contexts are being fetched. Only used when each context keeps its
+    own state, or the stream is not incremental, and for streams not synced in
+    batches.
+    """
+
+    parallel_contexts_queue_size: int = 1000
+    """Number of fetched records of a context to hold before its worker blocks."""
+
+    context_batch_size: int = 1
+    """Number of parent contexts to sync this child stream with at once.
+
+    When greater than 1, the contexts of consecutive parent records are combined with
+    :meth:`~singer_sdk.Stream.merge_contexts`, for example for APIs that accept a list
+    of parent IDs. Only used when the stream is not incremental, or defines
+    `state_partitioning_keys`, so combined contexts are not used as state partitions.
+    """
+
+    def __init__(  # noqa: PLR0915
         self,
         tap: Tap,
         schema: types.StrPath | dict[str, t.Any] | singer.Schema | None = None,
@@ -164,7 +215,12 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         self._metadata: singer.MetadataMapping | None = None
         self._mask: singer.SelectionMask | None = None
         self._schema: dict | None = None
+        self._record_conformer: RecordConformer | None = None
         self._is_state_flushed: bool = True
+        self._defer_state_messages = False
+        self._queued_contexts: list[types.Context] = []
+        self._context_prefetcher: OrderedPrefetcher[types.Context, t.Any] | None = None
+        self._prefetched_records: t.Iterable[t.Any] | None = None
         self._sync_costs: dict[str, int] = {}
         self.child_streams: list[Stream] = []
         if schema:
@@ -410,6 +466,25 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         return self._input_schema if self._input_schema is not None else self.schema
 
+    @property
+    def record_conformer(self) -> RecordConformer:
+        """The conformer used to translate record values to JSON-compatible types.
+
+        It is compiled from the effective schema and `TYPE_CONFORMANCE_LEVEL`. It is
+        compiled again when the level changes, when a catalog is applied, and at the
+        start of each sync, so that changes made to the schema in place are also
+        picked up.
+
+        Returns:
+            A record conformer for the stream's effective schema.
+        """
+        level = self.TYPE_CONFORMANCE_LEVEL
+        conformer = self._record_conformer
+        if conformer is None or conformer.level != level:
+            conformer = RecordConformer(self.effective_schema, level)
+            self._record_conformer = conformer
+        return conformer
+
     def _write_replication_key_signpost(
         self,
         context: types.Context | None,
@@ -895,13 +970,19 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
 
     def _write_state_message(self) -> None:
         """Write out a STATE message with the latest state."""
+        # Children of the records covered by the state are synced first
+        self._flush_child_syncs()
+        if self._defer_state_messages:
+            # The parent stream writes the state once it is safe to do so
+            return
+
         if not self._is_state_flushed and self.tap_state:
             self._tap.state_writer.write_state(self.tap_state)
             self._is_state_flushed = True
 
     def _write_activate_version_message(self, full_table_version: int) -> None:
         """Write out an ACTIVATE_VERSION message."""
-        singer.write_message(
+        self._tap.write_message(
             singer.ActivateVersionMessage(
                 stream=self.name,
                 version=full_table_version,
@@ -946,37 +1027,52 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             self._mask = self.metadata.resolve_selection()
         return self._mask
 
-    def _generate_record_messages(
+    def _generate_mapped_records(
         self,
         record: types.Record,
-    ) -> t.Generator[singer.RecordMessage, None, None]:
-        """Write out a RECORD message.
+    ) -> t.Generator[tuple[str, types.Record], None, None]:
+        """Conform a record and apply the stream maps to it.
 
         Args:
             record: A single stream record.
 
         Yields:
-            Record message objects.
+            Tuples of the stream alias and the mapped record, for each stream map
+            that does not filter out the record.
         """
-        schema = self.effective_schema
         pop_deselected_record_properties(record, self.schema, self.mask)
-        record = conform_record_data_types(
-            stream_name=self.name,
-            record=record,
-            schema=schema,
-            level=self.TYPE_CONFORMANCE_LEVEL,
-            logger=self.logger,
-        )
+        record, unmapped_properties = self.record_conformer.conform(record)
+        if unmapped_properties:
+            _warn_unmapped_properties(
+                self.name,
+                tuple(unmapped_properties),
+                self.logger,
+            )
         for stream_map in self.stream_maps:
             mapped_record = stream_map.transform(record)
             # Emit record if not filtered
             if mapped_record is not None:
-                yield singer.RecordMessage(
-                    stream=stream_map.stream_alias,
-                    record=mapped_record,
-                    version=self._stream_version,
-                    time_extracted=utc_now(),
-                )
+                yield stream_map.stream_alias, mapped_record
+
+    def _generate_record_messages(
+        self,
+        record: types.Record,
+    ) -> t.Generator[singer.RecordMessage, None, None]:
+        """Write out a RECORD message.
+
+        Args:
+            record: A single stream record.
+
+        Yields:
+            Record message objects.
+        """
+        for stream_alias, mapped_record in self._generate_mapped_records(record):
+            yield singer.RecordMessage(
+                stream=stream_alias,
+                record=mapped_record,
+                version=self._stream_version,
+                time_extracted=utc_now(),
+            )
 
     def _generate_batch_messages(
         self,
@@ -1002,11 +1098,29 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
     def _write_record_message(self, record: types.Record) -> None:
         """Write out a RECORD message.
 
+        Records are passed straight to the writer, unless the stream overrides
+        `_generate_record_messages` to build its own messages.
+
         Args:
             record: A single stream record.
         """
-        for record_message in self._generate_record_messages(record):
-            self._tap.write_message(record_message)
+        if (
+            type(self)._generate_record_messages  # noqa: SLF001
+            is not Stream._generate_record_messages
+        ):
+            for record_message in self._generate_record_messages(record):
+                self._tap.write_message(record_message)
+            self._is_state_flushed = False
+            return
+
+        time_extracted = utc_now()
+        for stream_alias, mapped_record in self._generate_mapped_records(record):
+            self._tap.write_record(
+                stream_alias,
+                mapped_record,
+                version=self._stream_version,
+                time_extracted=time_extracted,
+            )
 
         self._is_state_flushed = False
 
@@ -1233,7 +1347,7 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             if self.stream_maps[0].get_filter_result(record):
                 self._sync_children(copy.copy(context))
 
-    def _sync_records(  # noqa: C901
+    def _sync_records(
         self,
         context: types.Context | None = None,
         *,
@@ -1245,9 +1359,53 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
             context: Stream partition or context dictionary.
             write_messages: Whether to write Singer messages to stdout.
 
-        Raises:
-            InvalidStreamSortException: Raised if sorting errors are found while
-                syncing the records.
+        Yields:
+            Each record from the source.
+        """
+        context_list: list[types.Context] | list[dict] | None
+        context_list = [context] if context is not None else self.partitions
+
+        try:
+            if (
+                context is None
+                and self.max_parallel_partitions > 1
+                and len(context_list or []) > 1
+                and self.state_partitioning_keys is None
+            ):
+                yield from self._sync_partitions_in_parallel(
+                    context_list or [],
+                    write_messages=write_messages,
+                )
+            else:
+                yield from self._sync_partitions(
+                    context_list or [{}],
+                    write_messages=write_messages,
+                )
+            self._flush_child_syncs()
+        finally:
+            for child_stream in self.child_streams:
+                child_stream._close_queued_syncs()  # noqa: SLF001
+
+        if not context:
+            # Finalize total stream only if we have the full context.
+            # Otherwise will be finalized by tap at end of sync.
+            self._finalize_state(self.stream_state)
+
+        if write_messages:
+            # Write final state message if we haven't already
+            self._write_state_message()
+
+    def _sync_partitions(
+        self,
+        context_list: list[types.Context] | list[dict],
+        *,
+        write_messages: bool,
+    ) -> t.Generator[dict, t.Any, t.Any]:
+        """Sync the records of each partition, one partition after another.
+
+        Args:
+            context_list: The partitions to sync.
+            write_messages: Whether to write Singer messages to stdout.
 
         Yields:
             Each record from the source.
@@ -1255,18 +1413,16 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         # Type definitions
         context_element: types.Context | None
         record: types.Record | None
-        context_list: list[types.Context] | list[dict] | None
 
         # Initialize metrics
         record_counter = self.get_record_counter()
         timer = self.get_sync_timer()
 
         record_index = 0
-        context_list = [context] if context is not None else self.partitions
         selected = self.selected
 
         with record_counter, timer:
-            for context_element in context_list or [{}]:
+            for context_element in context_list:
                 record_counter.with_context(context_element)
                 timer.with_context(context_element)
 
@@ -1274,13 +1430,19 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
                 state_partition_context = self._get_state_partition_context(
                     current_context,
                 )
-                self._write_starting_replication_value(current_context)
+                records: t.Iterable[types.Record | tuple[dict, dict | None]]
+                if self._prefetched_records is None:
+                    self._write_starting_replication_value(current_context)
+                    records = self.get_records(current_context)
+                else:
+                    # Fetched after the starting value was written
+                    records = self._prefetched_records
 
                 child_context: types.Context | None = (
                     None if current_context is None else copy.copy(current_context)
                 )
 
-                for idx, record_result in enumerate(self.get_records(current_context)):
+                for idx, record_result in enumerate(records):
                     self._check_max_record_limit(current_record_index=record_index)
 
                     if isinstance(record_result, tuple):  # pragma: no cover
@@ -1301,34 +1463,17 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
                     if record is None:
                         continue
 
-                    try:
-                        self._process_record(
-                            record,
-                            child_context=child_context,
-                            partition_context=state_partition_context,
-                        )
-                    except InvalidStreamSortException as ex:  # pragma: no cover
-                        log_sort_error(
-                            log_fn=self.logger.error,
-                            ex=ex,
-                            record_count=record_index + 1,
-                            partition_record_count=idx + 1,
-                            current_context=current_context,
-                            state_partition_context=state_partition_context,
-                            stream_name=self.name,
-                        )
-                        raise
-
+                    self._sync_record(
+                        record,
+                        current_context=current_context,
+                        state_partition_context=state_partition_context,
+                        child_context=child_context,
+                        record_index=record_index,
+                        partition_record_index=idx,
+                        selected=selected,
+                        write_messages=write_messages,
+                    )
                     if selected:
-                        if write_messages:
-                            self._write_record_message(record)
-
-                        self._increment_stream_state(record, context=current_context)
-                        if (
-                            record_index + 1
-                        ) % self.STATE_MSG_FREQUENCY == 0 and write_messages:
-                            self._write_state_message()
-
                         record_counter.increment()
                         yield record
 
@@ -1339,14 +1484,210 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
                     state = self.get_context_state(current_context)
                     self._finalize_state(state)
 
-        if not context:
-            # Finalize total stream only if we have the full context.
-            # Otherwise will be finalized by tap at end of sync.
-            self._finalize_state(self.stream_state)
+    def _sync_partitions_in_parallel(
+        self,
+        context_list: list[types.Context] | list[dict],
+        *,
+        write_messages: bool,
+    ) -> t.Generator[dict, t.Any, t.Any]:
+        """Sync the records of several partitions at the same time.
 
-        if write_messages:
-            # Write final state message if we haven't already
-            self._write_state_message()
+        Worker threads fetch the records of each partition and put them on a bounded
+        queue. The records are then processed in the calling thread, in the order
+        they were fetched, so messages are written and state is updated by a single
+        thread. The state of a partition is only finalized once all its records were
+        processed.
+
+        Args:
+            context_list: The partitions to sync.
+            write_messages: Whether to write Singer messages to stdout.
+
+        Yields:
+            Each record from the source.
+        """
+        results: queue.Queue[tuple[int, t.Any]] = queue.Queue(
+            maxsize=self.parallel_partitions_queue_size,
+        )
+        stop = threading.Event()
+
+        # Write the starting values before the workers read them
+        contexts: list[types.Context | None] = [
+            context_element or None for context_element in context_list
+        ]
+        for current_context in contexts:
+            self._write_starting_replication_value(current_context)
+
+        record_index = 0
+        partition_record_indexes = [0] * len(contexts)
+        selected = self.selected
+
+        with contextlib.ExitStack() as stack:
+            # Count the records of each partition separately
+            record_counters = [
+                stack.enter_context(self.get_record_counter()) for _ in contexts
+            ]
+            for record_counter, current_context in zip(
+                record_counters, contexts, strict=True
+            ):
+                record_counter.with_context(current_context)
+
+            executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=self.max_parallel_partitions,
+                    thread_name_prefix=f"{self.name}-partition",
+                )
+            )
+            # Stop the running workers and drop the partitions not started yet,
+            # before waiting for the workers to exit. Callbacks run in reverse order.
+            stack.callback(executor.shutdown, wait=False, cancel_futures=True)
+            stack.callback(stop.set)
+            for partition_index, current_context in enumerate(contexts):
+                executor.submit(
+                    self._fetch_partition_records,
+                    partition_index,
+                    current_context,
+                    results=results,
+                    stop=stop,
+                )
+
+            remaining = len(contexts)
+            while remaining:
+                partition_index, item = results.get()
+                current_context = contexts[partition_index]
+                state_partition_context = self._get_state_partition_context(
+                    current_context,
+                )
+
+                if item is _PARTITION_DONE:
+                    remaining -= 1
+                    if current_context == state_partition_context:
+                        state = self.get_context_state(current_context)
+                        self._finalize_state(state)
+                    continue
+
+                if isinstance(item, _PartitionError):
+                    raise item.error
+
+                self._check_max_record_limit(current_record_index=record_index)
+                record = self.post_process(item, current_context)
+                if record is None:
+                    continue
+
+                self._sync_record(
+                    record,
+                    current_context=current_context,
+                    state_partition_context=state_partition_context,
+                    child_context=(
+                        None if current_context is None else copy.copy(current_context)
+                    ),
+                    record_index=record_index,
+                    partition_record_index=partition_record_indexes[partition_index],
+                    selected=selected,
+                    write_messages=write_messages,
+                )
+                if selected:
+                    record_counters[partition_index].increment()
+                    yield record
+
+                record_index += 1
+                partition_record_indexes[partition_index] += 1
+
+    def _fetch_partition_records(
+        self,
+        partition_index: int,
+        context: types.Context | None,
+        *,
+        results: queue.Queue[tuple[int, t.Any]],
+        stop: threading.Event,
+    ) -> None:
+        """Put the records of a partition on a queue, in a worker thread.
+
+        Once all the records were fetched, the worker puts a sentinel on the queue, or
+        the error raised while fetching them.
+
+        Args:
+            partition_index: The index of the partition.
+            context: The partition.
+            results: The queue of fetched records.
+            stop: Set when the records are no longer needed.
+        """
+        if stop.is_set():
+            return
+
+        def put(item: t.Any) -> bool:  # noqa: ANN401
+            while not stop.is_set():
+                try:
+                    results.put((partition_index, item), timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        try:
+            with self.get_sync_timer() as timer:
+                timer.with_context(context)
+                for record_result in self.get_records(context):
+                    if not put(record_result):
+                        return
+        except BaseException as e:  # noqa: BLE001
+            put(_PartitionError(e))
+        else:
+            put(_PARTITION_DONE)
+
+    def _sync_record(
+        self,
+        record: types.Record,
+        *,
+        current_context: types.Context | None,
+        state_partition_context: types.Context | None,
+        child_context: types.Context | None,
+        record_index: int,
+        partition_record_index: int,
+        selected: bool,
+        write_messages: bool,
+    ) -> None:
+        """Sync a record, its child streams and the stream state.
+
+        Args:
+            record: The record to sync.
+            current_context: The partition of the record.
+            state_partition_context: The state partition of the record.
+            child_context: The context of the record's child streams.
+            record_index: The zero-based index of the record in the stream.
+            partition_record_index: The zero-based index of the record in the
+                partition.
+            selected: Whether the stream is selected.
+            write_messages: Whether to write Singer messages to stdout.
+
+        Raises:
+            InvalidStreamSortException: Raised if sorting errors are found while
+                syncing the records.
+        """
+        try:
+            self._process_record(
+                record,
+                child_context=child_context,
+                partition_context=state_partition_context,
+            )
+        except InvalidStreamSortException as ex:  # pragma: no cover
+            log_sort_error(
+                log_fn=self.logger.error,
+                ex=ex,
+                record_count=record_index + 1,
+                partition_record_count=partition_record_index + 1,
+                current_context=current_context,
+                state_partition_context=state_partition_context,
+                stream_name=self.name,
+            )
+            raise
+
+        if selected:
+            if write_messages:
+                self._write_record_message(record)
+
+            self._increment_stream_state(record, context=current_context)
+            if (record_index + 1) % self.STATE_MSG_FREQUENCY == 0 and write_messages:
+                self._write_state_message()
 
     def _sync_batches(
         self,
@@ -1378,7 +1719,14 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
         """
         # Preprocess context before it's frozen
         context = self.preprocess_context(context) if context else None
+        self._sync_context(context)
 
+    def _sync_context(self, context: types.Context | None) -> None:
+        """Sync this stream with a preprocessed context.
+
+        Args:
+            context: Stream partition or context dictionary.
+        """
         log_msg = "Beginning sync of '%s' in %s mode"
         log_args: list[t.Any] = [self.name, self.replication_method.lower()]
         if context:
@@ -1389,6 +1737,9 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
 
         self.context = MappingProxyType(context) if context else None
 
+        # Compile the record conformer from the schema as it is now
+        self._record_conformer = None
+
         # Use a replication signpost, if available
         signpost = self.get_replication_key_signpost(context)
         if signpost:
@@ -1434,7 +1785,139 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
 
         for child_stream in self.child_streams:
             if child_stream.selected or child_stream.has_selected_descendents:
-                child_stream.sync(context=child_context)
+                child_stream._queue_sync(child_context)  # noqa: SLF001
+
+    def _flush_child_syncs(self) -> None:
+        """Sync the child streams with the contexts queued so far."""
+        for child_stream in self.child_streams:
+            child_stream._flush_queued_syncs()  # noqa: SLF001
+
+    @property
+    def _prefetches_contexts(self) -> bool:
+        """Whether the records of queued contexts are fetched in worker threads.
+
+        Returns:
+            True if contexts are fetched in worker threads.
+        """
+        return (
+            self.max_parallel_contexts > 1
+            and (self.replication_key is None or self.state_partitioning_keys is None)
+            and not self.get_batch_config(self.config)
+        )
+
+    @property
+    def _merges_contexts(self) -> bool:
+        """Whether the contexts of consecutive parent records are combined.
+
+        Returns:
+            True if contexts are combined with `merge_contexts`.
+        """
+        return self.context_batch_size > 1 and (
+            self.replication_key is None or self.state_partitioning_keys is not None
+        )
+
+    def _queue_sync(self, context: types.Context) -> None:
+        """Sync this child stream with the context of a parent record.
+
+        The sync is deferred when contexts are combined or fetched in worker threads.
+
+        Args:
+            context: The context generated by the parent record.
+        """
+        merges_contexts = self._merges_contexts
+        if not merges_contexts and not self._prefetches_contexts:
+            self.sync(context=context)
+            return
+
+        self._queued_contexts.append(context)
+        if not merges_contexts or len(self._queued_contexts) >= self.context_batch_size:
+            self._sync_queued_contexts()
+
+    def _sync_queued_contexts(self) -> None:
+        """Sync or submit the queued contexts."""
+        if not self._queued_contexts:
+            return
+
+        contexts, self._queued_contexts = self._queued_contexts, []
+        context = (
+            self.merge_contexts(contexts) if self._merges_contexts else contexts[0]
+        )
+
+        if not self._prefetches_contexts:
+            self._sync_deferred(context)
+            return
+
+        if self._context_prefetcher is None:
+            self._context_prefetcher = OrderedPrefetcher(
+                self._fetch_context_records,
+                max_workers=self.max_parallel_contexts,
+                max_pending=self.max_parallel_contexts,
+                buffer_size=self.parallel_contexts_queue_size,
+                thread_name_prefix=f"{self.name}-context",
+            )
+
+        # Preprocess the context and write its starting value before it is fetched
+        context = self.preprocess_context(context)
+        self._write_starting_replication_value(context)
+        for ready_context, records in self._context_prefetcher.submit(context):
+            self._sync_deferred(ready_context, records)
+
+    def _fetch_context_records(self, context: types.Context) -> t.Iterator[t.Any]:
+        """Fetch the records of a context, in a worker thread.
+
+        Args:
+            context: The preprocessed context.
+
+        Yields:
+            Each record of the context.
+        """
+        with self.get_sync_timer() as timer:
+            timer.with_context(context)
+            yield from self.get_records(context)
+
+    def _flush_queued_syncs(self) -> None:
+        """Sync this stream with all the contexts queued by parent records."""
+        self._sync_queued_contexts()
+        if self._context_prefetcher is not None:
+            for context, records in self._context_prefetcher.drain():
+                self._sync_deferred(context, records)
+
+    def _close_queued_syncs(self) -> None:
+        """Drop the queued contexts and stop the worker threads, if any."""
+        self._queued_contexts = []
+        if self._context_prefetcher is not None:
+            self._context_prefetcher.close()
+            self._context_prefetcher = None
+
+    def _sync_deferred(
+        self,
+        context: types.Context,
+        records: t.Iterable[t.Any] | None = None,
+    ) -> None:
+        """Sync this child stream after later parent records were processed.
+
+        The parent state already covers those records, so STATE messages of this
+        stream and its descendants are left to the parent stream.
+
+        Args:
+            context: The context to sync.
+            records: The records of the context, if fetched in a worker thread.
+        """
+        self._set_state_messages_deferred(deferred=True)
+        self._prefetched_records = records
+        try:
+            if records is None:
+                self.sync(context=context)
+            else:
+                self._sync_context(context)
+        finally:
+            self._prefetched_records = None
+            self._set_state_messages_deferred(deferred=False)
+
+    def _set_state_messages_deferred(self, *, deferred: bool) -> None:
+        self._defer_state_messages = deferred
+        for child_stream in self.child_streams:
+            child_stream._set_state_messages_deferred(deferred=deferred)  # noqa: SLF001
 
     # Overridable Methods
 
@@ -1470,6 +1953,7 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
                 self.forced_replication_method = replication_method
 
             self._input_schema = entry.schema.to_dict()
+            self._record_conformer = None
 
     def _get_state_partition_context(
         self,
@@ -1534,6 +2018,23 @@ class Stream(metaclass=abc.ABCMeta):  # noqa: PLR0904
 
         return context or record
 
+    def merge_contexts(self, contexts: list[types.Context]) -> types.Context:  # noqa: PLR6301
+        """Combine the contexts of several parent records into a single context.
+
+        Used when :attr:`~singer_sdk.Stream.context_batch_size` is greater than 1. By
+        default, each key is mapped to the list of its values in the given contexts.
+
+        Developers may override this method to build a context their API accepts,
+        for example a comma-separated list of parent IDs.
+
+        Args:
+            contexts: The contexts generated by consecutive parent records.
+
+        Returns:
+            The context to sync this stream with.
+        """
+        return {key: [context[key] for context in contexts] for key in contexts[0]}
+
     def generate_child_contexts(
         self,
         record: types.Record,
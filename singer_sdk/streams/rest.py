@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import copy
 import decimal
 import logging
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cached_property
 from http import HTTPStatus
 from urllib.parse import urlparse
@@ -20,7 +22,9 @@ from singer_sdk import metrics
 from singer_sdk.authenticators import SimpleAuthenticator
 from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 from singer_sdk.helpers._compat import SingerSDKDeprecationWarning
-from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.helpers._concurrency import PagePrefetcher
+from singer_sdk.helpers._json_stream import iter_json_items
+from singer_sdk.helpers.jsonpath import _simple_items_path, extract_jsonpath
 from singer_sdk.pagination import (
     JSONPathPaginator,
     LegacyStreamPaginator,
@@ -35,6 +39,8 @@ if t.TYPE_CHECKING:
 
     from backoff.types import Details
 
+    from singer_sdk.helpers._http_cache import CachedResponse, ResponseCache
+    from singer_sdk.helpers._rate_limit import RateLimiter
     from singer_sdk.helpers.types import Auth, Context, RequestFunc
     from singer_sdk.pagination import BaseAPIPaginator
     from singer_sdk.singerlib import Schema
@@ -42,6 +48,7 @@ if t.TYPE_CHECKING:
 
 DEFAULT_PAGE_SIZE = 1000
 DEFAULT_REQUEST_TIMEOUT = 300  # 5 minutes
+STREAM_CHUNK_SIZE = 64 * 1024
 
 _TToken = t.TypeVar("_TToken")
 _TNum = t.TypeVar("_TNum", int, float)
@@ -62,6 +69,20 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
     #: Set this to True if the API expects a JSON payload in the request body.
     payload_as_json: bool = False
 
+    #: Number of pages to request ahead, from worker threads, for paginators that
+    #: can predict their next token. Records are still returned in page order.
+    prefetch_pages: int = 0
+
+    #: Set this to True to read response bodies as they are parsed, rather than
+    #: downloading them in full first. Responses are still downloaded in full if the
+    #: paginator reads them, see
+    #: :attr:`~singer_sdk.pagination.BaseAPIPaginator.reads_response_body`.
+    stream_responses: bool = False
+
+    #: Set this to False to never cache the responses of this stream, even if the
+    #: tap has an ``http_cache``.
+    cache_responses: bool = True
+
     # Private constants. May not be supported in future releases:
     _LOG_REQUEST_METRICS: bool = True
     # Disabled by default for safety:
@@ -104,7 +125,7 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
             self.path = path
         self._http_headers: dict[str, str] = {}
         self._http_method = http_method
-        self._requests_session = requests.Session()
+        self._requests_session = None
         super().__init__(name=name, schema=schema, tap=tap)
 
     @staticmethod
@@ -185,13 +206,44 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
     def requests_session(self) -> requests.Session:
         """Get requests session.
 
+        If the tap has :attr:`~singer_sdk.Tap.http_sessions`, streams with the same
+        scheme and host in their :attr:`url_base` share a session.
+
         Returns:
             The :class:`requests.Session` object for HTTP requests.
         """
         if not self._requests_session:
-            self._requests_session = requests.Session()
+            http_sessions = self._tap.http_sessions
+            self._requests_session = (
+                http_sessions.get(self.url_base)
+                if http_sessions is not None
+                else requests.Session()
+            )
         return self._requests_session
 
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the rate limiter shared by the HTTP streams of the tap.
+
+        Returns:
+            The tap's :attr:`~singer_sdk.Tap.rate_limiter`, if any.
+        """
+        return self._tap.rate_limiter
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Get the cache of responses revalidated with conditional requests.
+
+        Responses are not cached if :attr:`cache_responses` is False, or if
+        :attr:`stream_responses` is set.
+
+        Returns:
+            The tap's :attr:`~singer_sdk.Tap.http_cache`, if any.
+        """
+        if not self.cache_responses or self.stream_responses:
+            return None
+        return self._tap.http_cache
+
     @cached_property
     def user_agent(self) -> str:
         """Get the user agent string for the stream.
@@ -325,12 +377,27 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
         Returns:
             TODO
         """
+        # The cache key is computed before the authenticator changes the request
+        cache_key, cached = self._get_cached_response(prepared_request)
         authenticated_request = self.authenticator(prepared_request)
-        response = self.requests_session.send(
-            authenticated_request,
-            timeout=self.timeout,
-            allow_redirects=self.allow_redirects,
-        )
+        if cached is not None:
+            authenticated_request.headers.update(cached.conditional_headers)
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            waited = rate_limiter.acquire(self.path)
+            self._write_request_wait_log(self.path, waited, context)
+        try:
+            response = self.requests_session.send(
+                authenticated_request,
+                timeout=self.timeout,
+                allow_redirects=self.allow_redirects,
+                stream=self.stream_responses,
+            )
+        finally:
+            if rate_limiter is not None:
+                rate_limiter.release()
+        if rate_limiter is not None:
+            self._update_rate_limit(rate_limiter, response, context)
         self._write_request_duration_log(
             endpoint=self.path,
             response=response,
@@ -339,9 +406,58 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
             if self._LOG_REQUEST_METRIC_URLS
             else None,
         )
+        response = self._use_response_cache(cache_key, response, cached)
         self.validate_response(response)
         return response
 
+    def _get_cached_response(
+        self,
+        prepared_request: requests.PreparedRequest,
+    ) -> tuple[str | None, CachedResponse | None]:
+        """Get the cached response to a request, before it is authenticated.
+
+        Args:
+            prepared_request: The request to send.
+
+        Returns:
+            The cache key of the request, if the response cache is enabled, and the
+            cached response, if any.
+        """
+        response_cache = self.response_cache
+        if response_cache is None:
+            return None, None
+        key = response_cache.key(prepared_request)
+        return key, response_cache.get(key)
+
+    def _use_response_cache(
+        self,
+        cache_key: str | None,
+        response: requests.Response,
+        cached: CachedResponse | None,
+    ) -> requests.Response:
+        """Replace a ``304 Not Modified`` response, or store a new response.
+
+        Args:
+            cache_key: The cache key of the request, before it was authenticated.
+            response: The response to the request.
+            cached: The cached response that the request was conditional on.
+
+        Returns:
+            The cached response if the server confirmed it did not change, otherwise
+            the response.
+        """
+        response_cache = self.response_cache
+        if response_cache is None or cache_key is None:
+            return response
+
+        hit = cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED
+        response_cache.count(self.name, hit=hit)
+        if hit:
+            return t.cast("CachedResponse", cached).replay(response)
+
+        response_cache.put(cache_key, response)
+        return response
+
     def get_url_params(  # noqa: PLR6301
         self,
         context: Context | None,  # noqa: ARG002
@@ -460,16 +576,27 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
         decorated_request = self.request_decorator(self._request)
         pages = 0
 
-        with self.get_http_request_counter() as request_counter:
+        # The paginator reads the response after the records were parsed from it
+        buffer_responses = self.stream_responses and paginator.reads_response_body
+        if buffer_responses:
+            self.logger.debug(
+                "Downloading whole responses before parsing them, since %s reads "
+                "the response body",
+                type(paginator).__name__,
+            )
+
+        with (
+            self.get_http_request_counter() as request_counter,
+            contextlib.closing(
+                self._send_page_requests(paginator, decorated_request, context)
+            ) as responses,
+        ):
             request_counter.with_context(context)
 
-            while not paginator.finished:
-                prepared_request = self.prepare_request(
-                    context,
-                    next_page_token=paginator.current_value,
-                )
-                resp = decorated_request(prepared_request, context)
+            for prepared_request, resp in responses:
                 request_counter.increment()
+                if buffer_responses:
+                    _ = resp.content
                 self.update_sync_costs(prepared_request, resp, context)
                 records = iter(self.parse_response(resp))
                 try:
@@ -491,6 +618,60 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
 
                 paginator.advance(resp)
 
+    def _send_page_requests(
+        self,
+        paginator: BaseAPIPaginator,
+        decorated_request: RequestFunc,
+        context: Context | None,
+    ) -> t.Generator[tuple[requests.PreparedRequest, requests.Response], None, None]:
+        """Send the request of each page, as the paginator advances.
+
+        If :attr:`prefetch_pages` is set and the paginator can predict its next
+        tokens, the requests of the following pages are sent ahead from worker
+        threads. A page sent ahead is discarded if pagination stops, or the paginator
+        advances to a different token than the predicted one.
+
+        Args:
+            paginator: The paginator, advanced by the caller after each response.
+            decorated_request: The function that sends a request.
+            context: Stream partition or context dictionary.
+
+        Yields:
+            The request and response of the current page of the paginator.
+        """
+
+        def send(
+            token: t.Any,  # noqa: ANN401
+        ) -> tuple[requests.PreparedRequest, requests.Response]:
+            prepared_request = self.prepare_request(context, next_page_token=token)
+            return prepared_request, decorated_request(prepared_request, context)
+
+        if (
+            self.prefetch_pages <= 0
+            or paginator.predict_next(paginator.current_value) is None
+        ):
+            while not paginator.finished:
+                yield send(paginator.current_value)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.prefetch_pages + 1,
+            thread_name_prefix=f"{self.name}-page",
+        )
+        prefetcher: PagePrefetcher[Future] = PagePrefetcher(
+            paginator,
+            lambda token: executor.submit(send, token),
+            Future.cancel,
+            max_in_flight=self.prefetch_pages + 1,
+        )
+
+        try:
+            while not paginator.finished:
+                yield prefetcher.next().result()
+        finally:
+            # Requests already sent ahead complete in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _write_request_duration_log(
         self,
         endpoint: str,
@@ -531,6 +712,73 @@ class _HTTPStream(Stream, t.Generic[_TToken], metaclass=abc.ABCMeta):  # noqa: P
         )
         self._log_metric(point)
 
+    def _write_request_wait_log(
+        self,
+        endpoint: str,
+        waited: float,
+        context: Context | None,
+    ) -> None:
+        """Log the time a request waited for the rate limiter.
+
+        Args:
+            endpoint: The endpoint of the request.
+            waited: Number of seconds the request waited.
+            context: Stream partition or context dictionary.
+        """
+        if not self._LOG_REQUEST_METRICS or waited <= 0:
+            return
+
+        tags: dict[str, t.Any] = {
+            metrics.Tag.STREAM: self.name,
+            metrics.Tag.ENDPOINT: endpoint,
+        }
+        if context:
+            tags[metrics.Tag.CONTEXT] = context
+        self._log_metric(
+            metrics.Point(
+                "timer",
+                metric=metrics.Metric.HTTP_REQUEST_WAIT,
+                value=waited,
+                tags=tags,
+            )
+        )
+
+    def _update_rate_limit(
+        self,
+        rate_limiter: RateLimiter,
+        response: requests.Response,
+        context: Context | None,
+    ) -> None:
+        """Adapt the rate limiter to a response, and log concurrency changes.
+
+        Args:
+            rate_limiter: The rate limiter of the tap.
+            response: The response.
+            context: Stream partition or context dictionary.
+        """
+        limit = rate_limiter.update(self.path, response)
+        if limit is None:
+            return
+
+        self.logger.info("Concurrent request limit changed to %d", limit)
+        if not self._LOG_REQUEST_METRICS:
+            return
+
+        tags: dict[str, t.Any] = {
+            metrics.Tag.STREAM: self.name,
+            metrics.Tag.ENDPOINT: self.path,
+        }
+        if context:
+            tags[metrics.Tag.CONTEXT] = context
+        self._log_metric(
+            metrics.Point(
+                "gauge",
+                metric=metrics.Metric.HTTP_CONCURRENCY_LIMIT,
+                value=limit,
+                tags=tags,
+            )
+        )
+
     def update_sync_costs(
         self,
         request: requests.PreparedRequest,
@@ -825,12 +1073,28 @@ class RESTStream(_HTTPStream, t.Generic[_TToken], metaclass=abc.ABCMeta):
     def parse_response(self, response: requests.Response) -> t.Iterable[dict]:
         """Parse the response and return an iterator of result records.
 
+        If :attr:`stream_responses` is set and :attr:`records_jsonpath` only selects
+        the items of an array, such as ``$.data[*]``, records are parsed as the
+        response body is read, so only one record is held in memory at a time.
+
         Args:
             response: A raw :class:`requests.Response`
 
         Yields:
             One item for every item found in the response.
         """
+        if (
+            self.stream_responses
+            and response.raw is not None
+            and (keys := _simple_items_path(self.records_jsonpath)) is not None
+        ):
+            with response:
+                yield from iter_json_items(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    keys,
+                )
+            return
+
         yield from extract_jsonpath(
             self.records_jsonpath,
             input=response.json(parse_float=decimal.Decimal),
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import threading
 import typing as t
 import warnings
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from enum import Enum
 
 import click
 
+from singer_sdk import metrics
 from singer_sdk.configuration._dict_config import merge_missing_config_jsonschema
 from singer_sdk.exceptions import (
     AbortedSyncFailedException,
@@ -18,10 +21,18 @@ from singer_sdk.exceptions import (
 )
 from singer_sdk.helpers import _state
 from singer_sdk.helpers._compat import SingerSDKDeprecationWarning
+from singer_sdk.helpers._concurrency import MessageSerializer
+from singer_sdk.helpers._http_cache import ResponseCache
+from singer_sdk.helpers._rate_limit import RateLimiter
+from singer_sdk.helpers._sessions import SessionRegistry
 from singer_sdk.helpers._state import StateWriter, write_stream_state
 from singer_sdk.helpers._util import dump_json, load_json, read_json_file
 from singer_sdk.helpers.capabilities import (
     BATCH_CONFIG,
+    TAP_HTTP_CACHE_CONFIG,
+    TAP_HTTP_SESSION_CONFIG,
+    TAP_MAX_PARALLEL_STREAMS_CONFIG,
+    TAP_RATE_LIMIT_CONFIG,
     PluginCapabilities,
     TapCapabilities,
 )
@@ -117,6 +128,18 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
         self._state: types.TapState = {}
         self._catalog: Catalog | None = None  # Tap's working catalog
         self._state_writer: StateWriter = StateWriter(self.message_writer)
+        self._rate_limiter = (
+            RateLimiter.from_config(rate_limit)
+            if (rate_limit := self.config.get("rate_limit")) is not None
+            else None
+        )
+        self._http_cache: ResponseCache | None = None
+        self._http_cache_lock = threading.Lock()
+        self._http_sessions = (
+            SessionRegistry.from_config(http_session)
+            if (http_session := self.config.get("http_session")) is not None
+            else None
+        )
 
         # Process input catalog
         if isinstance(catalog, Catalog):
@@ -239,6 +262,13 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
             config_jsonschema: [description]
         """
         PluginBase.append_builtin_config(config_jsonschema)
+        merge_missing_config_jsonschema(
+            TAP_MAX_PARALLEL_STREAMS_CONFIG,
+            config_jsonschema,
+        )
+        merge_missing_config_jsonschema(TAP_RATE_LIMIT_CONFIG, config_jsonschema)
+        merge_missing_config_jsonschema(TAP_HTTP_SESSION_CONFIG, config_jsonschema)
+        merge_missing_config_jsonschema(TAP_HTTP_CACHE_CONFIG, config_jsonschema)
 
         capabilities = cls.capabilities
         if PluginCapabilities.BATCH in capabilities:
@@ -302,6 +332,7 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
                 AbortedSyncPausedException,
             ):
                 stream.sync()
+        self.message_writer.flush()
         return True
 
     @t.final
@@ -476,7 +507,7 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
         if self.state:
             self._state_writer.write_state(self.state)
 
-        stream: Stream
+        streams: list[Stream] = []
         for stream in self.streams.values():
             if not stream.selected and not stream.has_selected_descendents:
                 self.logger.info("Skipping deselected stream '%s'.", stream.name)
@@ -492,13 +523,164 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
                 )
                 continue
 
-            stream.sync()
-            stream.finalize_state_progress_markers()
+            streams.append(stream)
 
-        # this second loop is needed for all streams to print out their costs
-        # including child streams which are otherwise skipped in the loop above
-        for stream in self.streams.values():
-            stream.log_sync_costs()
+        try:
+            if self.max_parallel_streams > 1 and len(streams) > 1:
+                self._sync_streams_concurrently(streams)
+            else:
+                for stream in streams:
+                    stream.sync()
+                    stream.finalize_state_progress_markers()
+
+            # this second loop is needed for all streams to print out their costs
+            # including child streams which are otherwise skipped in the loop above
+            for stream in self.streams.values():
+                stream.log_sync_costs()
+
+            self._log_sync_metrics()
+        finally:
+            # Write out any records still held by a buffered message writer
+            self.message_writer.flush()
+
+            # Release the pooled connections and the cache database, even if a
+            # stream failed
+            with self._http_cache_lock:
+                if self._http_cache is not None:
+                    self._http_cache.close()
+                    self._http_cache = None
+            if self._http_sessions is not None:
+                self._http_sessions.close()
+
+    @property
+    def max_parallel_streams(self) -> int:
+        """The maximum number of top-level streams to sync at the same time.
+
+        Returns:
+            The value of the ``max_parallel_streams`` setting, 1 if not set.
+        """
+        return self.config.get("max_parallel_streams") or 1
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """The rate limiter shared by the HTTP streams of the tap.
+
+        Returns:
+            A rate limiter built from the ``rate_limit`` setting, or None if not set.
+        """
+        return self._rate_limiter
+
+    @property
+    def http_sessions(self) -> SessionRegistry | None:
+        """The HTTP sessions shared by the streams of the tap, by base URL.
+
+        Returns:
+            A session registry built from the ``http_session`` setting, or None if not
+            set.
+        """
+        return self._http_sessions
+
+    @property
+    def http_cache(self) -> ResponseCache | None:
+        """The on-disk cache of the responses of the HTTP streams of the tap.
+
+        The cache is opened the first time it is used.
+
+        Returns:
+            A response cache built from the ``http_cache`` setting, or None if not set.
+        """
+        if (config := self.config.get("http_cache")) is None:
+            return None
+
+        with self._http_cache_lock:
+            if self._http_cache is None:
+                self._http_cache = ResponseCache.from_config(config, self.name)
+            return self._http_cache
+
+    def _log_sync_metrics(self) -> None:
+        """Log the metrics collected over the sync of all streams."""
+        self._log_http_metrics()
+
+    def _log_http_metrics(self) -> None:
+        """Log how many connections the shared HTTP sessions opened.
+
+        Also log the hits and misses of the HTTP cache, by stream.
+        """
+        if self._http_cache is not None:
+            for metric, counts in (
+                (metrics.Metric.HTTP_CACHE_HIT_COUNT, self._http_cache.hits),
+                (metrics.Metric.HTTP_CACHE_MISS_COUNT, self._http_cache.misses),
+            ):
+                for stream_name, count in counts.items():
+                    metrics.log(
+                        self.metrics_logger,
+                        metrics.Point(
+                            "counter",
+                            metric=metric,
+                            value=count,
+                            tags={metrics.Tag.STREAM: stream_name},
+                        ),
+                    )
+
+        if self._http_sessions is None:
+            return
+
+        connection_counts = self._http_sessions.connection_counts()
+        for url, (connections, requests_sent) in connection_counts.items():
+            self.logger.info(
+                "Opened %d connections for %d requests to %s",
+                connections,
+                requests_sent,
+                url,
+            )
+            metrics.log(
+                self.metrics_logger,
+                metrics.Point(
+                    "counter",
+                    metric=metrics.Metric.HTTP_CONNECTION_COUNT,
+                    value=connections,
+                    tags={metrics.Tag.ENDPOINT: url},
+                ),
+            )
+
+    def _sync_streams_concurrently(self, streams: list[Stream]) -> None:
+        """Sync top-level streams, and their children, from a pool of threads.
+
+        Messages are written by a single serializer thread, see
+        :class:`~singer_sdk.helpers._concurrency.MessageSerializer`.
+
+        Args:
+            streams: The top-level streams to sync.
+        """
+        message_writer, state_writer = self.message_writer, self._state_writer
+        serializer = MessageSerializer(message_writer, state_writer, self.state)
+
+        def _sync_stream(stream: Stream) -> None:
+            stream_names = [stream.name, *(s.name for s in stream.descendent_streams)]
+            with serializer.claim_streams(stream_names):
+                stream.sync()
+                stream.finalize_state_progress_markers()
+
+        self.message_writer = serializer.message_writer
+        self._state_writer = serializer.state_writer
+        try:
+            with (
+                serializer,
+                ThreadPoolExecutor(
+                    max_workers=self.max_parallel_streams,
+                    thread_name_prefix=f"{self.name}-sync",
+                ) as executor,
+            ):
+                futures = [executor.submit(_sync_stream, stream) for stream in streams]
+                wait(futures, return_when=FIRST_EXCEPTION)
+                for future in futures:
+                    # Don't start any more streams after a failure
+                    future.cancel()
+                for future in futures:
+                    if not future.cancelled():
+                        future.result()
+        finally:
+            self.message_writer, self._state_writer = message_writer, state_writer
 
     # Command Line Execution
 
@@ -517,6 +699,7 @@ class Tap(BaseSingerWriter, metaclass=abc.ABCMeta):  # noqa: PLR0904
         # even if the process is terminated by a signal.
         try:
             self._state_writer.write_state(self.state)
+            self.message_writer.flush()
         finally:
             super()._handle_termination(signum, frame)
 
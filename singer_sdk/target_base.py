@@ -6,9 +6,12 @@ import abc
 import copy
 import json
 import sys
+import threading
 import time
 import typing as t
 import warnings
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import click
 from joblib import Parallel, delayed, parallel_config
@@ -20,6 +23,7 @@ from singer_sdk.helpers.capabilities import (
     ACTIVATE_VERSION_CONFIG,
     ADD_RECORD_METADATA_CONFIG,
     BATCH_CONFIG,
+    TARGET_BATCH_SIZE_BYTES_CONFIG,
     TARGET_BATCH_SIZE_ROWS_CONFIG,
     TARGET_LOAD_METHOD_CONFIG,
     TARGET_VALIDATE_RECORDS_CONFIG,
@@ -31,13 +35,15 @@ from singer_sdk.plugin_base import BaseSingerReader, _ConfigInput
 
 if t.TYPE_CHECKING:
     from collections.abc import Iterable
+    from concurrent.futures import Future
     from pathlib import PurePath
     from types import FrameType
 
     from singer_sdk.helpers.capabilities import CapabilitiesEnum
-    from singer_sdk.mapper import PluginMapper
+    from singer_sdk.mapper import PluginMapper, StreamMap
     from singer_sdk.singerlib.encoding.base import GenericSingerReader
     from singer_sdk.sinks import Sink
+    from singer_sdk.sinks.core import _DetachedBatch
 
 _MAX_PARALLELISM = 8
 
@@ -54,6 +60,18 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
 
     _MAX_RECORD_AGE_IN_MINUTES: float = 5.0
 
+    max_inflight_batches: int = 0
+    """Maximum number of batches processed in the background while reading input.
+
+    By default, reading input stops while a full sink is drained. If set, the batch
+    of a full sink is instead processed by a pool of this many worker threads, and
+    the sink starts a new batch right away. Reading input only blocks once this many
+    batches are in flight, or :attr:`~singer_sdk.Sink.max_inflight_batches` for the
+    stream. ``STATE`` messages are only emitted once all batches are processed.
+
+    Only enable this for sinks that can process batches from a worker thread.
+    """
+
     # Default class to use for creating new sink objects.
     # Required if `Target.get_sink_class()` is not defined.
     default_sink_class: type[Sink]
@@ -107,6 +125,19 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
         # Approximated for max record age enforcement
         self._last_full_drain_at: float = time.time()
 
+        # Estimated input bytes buffered across sinks since the last check
+        self._buffered_bytes = 0
+        self._max_buffer_size_bytes: int | None = self.config.get(
+            "max_buffer_size_bytes",
+        )
+
+        # Batches processed in the background, by stream name
+        self._drain_executor: ThreadPoolExecutor | None = None
+        self._inflight_batches: defaultdict[str, list[Future[None]]] = defaultdict(
+            list,
+        )
+        self._drained_batch_lock = threading.Lock()
+
         self._mapper: PluginMapper | None = None
 
         if setup_mapper:
@@ -185,6 +216,8 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
                 stream_name,
                 stream_name,
             )
+            # The new sink may change the destination of in-flight batches
+            self._wait_for_inflight_batches(stream_name)
             self._sinks_to_clear.append(self._sinks_active.pop(stream_name))
             return self.add_sink(stream_name, schema, key_properties)
 
@@ -294,6 +327,51 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
             )
             self.drain_all()
 
+    @property
+    def max_buffer_size_bytes(self) -> int | None:
+        """The maximum estimated size of the records buffered across all sinks.
+
+        Returns:
+            The max number of bytes or None if not set.
+        """
+        return self._max_buffer_size_bytes
+
+    def _handle_max_buffer_size(self) -> None:
+        """Drain the largest sinks until the buffered records fit the buffer size."""
+        max_size = self.max_buffer_size_bytes
+        if max_size is None or self._buffered_bytes <= max_size:
+            return
+
+        # The running total also counts records of sinks drained since, so recompute
+        buffered = sum(
+            sink.current_size_bytes
+            for sink in (*self._sinks_to_clear, *self._sinks_active.values())
+        )
+        if buffered > max_size and self._sinks_to_clear:
+            # Drain outdated sinks first so records keep their order
+            buffered -= sum(sink.current_size_bytes for sink in self._sinks_to_clear)
+            self._drain_all(self._sinks_to_clear, 1)
+            self._sinks_to_clear = []
+
+        for sink in sorted(
+            self._sinks_active.values(),
+            key=lambda sink: sink.current_size_bytes,
+            reverse=True,
+        ):
+            if buffered <= max_size:
+                break
+            self.logger.info(
+                "Buffered records exceed the max buffer size of %d bytes. Draining "
+                "target sink for '%s' with an estimated size of %d bytes...",
+                max_size,
+                sink.stream_name,
+                sink.current_size_bytes,
+            )
+            buffered -= sink.current_size_bytes
+            self._drain_full_sink(sink)
+
+        self._buffered_bytes = buffered
+
     def process_endofpipe(self) -> None:
         """Called after all input lines have been read."""
         self.drain_all(is_endofpipe=True)
@@ -305,12 +383,55 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
             message_dict: TODO
         """
         self._assert_line_requires(message_dict, requires={"stream", "record"})
+        self._process_record(
+            message_dict,
+            self._get_record_stream_maps(message_dict["stream"]),
+        )
+        self._handle_max_record_age()
 
-        stream_name = message_dict["stream"]
+    def _process_record_messages(self, message_dicts: list[dict]) -> None:
+        """Process a run of RECORD messages for the same stream.
+
+        Stream map lookup and the max record age check are done once per run.
+
+        Args:
+            message_dicts: The RECORD messages, in input order.
+        """
+        for message_dict in message_dicts:
+            self._assert_line_requires(message_dict, requires={"stream", "record"})
+
+        stream_maps = self._get_record_stream_maps(message_dicts[0]["stream"])
+        for message_dict in message_dicts:
+            self._process_record(message_dict, stream_maps)
+        self._handle_max_record_age()
+
+    def _get_record_stream_maps(self, stream_name: str) -> list[StreamMap]:
+        """Get the stream maps for records of a stream.
+
+        Args:
+            stream_name: Name of the stream.
+
+        Returns:
+            The stream maps registered for the stream.
+        """
         if stream_name not in self.mapper.stream_maps:
             self._assert_sink_exists(stream_name)
 
-        for stream_map in self.mapper.stream_maps[stream_name]:
+        return self.mapper.stream_maps[stream_name]
+
+    def _process_record(
+        self,
+        message_dict: dict,
+        stream_maps: list[StreamMap],
+    ) -> None:
+        """Map a single RECORD message and hand it over to the sinks.
+
+        Args:
+            message_dict: The RECORD message.
+            stream_maps: The stream maps for the message's stream.
+        """
+        size_bytes = self.message_reader.current_message_size
+        for stream_map in stream_maps:
             raw_record = copy.copy(message_dict["record"])
             transformed_record = stream_map.transform(raw_record)
             if transformed_record is None:
@@ -333,7 +454,8 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
             transformed_record = sink.preprocess_record(transformed_record, context)
             sink._singer_validate_message(transformed_record)  # noqa: SLF001
 
-            sink.tally_record_read()
+            sink.tally_record_read(size_bytes=size_bytes)
+            self._buffered_bytes += size_bytes
             sink.process_record(transformed_record, context)
             sink.record_counter_metric.increment()
             sink._after_process_record(context)  # noqa: SLF001
@@ -344,9 +466,9 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
                     sink.stream_name,
                     sink.current_size,
                 )
-                self.drain_one(sink)
+                self._drain_full_sink(sink)
 
-        self._handle_max_record_age()
+        self._handle_max_buffer_size()
 
     def _process_schema_message(self, message_dict: dict) -> None:
         """Process a SCHEMA messages.
@@ -443,6 +565,7 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
                     "the schema for '%s' even though `add_record_metadata` is "
                     "disabled.",
                 )
+            self._wait_for_inflight_batches(sink.stream_name)
             sink.activate_version(message_dict["version"])
 
     def _process_batch_message(self, message_dict: dict) -> None:
@@ -456,6 +579,7 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
 
         for stream_map in self.mapper.stream_maps[stream_name]:
             sink = self.get_sink(stream_map.stream_alias)
+            self._wait_for_inflight_batches(sink.stream_name)
             sink.process_batch_files(
                 encoding,
                 message_dict["manifest"],
@@ -474,6 +598,7 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
             is_endofpipe: This is called after the target instance has finished
                 listening to the stdin.
         """
+        self._wait_for_inflight_batches()
         self._drain_all(self._sinks_to_clear, 1)
         if is_endofpipe:
             for sink in self._sinks_to_clear:
@@ -483,11 +608,15 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
         if is_endofpipe:
             for sink in self._sinks_active.values():
                 sink.clean_up()
+            if self._drain_executor is not None:
+                self._drain_executor.shutdown()
+                self._drain_executor = None
 
         if self._latest_state:
             self._write_state_message(copy.deepcopy(self._latest_state))
 
         self._reset_max_record_age()
+        self._buffered_bytes = 0
 
     @t.final
     def drain_one(self, sink: Sink) -> None:  # noqa: PLR6301
@@ -506,6 +635,93 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
             sink.process_batch(draining_status)
         sink.mark_drained()
 
+    def _drain_full_sink(self, sink: Sink) -> None:
+        """Drain a full sink, in the background if enabled.
+
+        Args:
+            sink: Sink to be drained.
+        """
+        if self.max_inflight_batches > 0:
+            self._drain_one_in_background(sink)
+        else:
+            self.drain_one(sink)
+
+    def _drain_one_in_background(self, sink: Sink) -> None:
+        """Hand the batch of a sink over to the drain workers.
+
+        Blocks until the number of in-flight batches is below the limits.
+
+        Args:
+            sink: Sink to be drained.
+        """
+        if sink.current_size == 0:
+            return
+
+        inflight = self._inflight_batches[sink.stream_name]
+        self._reap_inflight_batches()
+        while len(inflight) >= max(sink.max_inflight_batches, 1):
+            self._wait_for_next_batch(inflight)
+        while (
+            sum(len(futures) for futures in self._inflight_batches.values())
+            >= self.max_inflight_batches
+        ):
+            self._wait_for_next_batch(
+                [f for futures in self._inflight_batches.values() for f in futures],
+            )
+
+        if self._drain_executor is None:
+            self._drain_executor = ThreadPoolExecutor(
+                max_workers=self.max_inflight_batches,
+                thread_name_prefix=f"{self.name}-drain",
+            )
+        batch = sink._detach_batch()  # noqa: SLF001
+        future = self._drain_executor.submit(self._process_detached_batch, sink, batch)
+        inflight.append(future)
+
+    def _process_detached_batch(self, sink: Sink, batch: _DetachedBatch) -> None:
+        """Process a detached batch. Runs in a drain worker thread.
+
+        Args:
+            sink: The sink the batch belongs to.
+            batch: The batch to process.
+        """
+        # Timers are not reentrant, so use one per batch
+        with sink.get_batch_processing_timer():
+            sink.process_batch(batch.context)
+        with self._drained_batch_lock:
+            sink._mark_batch_drained(batch)  # noqa: SLF001
+
+    def _wait_for_next_batch(self, futures: list[Future[None]]) -> None:
+        """Wait until one of the given in-flight batches is processed.
+
+        Args:
+            futures: The in-flight batches to wait for.
+        """
+        wait(futures, return_when=FIRST_COMPLETED)
+        self._reap_inflight_batches()
+
+    def _wait_for_inflight_batches(self, stream_name: str | None = None) -> None:
+        """Wait until the in-flight batches of a stream, or all of them, are processed.
+
+        Args:
+            stream_name: The stream to wait for. All streams if not provided.
+        """
+        if stream_name is None:
+            futures = [f for fs in self._inflight_batches.values() for f in fs]
+        else:
+            futures = self._inflight_batches.get(stream_name, [])
+        if futures:
+            wait(futures)
+        self._reap_inflight_batches()
+
+    def _reap_inflight_batches(self) -> None:
+        """Forget processed batches, raising the error of any failed batch."""
+        for futures in self._inflight_batches.values():
+            done = [future for future in futures if future.done()]
+            for future in done:
+                futures.remove(future)
+                future.result()
+
     def _drain_all(self, sink_list: Iterable[Sink], parallelism: int) -> None:
         if parallelism == 1:
             for sink in sink_list:
@@ -627,6 +843,7 @@ class Target(BaseSingerReader, metaclass=abc.ABCMeta):
         _merge_missing(ADD_RECORD_METADATA_CONFIG, config_jsonschema)
         _merge_missing(TARGET_LOAD_METHOD_CONFIG, config_jsonschema)
         _merge_missing(TARGET_BATCH_SIZE_ROWS_CONFIG, config_jsonschema)
+        _merge_missing(TARGET_BATCH_SIZE_BYTES_CONFIG, config_jsonschema)
 
         capabilities = cls.capabilities
 
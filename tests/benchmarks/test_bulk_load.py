@@ -0,0 +1,67 @@
+"""Test SQL bulk loads."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+import sqlalchemy as sa
+
+from singer_sdk.sql import SQLConnector, SQLSink, SQLTarget
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+# Bulk load Benchmarks
+
+
+class _Sink(SQLSink):
+    connector_class = SQLConnector
+
+
+class _Target(SQLTarget):
+    name = "bench-target"
+    config_jsonschema: t.ClassVar[dict] = {"type": "object", "properties": {}}
+    default_sink_class = _Sink
+
+
+@pytest.fixture
+def bench_records():
+    """A batch of records."""
+    return [
+        {
+            "Id": i,
+            "name": f"user-{i}",
+            "created_at": "2021-01-01T00:08:00-07:00",
+            "value": 1.23,
+        }
+        for i in range(10_000)
+    ]
+
+
+@pytest.mark.parametrize("method", ["executemany", "sqlite"])
+def test_bench_bulk_insert_records(benchmark, bench_records, tmp_path: Path, method):
+    """Run benchmark for inserting a batch of 10,000 records into SQLite."""
+    schema = {
+        "properties": {
+            "Id": {"type": "integer"},
+            "name": {"type": "string"},
+            "created_at": {"type": "string", "format": "date-time"},
+            "value": {"type": "number"},
+        },
+    }
+    target = _Target(
+        config={
+            "sqlalchemy_url": f"sqlite:///{tmp_path}/bench.sqlite",
+            "bulk_load_method": method,
+        },
+    )
+    sink = _Sink(target, stream_name="users", schema=schema, key_properties=["Id"])
+    sink.setup()
+
+    def run_bulk_insert_records():
+        sink.bulk_insert_records(sink.full_table_name, schema, bench_records)
+        with sink.connector._connect() as conn, conn.begin():
+            conn.execute(sa.text("DELETE FROM users"))
+
+    benchmark(run_bulk_insert_records)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import itertools
 import json
 
@@ -55,6 +56,39 @@ def test_bench_format_message(benchmark, bench_record_message: RecordMessage):
     benchmark(run_format_message)
 
 
+@pytest.mark.parametrize("fast_path", [False, True], ids=["message", "record"])
+def test_bench_write_record(benchmark, bench_record_message: RecordMessage, fast_path):
+    """Run benchmark for MsgSpecWriter, with and without the record fast path."""
+    from singer_sdk.contrib.msgspec import MsgSpecWriter  # noqa: PLC0415
+
+    number_of_runs = 1000
+    writer = MsgSpecWriter()
+    writer._write_output = lambda _: None
+    writer._flush_output = lambda: None
+    message = bench_record_message
+
+    def run_write_record():
+        for _ in range(number_of_runs):
+            if fast_path:
+                writer.write_record(
+                    message.stream,
+                    message.record,
+                    version=message.version,
+                    time_extracted=message.time_extracted,
+                )
+            else:
+                writer.write_message(
+                    RecordMessage(
+                        stream=message.stream,
+                        record=message.record,
+                        version=message.version,
+                        time_extracted=message.time_extracted,
+                    ),
+                )
+
+    benchmark(run_write_record)
+
+
 def test_bench_deserialize_json(benchmark, bench_encoded_record: str):
     """Run benchmark for Sink._validator method validate."""
     from singer_sdk.contrib.msgspec import MsgSpecReader  # noqa: PLC0415
@@ -67,3 +101,42 @@ def test_bench_deserialize_json(benchmark, bench_encoded_record: str):
             reader.deserialize_json(record)
 
     benchmark(run_deserialize_json)
+
+
+@pytest.mark.parametrize("typed", [False, True], ids=["dict", "typed"])
+def test_bench_deserialize_lines(benchmark, bench_encoded_record: str, typed: bool):
+    """Run benchmark for decoding a block of messages into dicts or typed structs."""
+    from singer_sdk.contrib.msgspec import (  # noqa: PLC0415
+        MsgSpecReader,
+        TypedMsgSpecReader,
+    )
+
+    number_of_runs = 1000
+    reader = TypedMsgSpecReader() if typed else MsgSpecReader()
+    data = memoryview(f"{bench_encoded_record}\n".encode() * number_of_runs)
+
+    def run_deserialize_lines():
+        reader.deserialize_lines(data)
+
+    benchmark(run_deserialize_lines)
+
+
+@pytest.mark.parametrize("bulk_read_size", [None, 1024 * 1024], ids=["lines", "bulk"])
+def test_bench_process_lines(benchmark, bench_encoded_record: str, bulk_read_size):
+    """Run benchmark for MsgSpecReader.process_lines, line by line and in bulk."""
+    from singer_sdk.contrib.msgspec import MsgSpecReader  # noqa: PLC0415
+
+    number_of_runs = 1000
+    reader = MsgSpecReader(bulk_read_size=bulk_read_size)
+    data = f"{bench_encoded_record}\n".encode() * number_of_runs
+    callbacks = {"RECORD": lambda _: None}
+    batch_callbacks = {"RECORD": lambda _: None}
+
+    def run_process_lines():
+        reader.process_lines(
+            io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"),
+            callbacks,
+            batch_callbacks,
+        )
+
+    benchmark(run_process_lines)
@@ -0,0 +1,50 @@
+"""Test JSONPath extraction."""
+
+from __future__ import annotations
+
+import pytest
+
+from singer_sdk.helpers.jsonpath import _jsonpath_ng_extractor, extract_jsonpath
+
+# JSONPath Benchmarks
+
+
+@pytest.fixture
+def bench_page():
+    """A typical page of an API response."""
+    return {
+        "data": [
+            {
+                "id": i,
+                "name": f"user-{i}",
+                "created_at": "2021-01-01T00:08:00-07:00",
+                "updated_at": "2022-01-02T00:09:00-07:00",
+                "value": 1.23,
+                "tags": ["a", "b"],
+            }
+            for i in range(1000)
+        ],
+        "meta": {"next_page": "abc123", "total": 100_000},
+    }
+
+
+@pytest.mark.parametrize("engine", ["jsonpath_ng", "simple"])
+@pytest.mark.parametrize("expression", ["$.data[*]", "$.meta.next_page"])
+def test_bench_extract_jsonpath(benchmark, bench_page, engine, expression):
+    """Run benchmark for extracting the matches of a JSONPath from 100 pages."""
+    number_of_runs = 100
+
+    if engine == "simple":
+
+        def extract(page):
+            return extract_jsonpath(expression, page)
+
+    else:
+        extract = _jsonpath_ng_extractor(expression)
+
+    def run_extract_jsonpath():
+        for _ in range(number_of_runs):
+            for _match in extract(bench_page):
+                pass
+
+    benchmark(run_extract_jsonpath)
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import datetime
 import decimal
 import io
+import json
 from contextlib import nullcontext, redirect_stdout
 from textwrap import dedent
 
 import pytest
 
-from singer_sdk.contrib.msgspec import MsgSpecReader, MsgSpecWriter, dec_hook, enc_hook
-from singer_sdk.singerlib import RecordMessage
+from singer_sdk.contrib.msgspec import (
+    MsgSpecReader,
+    MsgSpecWriter,
+    TypedMsgSpecReader,
+    dec_hook,
+    enc_hook,
+)
+from singer_sdk.singerlib import RecordMessage, StateMessage
 from singer_sdk.singerlib.exceptions import InvalidInputLine
 
 CALLBACKS = {
@@ -121,3 +129,196 @@ def test_write_message():
     assert out.read() == (
         '{"type":"RECORD","stream":"test","record":{"id":1,"name":"test"}}\n'
     )
+
+
+@pytest.mark.parametrize("buffered", [False, True], ids=["unbuffered", "buffered"])
+@pytest.mark.parametrize(
+    "version,time_extracted",
+    [
+        pytest.param(None, None, id="plain"),
+        pytest.param(1, None, id="version"),
+        pytest.param(
+            2,
+            datetime.datetime(
+                2023, 1, 1, 4, tzinfo=datetime.timezone(datetime.timedelta(hours=-7))
+            ),
+            id="version-time-extracted-offset",
+        ),
+    ],
+)
+def test_write_record(version, time_extracted, buffered):
+    writer = MsgSpecWriter(buffer_max_messages=10 if buffered else None)
+    record = {"id": 1, "name": "test", "value": decimal.Decimal("1.23")}
+    expected = bytes(
+        writer.format_message(
+            RecordMessage(
+                stream="test",
+                record=record,
+                version=version,
+                time_extracted=time_extracted,
+            ),
+        ),
+    ).decode()
+    with redirect_stdout(io.TextIOWrapper(io.BytesIO())) as out:  # noqa: PLW1514
+        writer.write_record(
+            "test",
+            record,
+            version=version,
+            time_extracted=time_extracted,
+        )
+        writer.write_record(
+            "test",
+            {"id": 2},
+            version=version,
+            time_extracted=time_extracted,
+        )
+        writer.flush()
+
+    out.seek(0)
+    lines = out.read().splitlines(keepends=True)
+    assert lines[0] == expected
+    assert json.loads(lines[1])["record"] == {"id": 2}
+
+
+def test_write_message_buffered():
+    writer = MsgSpecWriter(buffer_max_messages=10)
+    with redirect_stdout(io.TextIOWrapper(io.BytesIO())) as out:  # noqa: PLW1514
+        writer.write_message(RecordMessage(stream="test", record={"id": 1}))
+        writer.write_message(RecordMessage(stream="test", record={"id": 2}))
+        writer.write_message(StateMessage(value={"bookmarks": {}}))
+        writer.write_message(RecordMessage(stream="test", record={"id": 3}))
+        writer.flush()
+
+    out.seek(0)
+    assert out.read().splitlines() == [
+        '{"type":"RECORD","stream":"test","record":{"id":1}}',
+        '{"type":"RECORD","stream":"test","record":{"id":2}}',
+        '{"type":"STATE","value":{"bookmarks":{}}}',
+        '{"type":"RECORD","stream":"test","record":{"id":3}}',
+    ]
+
+
+def test_process_lines_bulk():
+    reader = MsgSpecReader(bulk_read_size=32)
+    input_lines = io.TextIOWrapper(
+        io.BytesIO(
+            b'{"type": "SCHEMA", "stream": "users", "schema": {"properties": {}}}\n'
+            b'{"type": "RECORD", "stream": "users", "record": {"id": 1, "x": 1.5}}\n'
+            b'{"type": "RECORD", "stream": "users", "record": {"id": 2}}\n'
+            b'{"type": "STATE", "value": {"bookmarks": {}}}\n',
+        ),
+        encoding="utf-8",
+    )
+    records = []
+    counter = reader.process_lines(
+        input_lines,
+        CALLBACKS,
+        {"RECORD": lambda messages: records.extend(m["record"] for m in messages)},
+    )
+    assert counter == {"SCHEMA": 1, "RECORD": 2, "STATE": 1}
+    assert records == [{"id": 1, "x": decimal.Decimal("1.5")}, {"id": 2}]
+
+
+def test_deserialize_lines_error():
+    reader = MsgSpecReader()
+    with pytest.raises(InvalidInputLine, match="not-json"):
+        reader.deserialize_lines(b'{"type": "STATE", "value": {}}\nnot-json\n')
+
+
+@pytest.mark.parametrize(
+    "line,expected,exception",
+    [
+        pytest.param(
+            '{"type": "RECORD", "stream": "users", "record": {"id": 1, "value": 1.23}}',
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {"id": 1, "value": decimal.Decimal("1.23")},
+            },
+            nullcontext(),
+            id="record",
+        ),
+        pytest.param(
+            '{"type": "RECORD", "stream": "users", "record": {}, '
+            '"time_extracted": "2023-01-01T11:00:00+00:00"}',
+            {
+                "type": "RECORD",
+                "stream": "users",
+                "record": {},
+                "time_extracted": "2023-01-01T11:00:00+00:00",
+            },
+            nullcontext(),
+            id="record-time-extracted",
+        ),
+        pytest.param(
+            '{"type": "STATE", "value": {}, "extra": 1}',
+            {"type": "STATE", "value": {}},
+            nullcontext(),
+            id="state-extra-key",
+        ),
+        pytest.param(
+            '{"type": "UNKNOWN", "stream": "users"}',
+            {"type": "UNKNOWN", "stream": "users"},
+            nullcontext(),
+            id="unknown-type",
+        ),
+        pytest.param(
+            '{"type": "RECORD", "record": {}}',
+            None,
+            pytest.raises(InvalidInputLine, match="missing required field `stream`"),
+            id="record-missing-stream",
+        ),
+        pytest.param(
+            '{"type": "SCHEMA", "stream": "users", "schema": {"type": "object"}}',
+            None,
+            pytest.raises(InvalidInputLine, match="missing required properties key"),
+            id="schema-missing-properties",
+        ),
+        pytest.param(
+            "not-valid-json",
+            None,
+            pytest.raises(InvalidInputLine),
+            id="unparsable",
+        ),
+    ],
+)
+def test_typed_deserialize(line, expected, exception):
+    reader = TypedMsgSpecReader()
+    with exception:
+        assert reader.deserialize_json(line) == expected
+
+
+def test_typed_process_lines_bulk():
+    reader = TypedMsgSpecReader(bulk_read_size=1024)
+    input_lines = io.TextIOWrapper(
+        io.BytesIO(
+            b'{"type": "SCHEMA", "stream": "users", "schema": {"properties": {}}}\n'
+            b'{"type": "RECORD", "stream": "users", "record": {"id": 1}}\n'
+            b'{"type": "RECORD", "stream": "users", "record": {"id": 2}}\n'
+            b'{"type": "STATE", "value": {"bookmarks": {}}}\n',
+        ),
+        encoding="utf-8",
+    )
+    records = []
+    counter = reader.process_lines(
+        input_lines,
+        CALLBACKS,
+        {"RECORD": lambda messages: records.extend(m["record"] for m in messages)},
+    )
+    assert counter == {"SCHEMA": 1, "RECORD": 2, "STATE": 1}
+    assert records == [{"id": 1}, {"id": 2}]
+
+
+@pytest.mark.parametrize("bulk_read_size", [None, 1024], ids=["lines", "bulk"])
+def test_typed_process_missing_type(bulk_read_size):
+    reader = TypedMsgSpecReader(bulk_read_size=bulk_read_size)
+    input_lines = io.StringIO('{"stream": "users", "record": {}}\n')
+    with pytest.raises(InvalidInputLine, match="missing required type"):
+        reader.process_lines(input_lines, CALLBACKS)
+
+
+def test_typed_process_unknown_message():
+    reader = TypedMsgSpecReader(bulk_read_size=1024)
+    input_lines = io.StringIO('{"type": "STATE", "value": {}}\n{"type": "UNKNOWN"}\n')
+    with pytest.raises(ValueError, match="Unknown message type"):
+        reader.process_lines(input_lines, CALLBACKS)
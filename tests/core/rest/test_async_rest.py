@@ -0,0 +1,165 @@
+"""Tests for the asyncio-based REST stream."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.helpers._rate_limit import RateLimiter
+from singer_sdk.pagination import BaseOffsetPaginator, JSONPathPaginator
+from singer_sdk.streams import AsyncRESTStream
+
+if t.TYPE_CHECKING:
+    import requests_mock
+
+    from singer_sdk.tap_base import Tap
+
+PAGE_SIZE = 10
+TOTAL_RECORDS = 45
+
+
+class OffsetPaginator(BaseOffsetPaginator):
+    def has_more(self, response: requests.Response) -> bool:
+        return len(response.json()) == self._page_size
+
+
+class AsyncOffsetStream(AsyncRESTStream):
+    """A stream that fakes an API with an offset parameter."""
+
+    name = "async_stream"
+    url_base = "https://example.com"
+    path = "/items"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+    max_concurrent_requests = 3
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested: list[int] = []
+
+    def get_new_paginator(self) -> OffsetPaginator:
+        return OffsetPaginator(start_value=0, page_size=PAGE_SIZE)
+
+    def get_url_params(self, context: dict | None, next_page_token: int | None):  # noqa: ARG002
+        return {"offset": next_page_token}
+
+    async def send_request(
+        self,
+        prepared_request: requests.PreparedRequest,
+    ) -> requests.Response:
+        offset = int(parse_qs(urlparse(prepared_request.url).query)["offset"][0])
+        self.requested.append(offset)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later pages arrive first
+            await asyncio.sleep(0.002 * (TOTAL_RECORDS - offset) / PAGE_SIZE)
+        finally:
+            self.in_flight -= 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response.request = prepared_request
+        response._content = json.dumps(
+            [{"id": i} for i in range(offset, min(offset + PAGE_SIZE, TOTAL_RECORDS))]
+        ).encode()
+        return response
+
+
+def test_async_offset_pagination(rest_tap: Tap):
+    stream = AsyncOffsetStream(rest_tap)
+    records = list(stream.get_records(None))
+
+    assert [record["id"] for record in records] == list(range(TOTAL_RECORDS))
+    assert stream.max_in_flight == 3
+    assert stream.requested[:5] == [0, 10, 20, 30, 40]
+    # The event loop is stopped once the records were fetched
+    assert stream._event_loop_thread._loop is None
+
+
+def test_async_rate_limit(rest_tap: Tap, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        rest_tap,
+        "_rate_limiter",
+        RateLimiter(max_concurrent_requests=2),
+    )
+    stream = AsyncOffsetStream(rest_tap)
+    records = list(stream.get_records(None))
+
+    assert [record["id"] for record in records] == list(range(TOTAL_RECORDS))
+    assert stream.max_in_flight == 2
+
+
+def test_async_unpredictable_paginator(rest_tap: Tap):
+    class NextTokenStream(AsyncOffsetStream):
+        def get_new_paginator(self) -> JSONPathPaginator:
+            return JSONPathPaginator("$[-1:].id")
+
+        def get_url_params(self, context: dict | None, next_page_token: int | None):  # noqa: ARG002
+            return {"offset": 0 if next_page_token is None else next_page_token + 1}
+
+    stream = NextTokenStream(rest_tap)
+    records = list(stream.get_records(None))
+
+    assert [record["id"] for record in records] == list(range(TOTAL_RECORDS))
+    assert stream.max_in_flight == 1
+
+
+def test_async_concurrent_contexts(rest_tap: Tap):
+    stream = AsyncOffsetStream(rest_tap)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(
+                lambda context: list(stream.get_records(context)),
+                [{"account": "a"}, {"account": "b"}],
+            )
+        )
+
+    for records in results:
+        assert [record["id"] for record in records] == list(range(TOTAL_RECORDS))
+    # Both contexts share the request limit
+    assert stream.max_in_flight == 3
+    assert stream._event_loop_thread._loop is None
+
+
+def test_async_default_session(rest_tap: Tap, requests_mock: requests_mock.Mocker):
+    class SessionStream(AsyncRESTStream):
+        name = "session_stream"
+        url_base = "https://example.com"
+        path = "/items"
+        schema = AsyncOffsetStream.schema
+
+    requests_mock.get("https://example.com/items", json=[{"id": 1}, {"id": 2}])
+    stream = SessionStream(rest_tap)
+    assert list(stream.get_records(None)) == [{"id": 1}, {"id": 2}]
+
+
+def test_async_request_error(rest_tap: Tap):
+    class FailingStream(AsyncOffsetStream):
+        async def send_request(
+            self,
+            prepared_request: requests.PreparedRequest,
+        ) -> requests.Response:
+            response = await super().send_request(prepared_request)
+            if "offset=20" in prepared_request.url:
+                response.status_code = 404
+            return response
+
+    stream = FailingStream(rest_tap)
+    records = stream.get_records(None)
+    with pytest.raises(FatalAPIError, match="404 Client Error"):
+        for _ in records:
+            pass
+    assert stream._event_loop_thread._loop is None
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import logging
+import typing as t
+
+import pytest
+import requests
+
+from singer_sdk import metrics
+from singer_sdk.authenticators import APIKeyAuthenticator
+from singer_sdk.helpers._http_cache import ResponseCache
+from singer_sdk.streams import AsyncRESTStream
+from singer_sdk.streams.rest import RESTStream
+from singer_sdk.tap_base import Tap
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    import requests_mock
+
+
+def _response(
+    content: bytes = b"[]",
+    status_code: int = 200,
+    **headers: str,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = content
+    return response
+
+
+def _request(url: str, method: str = "GET", body: bytes | None = None):
+    return requests.Request(method, url, data=body).prepare()
+
+
+def test_response_cache(tmp_path: Path):
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    key = cache.key(_request("https://example.com/users?page=1"))
+
+    assert cache.get(key) is None
+    assert cache.put(
+        key,
+        _response(
+            b'[{"id": 1}]',
+            ETag='"abc"',
+            **{"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        ),
+    )
+
+    # The cache is persisted
+    cache.close()
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    cached = cache.get(key)
+    assert cached is not None
+    assert cached.body == b'[{"id": 1}]'
+    assert cached.conditional_headers == {"If-None-Match": '"abc"'}
+
+    replayed = cached.replay(_response(b"", 304, ETag='"abc"', Date="today"))
+    assert replayed.status_code == 200
+    assert replayed.json() == [{"id": 1}]
+    assert replayed.headers["Content-Type"] == "application/json"
+    assert replayed.headers["Date"] == "today"
+    assert "Content-Encoding" not in replayed.headers
+
+
+def test_response_cache_key():
+    keys = {
+        ResponseCache.key(_request("https://example.com/users")),
+        ResponseCache.key(_request("https://example.com/users?page=2")),
+        ResponseCache.key(_request("https://example.com/users", "POST", b"a=1")),
+        ResponseCache.key(_request("https://example.com/users", "POST", b"a=2")),
+    }
+    assert len(keys) == 4
+
+
+def test_response_cache_skips_uncacheable(tmp_path: Path):
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    assert not cache.put("no-validators", _response())
+    assert not cache.put("error", _response(status_code=500, ETag="1"))
+    assert cache.put("modified", _response(**{"Last-Modified": "yesterday"}))
+
+    cached = cache.get("modified")
+    assert cached is not None
+    assert cached.conditional_headers == {"If-Modified-Since": "yesterday"}
+
+
+def test_response_cache_eviction(tmp_path: Path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_size_bytes=100)
+    body = bytes(range(40))  # Does not compress
+
+    for key in "abc":
+        assert cache.put(key, _response(body, ETag=key))
+    assert cache.get("a") is None
+
+    # Reading an entry marks it as recently used
+    assert cache.get("b") is not None
+    assert cache.put("d", _response(body, ETag="d"))
+    assert cache.get("c") is None
+    assert cache.get("b") is not None
+
+    assert not cache.put("large", _response(bytes(range(256)) * 2, ETag="large"))
+
+
+class _UsersStream(RESTStream):
+    name = "users"
+    path = "/users"
+    url_base = "https://example.com"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+
+
+class _CachedTap(Tap):
+    name = "cached-tap"
+
+    def discover_streams(self):
+        return [_UsersStream(self)]
+
+
+def test_conditional_requests(
+    tmp_path: Path,
+    requests_mock: requests_mock.Mocker,
+    caplog: pytest.LogCaptureFixture,
+):
+    records = [{"id": 1}, {"id": 2}]
+
+    def respond(request, context):
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            return ""
+        context.headers["ETag"] = '"v1"'
+        return json.dumps(records)
+
+    requests_mock.get("https://example.com/users", text=respond)
+    config = {"http_cache": {"path": str(tmp_path / "cache.sqlite")}}
+
+    tap = _CachedTap(config=config)
+    assert list(tap.streams["users"].request_records(None)) == records
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+    # A new run revalidates the cached response
+    tap = _CachedTap(config=config)
+    assert list(tap.streams["users"].request_records(None)) == records
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger=metrics.METRICS_LOGGER_NAME):
+        tap._log_http_metrics()
+
+    points = {
+        record.args[0].metric: record.args[0].value
+        for record in caplog.records
+        if record.name == metrics.METRICS_LOGGER_NAME
+    }
+    assert points == {metrics.Metric.HTTP_CACHE_HIT_COUNT: 1}
+
+
+class _AsyncUsersStream(AsyncRESTStream):
+    name = "users"
+    path = "/users"
+    url_base = "https://example.com"
+    schema = _UsersStream.schema
+
+
+@pytest.mark.parametrize(
+    "stream_class",
+    [_UsersStream, _AsyncUsersStream],
+    ids=["sync", "async"],
+)
+def test_conditional_requests_query_auth(
+    tmp_path: Path,
+    requests_mock: requests_mock.Mocker,
+    stream_class: type[RESTStream],
+):
+    class Stream(stream_class):
+        @property
+        def authenticator(self):
+            return APIKeyAuthenticator(key="api_key", value="secret", location="params")
+
+    def respond(request, context):
+        context.headers["ETag"] = '"v1"'
+        if request.headers.get("If-None-Match") == '"v1"':
+            context.status_code = 304
+            return ""
+        return json.dumps([{"id": 1}])
+
+    requests_mock.get("https://example.com/users", text=respond)
+    config = {"http_cache": {"path": str(tmp_path / "cache.sqlite")}}
+
+    # The cache key does not depend on the authenticator changing the URL
+    for _ in range(2):
+        stream = Stream(_CachedTap(config=config))
+        assert list(stream.request_records(None)) == [{"id": 1}]
+        assert requests_mock.last_request.qs["api_key"] == ["secret"]
+
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert stream.response_cache is not None
+    assert stream.response_cache.hits == {"users": 1}
+
+
+def test_cache_disabled(tmp_path: Path):
+    class Stream(_UsersStream):
+        cache_responses = False
+
+    tap = _CachedTap(config={"http_cache": {"path": str(tmp_path / "cache.sqlite")}})
+    stream = Stream(tap)
+    assert stream.response_cache is None
+
+    assert _CachedTap(config={}).http_cache is None
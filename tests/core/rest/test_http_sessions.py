@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from singer_sdk import metrics
+from singer_sdk.helpers._sessions import SessionRegistry
+from singer_sdk.streams.rest import RESTStream
+from singer_sdk.tap_base import Tap
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps([{"id": 1, "path": self.path}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _Stream(RESTStream):
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "path": {"type": "string"}},
+    }
+
+    @property
+    def url_base(self) -> str:
+        return self.config.get("url_base", "https://example.com")
+
+
+class _SessionsTap(Tap):
+    name = "sessions-tap"
+
+    def discover_streams(self):
+        return [
+            _Stream(self, name="users", path="/users"),
+            _Stream(self, name="orders", path="/orders"),
+        ]
+
+
+def test_session_registry():
+    registry = SessionRegistry(pool_maxsize=32, max_retries=3, compression=False)
+
+    session = registry.get("https://api.example.com/v1")
+    assert registry.get("HTTPS://API.example.com/v2/") is session
+    assert registry.get("https://other.example.com/v1") is not session
+    assert registry.get("http://api.example.com/v1") is not session
+
+    adapter = session.get_adapter("https://api.example.com/v1")
+    assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+    assert adapter.max_retries.connect == 3  # type: ignore[attr-defined]
+    assert adapter.max_retries.read == 0  # type: ignore[attr-defined]
+    assert session.headers["Accept-Encoding"] == "identity"
+
+    registry.close()
+    assert registry.get("https://api.example.com/v1") is not session
+
+
+def test_session_registry_compression():
+    session = SessionRegistry().get("https://api.example.com")
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_streams_share_session():
+    tap = _SessionsTap(config={"http_session": {}})
+    assert "http_session" in tap.config_jsonschema["properties"]
+
+    users, orders = tap.streams["users"], tap.streams["orders"]
+    assert users.requests_session is orders.requests_session
+
+    tap = _SessionsTap(config={})
+    assert tap.http_sessions is None
+    users, orders = tap.streams["users"], tap.streams["orders"]
+    assert users.requests_session is not orders.requests_session
+
+
+def test_connection_reuse(server_url: str, caplog: pytest.LogCaptureFixture):
+    tap = _SessionsTap(config={"url_base": server_url, "http_session": {}})
+
+    for stream in tap.streams.values():
+        for _ in range(3):
+            assert list(stream.request_records(None)) == [
+                {"id": 1, "path": stream.path}
+            ]
+
+    with caplog.at_level(logging.INFO, logger=metrics.METRICS_LOGGER_NAME):
+        tap._log_http_metrics()
+
+    assert tap.http_sessions is not None
+    assert tap.http_sessions.connection_counts() == {server_url: (1, 6)}
+
+    points = [
+        record.args[0]
+        for record in caplog.records
+        if record.name == metrics.METRICS_LOGGER_NAME
+        and record.args[0].metric == metrics.Metric.HTTP_CONNECTION_COUNT
+    ]
+    assert len(points) == 1
+    assert points[0].value == 1
+    assert points[0].tags == {"endpoint": server_url}
+
+
+def test_sessions_closed_after_sync(server_url: str):
+    tap = _SessionsTap(config={"url_base": server_url, "http_session": {}})
+    tap.sync_all()
+
+    assert tap.http_sessions is not None
+    assert tap.http_sessions.connection_counts() == {}
+
+
+def test_sessions_closed_after_failed_sync(server_url: str):
+    class _FailingStream(_Stream):
+        def post_process(self, row, context=None):  # noqa: ARG002
+            msg = "Cannot process record"
+            raise RuntimeError(msg)
+
+    class _FailingTap(_SessionsTap):
+        def discover_streams(self):
+            return [_FailingStream(self, name="users", path="/users")]
+
+    tap = _FailingTap(config={"url_base": server_url, "http_session": {}})
+    with pytest.raises(RuntimeError, match="Cannot process record"):
+        tap.sync_all()
+
+    assert tap.http_sessions is not None
+    assert tap.http_sessions.connection_counts() == {}
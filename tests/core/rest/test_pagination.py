@@ -9,6 +9,8 @@ from urllib.parse import parse_qs, urlparse
 import pytest
 from requests import Response
 
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.helpers._concurrency import PagePrefetcher
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import (
     BaseAPIPaginator,
@@ -84,6 +86,7 @@ def test_paginator_loop():
     assert not paginator.finished
     assert paginator.current_value is None
     assert paginator.count == 0
+    assert paginator.predict_next("abc") is None
 
     response._content = b'{"nextPageToken": "abc"}'
     paginator.advance(response)
@@ -111,6 +114,7 @@ def test_paginator_page_number():
     assert not paginator.finished
     assert paginator.current_value == 0
     assert paginator.count == 0
+    assert paginator.predict_next(0) == 1
 
     response._content = has_more_response
     paginator.advance(response)
@@ -171,6 +175,7 @@ def test_paginator_offset():
     assert not paginator.finished
     assert paginator.current_value == 0
     assert paginator.count == 0
+    assert paginator.predict_next(4) == 6
 
     response._content = b'[{"id": 1}, {"id": 2}]'
     paginator.advance(response)
@@ -341,7 +346,12 @@ def test_paginator_custom_hateoas():
     assert paginator.count == 3
 
 
-def test_break_pagination(tap: Tap, caplog: pytest.LogCaptureFixture):
+@pytest.mark.parametrize("prefetch_pages", [0, 2], ids=["serial", "prefetch"])
+def test_break_pagination(
+    tap: Tap,
+    caplog: pytest.LogCaptureFixture,
+    prefetch_pages: int,
+):
     class MyAPIStream(RESTStream[int]):
         """My API stream."""
 
@@ -387,6 +397,7 @@ def test_break_pagination(tap: Tap, caplog: pytest.LogCaptureFixture):
             return r
 
     stream = MyAPIStream(tap=tap)
+    stream.prefetch_pages = prefetch_pages
 
     records_iter = stream.request_records(context=None)
 
@@ -405,7 +416,8 @@ def test_break_pagination(tap: Tap, caplog: pytest.LogCaptureFixture):
     assert "Pagination stopped after 1 pages" in caplog.text
 
 
-def test_continue_if_empty(tap: Tap):
+@pytest.mark.parametrize("prefetch_pages", [0, 2], ids=["serial", "prefetch"])
+def test_continue_if_empty(tap: Tap, prefetch_pages: int):
     class _TestPaginator(BasePageNumberPaginator):
         def has_more(self, response: Response) -> bool:
             return response.json().get("hasMore", False)
@@ -468,6 +480,7 @@ def test_continue_if_empty(tap: Tap):
             return r
 
     stream = MyAPIStream(tap=tap)
+    stream.prefetch_pages = prefetch_pages
     records_iter = stream.request_records(context=None)
 
     assert next(records_iter) == {"id": 1}
@@ -521,3 +534,104 @@ def test_no_paginator(tap: Tap):
 
     with pytest.raises(StopIteration):
         next(records_iter)
+
+
+class _PrefetchStream(RESTStream[int]):
+    """A stream that fakes an API with an offset parameter and 5 records."""
+
+    name = "my-api-stream"
+    url_base = "https://my.api.test"
+    path = "/path/to/resource"
+    records_jsonpath = "$.data[*]"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+    prefetch_pages = 3
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.requested: list[int] = []
+
+    def get_new_paginator(self) -> BaseOffsetPaginator:
+        class _Paginator(BaseOffsetPaginator):
+            def has_more(self, response: Response) -> bool:
+                return len(response.json()["data"]) == self._page_size
+
+        return _Paginator(0, 2)
+
+    def get_url_params(
+        self,
+        context: dict | None,  # noqa: ARG002
+        next_page_token: int | None,
+    ) -> dict[str, t.Any] | str:
+        return {"offset": next_page_token}
+
+    def _request(
+        self,
+        prepared_request: PreparedRequest,
+        context: dict | None,  # noqa: ARG002
+    ) -> Response:
+        offset = int(parse_qs(urlparse(prepared_request.url).query)["offset"][0])
+        self.requested.append(offset)
+        if offset > 4:
+            # Pages past the end fail
+            msg = "Out of range"
+            raise FatalAPIError(msg)
+
+        r = Response()
+        r.status_code = 200
+        r._content = json.dumps(
+            {"data": [{"id": i} for i in range(offset, min(offset + 2, 5))]},
+        ).encode()
+        return r
+
+
+def test_prefetch_pages(tap: Tap):
+    stream = _PrefetchStream(tap=tap)
+    records = list(stream.request_records(context=None))
+
+    assert [record["id"] for record in records] == [0, 1, 2, 3, 4]
+    # The first pages are requested at once, pages after the last one are discarded
+    assert sorted(stream.requested)[:4] == [0, 2, 4, 6]
+
+
+def test_prefetch_pages_unpredicted_token(tap: Tap):
+    class _SkippingStream(_PrefetchStream):
+        def get_new_paginator(self) -> BaseOffsetPaginator:
+            class _Paginator(BaseOffsetPaginator):
+                def get_next(self, response: Response) -> int | None:  # noqa: ARG002
+                    # Skip a page
+                    return None if self._value else 4
+
+            return _Paginator(0, 2)
+
+    stream = _SkippingStream(tap=tap)
+    records = list(stream.request_records(context=None))
+
+    assert [record["id"] for record in records] == [0, 1, 4]
+    assert 4 in stream.requested
+
+
+def test_page_prefetcher():
+    paginator = BasePageNumberPaginator(1)
+    cancelled: list[int] = []
+    prefetcher = PagePrefetcher(
+        paginator,
+        lambda token: token,
+        cancelled.append,
+        max_in_flight=3,
+    )
+
+    assert prefetcher.next() == 1
+    paginator._value = 2
+    assert prefetcher.next() == 2
+    assert cancelled == []
+
+    # Pages sent ahead for predicted tokens are discarded if the paginator skips them
+    paginator._value = 5
+    assert prefetcher.next() == 5
+    assert cancelled == [3, 4]
+
+    prefetcher.discard()
+    assert cancelled == [3, 4, 6, 7]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from singer_sdk import metrics
+from singer_sdk.helpers._rate_limit import (
+    AdaptiveConcurrency,
+    RateLimiter,
+    TokenBucket,
+    _parse_seconds,
+)
+from singer_sdk.pagination import BasePageNumberPaginator
+from singer_sdk.streams.rest import RESTStream
+from singer_sdk.tap_base import Tap
+
+if t.TYPE_CHECKING:
+    import requests_mock
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(status_code: int = 200, **headers: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return response
+
+
+def test_token_bucket():
+    clock = _Clock()
+    bucket = TokenBucket(2, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+    # The tokens owed are paid back first
+    clock.now += 1.5
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_unlimited():
+    clock = _Clock()
+    bucket = TokenBucket(clock=clock)
+    assert [bucket.reserve() for _ in range(100)] == [0] * 100
+
+    bucket.pause(3)
+    clock.now += 1
+    assert bucket.reserve() == 2
+
+    clock.now += 2
+    bucket.pace(remaining=4, seconds=2)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0.5, 1.0]
+
+    # Pacing ends when the quota resets
+    clock.now += 2
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+
+def test_token_bucket_pace_exhausted():
+    clock = _Clock()
+    bucket = TokenBucket(10, clock=clock)
+    bucket.pace(remaining=0, seconds=5)
+    assert bucket.reserve() == 5
+
+
+def test_adaptive_concurrency():
+    concurrency = AdaptiveConcurrency(8, min_limit=2)
+    assert concurrency.limit == 8
+
+    # The first throttled request halves the limit right away
+    assert concurrency.update(throttled=True) == 4
+
+    # Concurrent throttled requests only halve the limit once
+    changes = [concurrency.update(throttled=True) for _ in range(4)]
+    assert changes == [None, None, None, 2]
+    for _ in range(10):
+        concurrency.update(throttled=True)
+    assert concurrency.limit == 2
+
+    # The limit grows by about one for each limit's worth of successful requests
+    changes = [concurrency.update(throttled=False) for _ in range(6)]
+    assert changes == [None, None, 3, None, None, 4]
+
+
+def test_adaptive_concurrency_acquire():
+    concurrency = AdaptiveConcurrency(2)
+    concurrency.acquire()
+    assert concurrency.try_acquire()
+    assert not concurrency.try_acquire()
+
+    acquired = threading.Event()
+
+    def acquire():
+        concurrency.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+    concurrency.release()
+    assert acquired.wait(1)
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, None),
+        ("30", 30),
+        ("1.5", 1.5),
+        ("1000000060", 60),
+        (formatdate(1_000_000_120, usegmt=True), 120),
+        ("soon", None),
+    ],
+)
+def test_parse_seconds(value: str | None, expected: float | None):
+    assert _parse_seconds(value, now=1_000_000_000) == expected
+
+
+def test_rate_limiter_endpoints():
+    clock = _Clock()
+    limiter = RateLimiter(
+        1,
+        endpoints={"/slow": {"requests_per_second": 0.5}, "/fast": {}},
+        clock=clock,
+    )
+
+    assert [limiter.reserve("/users") for _ in range(2)] == [0, 1]
+    assert [limiter.reserve("/slow") for _ in range(2)] == [0, 2]
+    assert [limiter.reserve("/fast") for _ in range(2)] == [0, 0]
+
+
+def test_rate_limiter_update():
+    clock = _Clock()
+    limiter = RateLimiter(max_concurrent_requests=4, clock=clock)
+
+    assert limiter.update("/users", _response(**{"Retry-After": "2"})) is None
+    assert limiter.reserve("/users") == 2
+
+    clock.now += 2
+    limiter.update("/users", _response(**{"X-RateLimit-Remaining": "0"}))
+    assert limiter.reserve("/users") == 0
+
+    limiter.update(
+        "/users",
+        _response(**{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}),
+    )
+    assert limiter.reserve("/users") == pytest.approx(3, abs=0.01)
+
+    assert limiter.update("/users", _response(429)) == 2
+    assert limiter.concurrency is not None
+    assert limiter.concurrency.limit == 2
+
+
+class _PagesStream(RESTStream):
+    name = "pages"
+    path = "/pages"
+    url_base = "https://example.com"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+
+    def get_new_paginator(self):
+        return BasePageNumberPaginator(start_value=1)
+
+    def get_url_params(self, context, next_page_token):  # noqa: ARG002
+        return {"page": next_page_token}
+
+
+class _RateLimitedTap(Tap):
+    name = "rate-limited-tap"
+
+    def discover_streams(self):
+        return [_PagesStream(self)]
+
+
+def test_rate_limit_setting(
+    requests_mock: requests_mock.Mocker,
+    caplog: pytest.LogCaptureFixture,
+):
+    tap = _RateLimitedTap(config={"rate_limit": {"max_concurrent_requests": 2}})
+    assert tap.rate_limiter is not None
+    assert "rate_limit" in tap.config_jsonschema["properties"]
+    assert _RateLimitedTap(config={}).rate_limiter is None
+
+    requests_mock.get(
+        "https://example.com/pages?page=1",
+        json=[{"id": 1}],
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.2"},
+    )
+    requests_mock.get("https://example.com/pages?page=2", json=[])
+
+    stream = tap.streams["pages"]
+    start = time.perf_counter()
+    with caplog.at_level(logging.INFO, logger=metrics.METRICS_LOGGER_NAME):
+        assert list(stream.request_records(None)) == [{"id": 1}]
+    assert time.perf_counter() - start >= 0.15
+
+    waits = [
+        record.args[0]
+        for record in caplog.records
+        if record.name == metrics.METRICS_LOGGER_NAME
+        and record.args[0].metric == metrics.Metric.HTTP_REQUEST_WAIT
+    ]
+    assert len(waits) == 1
+    assert waits[0].value >= 0.15
+    assert waits[0].tags == {"stream": "pages", "endpoint": "/pages"}
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import decimal
+import json
+import typing as t
+
+import pytest
+
+from singer_sdk.helpers._json_stream import iter_json_items
+from singer_sdk.helpers.jsonpath import _simple_items_path, extract_jsonpath
+from singer_sdk.pagination import JSONPathPaginator
+from singer_sdk.streams.rest import RESTStream
+
+if t.TYPE_CHECKING:
+    import requests_mock
+
+    from singer_sdk.tap_base import Tap
+
+
+def _chunks(document: str, size: int) -> list[bytes]:
+    data = document.encode()
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize(
+    "expression,keys",
+    [
+        ("$[*]", ()),
+        ("$.data[*]", ("data",)),
+        ("$.data.records[*]", ("data", "records")),
+        ("$['my data'][*]", ("my data",)),
+        ('$["data"].items[*]', ("data", "items")),
+        ("$", None),
+        ("$.data", None),
+        ("$.data.*", None),
+        ("$..data[*]", None),
+        ("$.data[0]", None),
+        ("$.data[?(@.id > 1)]", None),
+    ],
+)
+def test_simple_items_path(expression: str, keys: tuple[str, ...] | None):
+    assert _simple_items_path(expression) == keys
+
+
+_DOCUMENTS = [
+    ("$[*]", '[{"id": 1}, {"id": 2}]'),
+    ("$[*]", " [ ] "),
+    (
+        "$.data[*]",
+        '{"meta": {"next": [1, {"a": "}"}]}, "data": [{"id": 1, "v": 1.5}, '
+        '{"id": 23, "name": "caf\\u00e9 é€\U0001f600"}, 4567], '
+        '"after": 1}',
+    ),
+    ("$.data.records[*]", '{"data": {"records": [{"id": 1}]}}'),
+    ("$.data[*]", '{"other": [1, 2]}'),
+    ("$.data[*]", '{"data": null}'),
+    ("$.data[*]", '{"data": 12345}'),
+    ("$.data[*]", '{"data": {"id": 1}}'),
+    ("$.data[*]", "[1, 2]"),
+    ("$.data[*]", "{}"),
+    ("$.data[*]", '{"meta": 0.1, "data": [1, 2]}'),
+    ("$.data[*]", '{"data": [0.5, 2, -1.25e+3, 1E-2, 10, true, null]}'),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+@pytest.mark.parametrize("expression,document", _DOCUMENTS)
+def test_iter_json_items(expression: str, document: str, chunk_size: int):
+    keys = _simple_items_path(expression)
+    assert keys is not None
+
+    items = list(iter_json_items(_chunks(document, chunk_size), keys))
+    expected = list(
+        extract_jsonpath(
+            expression,
+            json.loads(document, parse_float=decimal.Decimal),
+        )
+    )
+    assert items == expected
+
+
+@pytest.mark.parametrize("expression,document", _DOCUMENTS)
+def test_iter_json_items_split(expression: str, document: str):
+    keys = _simple_items_path(expression)
+    assert keys is not None
+    data = document.encode()
+    expected = list(
+        extract_jsonpath(
+            expression,
+            json.loads(document, parse_float=decimal.Decimal),
+        )
+    )
+
+    for offset in range(len(data) + 1):
+        chunks = [data[:offset], data[offset:]]
+        assert list(iter_json_items(chunks, keys)) == expected, offset
+
+
+def test_iter_json_items_lazy():
+    def chunks():
+        yield b'{"data": [{"id": 1}, '
+        yield b'{"id": 2}, '
+        msg = "Should not be read"
+        raise AssertionError(msg)
+
+    items = iter_json_items(chunks(), ("data",))
+    assert next(items) == {"id": 1}
+
+
+def test_iter_json_items_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(_chunks('{"data": [{"id": 1}, {"id": ', 4), ("data",)))
+
+    with pytest.raises(ValueError, match="Expected ']'"):
+        list(iter_json_items([b'{"data": [1 2]}'], ("data",)))
+
+
+class _StreamingStream(RESTStream):
+    name = "streaming"
+    path = "/items"
+    url_base = "https://example.com"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "price": {"type": "number"}},
+    }
+    records_jsonpath = "$.data[*]"
+    stream_responses = True
+
+
+def test_stream_responses(requests_mock: requests_mock.Mocker, rest_tap: Tap):
+    records = [{"id": i, "price": 1.25} for i in range(1000)]
+    requests_mock.get(
+        "https://example.com/items",
+        json={"count": len(records), "data": records},
+    )
+
+    stream = _StreamingStream(rest_tap)
+    assert list(stream.request_records(None)) == [
+        {"id": i, "price": decimal.Decimal("1.25")} for i in range(1000)
+    ]
+    assert requests_mock.last_request.stream is True
+
+
+def test_stream_responses_unsupported_path(
+    requests_mock: requests_mock.Mocker,
+    rest_tap: Tap,
+):
+    class Stream(_StreamingStream):
+        records_jsonpath = "$.data[?(@.id > 1)]"
+
+    requests_mock.get(
+        "https://example.com/items",
+        json={"data": [{"id": 1}, {"id": 2}, {"id": 3}]},
+    )
+
+    stream = Stream(rest_tap)
+    assert list(stream.request_records(None)) == [{"id": 2}, {"id": 3}]
+
+
+def test_stream_responses_body_paginator(
+    requests_mock: requests_mock.Mocker,
+    rest_tap: Tap,
+):
+    class Stream(_StreamingStream):
+        next_page_token_jsonpath = "$.next"  # noqa: S105
+
+    requests_mock.get(
+        "https://example.com/items",
+        [
+            {"json": {"data": [{"id": 1}, {"id": 2}], "next": "page-2"}},
+            {"json": {"data": [{"id": 3}], "next": None}},
+        ],
+    )
+
+    stream = Stream(rest_tap)
+    assert isinstance(stream.get_new_paginator(), JSONPathPaginator)
+    assert list(stream.request_records(None)) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert requests_mock.call_count == 2
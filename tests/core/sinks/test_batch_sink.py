@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+
+import pytest
+
+from tests.conftest import BatchSinkMock, TargetMock
+
+pa = pytest.importorskip("pyarrow")
+
+from singer_sdk.helpers._arrow import (  # noqa: E402
+    ArrowTableBuilder,
+    json_schema_to_arrow_schema,
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "value": {"type": ["number", "null"]},
+        "updated_at": {"type": ["string", "null"], "format": "date-time"},
+        "day": {"type": ["string", "null"], "format": "date"},
+        "tags": {"type": ["array", "null"], "items": {"type": "string"}},
+        "address": {
+            "type": ["object", "null"],
+            "properties": {"city": {"type": "string"}},
+        },
+        "extra": {"type": ["object", "null"]},
+        "code": {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+    },
+}
+
+
+class ColumnarSinkMock(BatchSinkMock):
+    columnar_batches = True
+    columnar_chunk_size = 2
+
+    def process_batch(self, context: dict) -> None:
+        self.target.records_written.extend(context["table"].to_pylist())
+        self.target.num_batches_processed += 1
+
+
+def test_json_schema_to_arrow_schema():
+    assert json_schema_to_arrow_schema(SCHEMA) == pa.schema(
+        [
+            pa.field("id", pa.int64()),
+            pa.field("value", pa.float64()),
+            pa.field("updated_at", pa.timestamp("us", tz="UTC")),
+            pa.field("day", pa.date32()),
+            pa.field("tags", pa.list_(pa.string())),
+            pa.field("address", pa.struct([pa.field("city", pa.string())])),
+            pa.field("extra", pa.string()),
+            pa.field("code", pa.string()),
+        ]
+    )
+
+
+def test_arrow_table_builder():
+    builder = ArrowTableBuilder(json_schema_to_arrow_schema(SCHEMA), chunk_size=2)
+    builder.append(
+        {
+            "id": 1,
+            "value": decimal.Decimal("1.5"),
+            "updated_at": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+            "day": "2024-01-01",
+            "tags": ["a", "b"],
+            "address": {"city": "Lima"},
+            "extra": {"nested": [1, 2]},
+            "code": 7,
+            "unknown": "dropped",
+        }
+    )
+    builder.append({"id": 2})
+    builder.append({"id": 3, "value": 2.5, "code": "x"})
+    assert len(builder) == 3
+
+    table = builder.finish()
+    assert table.num_rows == 3
+    assert table.column("id").num_chunks == 2
+    assert "unknown" not in table.column_names
+    assert table.to_pylist()[0] == {
+        "id": 1,
+        "value": 1.5,
+        "updated_at": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        "day": datetime.date(2024, 1, 1),
+        "tags": ["a", "b"],
+        "address": {"city": "Lima"},
+        "extra": '{"nested":[1,2]}',
+        "code": "7",
+    }
+    assert table.column("code").to_pylist() == ["7", None, "x"]
+
+
+def test_arrow_table_builder_integer_values():
+    schema = pa.schema([pa.field("id", pa.int64())])
+    builder = ArrowTableBuilder(schema, chunk_size=10)
+    builder.append({"id": 1})
+    builder.append({"id": 2.0})
+    builder.append({"id": decimal.Decimal("3")})
+    assert builder.finish().column("id").to_pylist() == [1, 2, 3]
+
+    for value in (2.7, decimal.Decimal("2.7"), "abc", float("inf")):
+        builder = ArrowTableBuilder(schema, chunk_size=10)
+        builder.append({"id": value})
+        with pytest.raises(ValueError, match="property 'id'"):
+            builder.finish()
+
+
+def test_columnar_batches():
+    target = TargetMock()
+    sink = ColumnarSinkMock(target, "users", SCHEMA, ["id"])
+
+    for i in range(5):
+        record = {"id": i, "updated_at": "2024-01-01T00:00:00Z"}
+        sink._validate_and_parse(record)
+        sink.process_record(record, sink._get_context(record))
+        sink.tally_record_read()
+
+    context = sink._pending_batch
+    assert "records" not in context
+    assert len(context["table_builder"]) == 5
+
+    sink.process_batch(sink.start_drain())
+    assert "table_builder" not in sink._context_draining
+    assert [record["id"] for record in target.records_written] == [0, 1, 2, 3, 4]
+    assert target.records_written[0]["updated_at"] == datetime.datetime(
+        2024, 1, 1, tzinfo=datetime.timezone.utc
+    )
+
+
+def test_columnar_batches_schema_change():
+    target = TargetMock()
+    sink = ColumnarSinkMock(target, "users", SCHEMA, ["id"])
+    arrow_schema = sink.arrow_schema
+    assert sink.arrow_schema is arrow_schema
+
+    sink.schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    assert sink.arrow_schema.names == ["id"]
+
+
+@pytest.mark.parametrize("columnar", [False, True], ids=["dicts", "columnar"])
+def test_bench_batch_accumulation(benchmark, columnar: bool):
+    """Run benchmark for accumulating a batch of records and building a table."""
+    target = TargetMock()
+    sink = ColumnarSinkMock(target, "users", SCHEMA, ["id"])
+    sink.columnar_batches = columnar
+    sink.columnar_chunk_size = 1000
+    records = [
+        {
+            "id": i,
+            "value": 1.23,
+            "updated_at": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+            "tags": ["a", "b"],
+            "address": {"city": "Lima"},
+        }
+        for i in range(10_000)
+    ]
+
+    def run_batch():
+        context: dict = {}
+        for record in records:
+            sink.process_record(record, context)
+        if columnar:
+            context.pop("table_builder").finish()
+        else:
+            pa.Table.from_pylist(context["records"], schema=sink.arrow_schema)
+
+    benchmark(run_batch)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import io
+import typing as t
+
+import pytest
+import sqlalchemy as sa
+
+from singer_sdk.exceptions import ConfigValidationError, ConformedNameClashException
+from singer_sdk.sql import SQLConnector, SQLSink, SQLTarget
+from singer_sdk.sql.loaders import (
+    BulkLoader,
+    ExecuteManyBulkLoader,
+    MultiRowValuesBulkLoader,
+    SQLiteBulkLoader,
+    StagedFileBulkLoader,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+
+class _Sink(SQLSink):
+    connector_class = SQLConnector
+
+
+class _Target(SQLTarget):
+    name = "bulk-target"
+    config_jsonschema: t.ClassVar[dict] = {"type": "object", "properties": {}}
+    default_sink_class = _Sink
+
+
+SCHEMA = {
+    "properties": {
+        "id": {"type": "integer"},
+        "Full Name": {"type": ["string", "null"]},
+        "note": {"type": ["string", "null"]},
+    },
+}
+
+
+def _sink(tmp_path: Path, **config: t.Any) -> _Sink:
+    target = _Target(
+        config={"sqlalchemy_url": f"sqlite:///{tmp_path}/db.sqlite", **config},
+    )
+    sink = _Sink(target, stream_name="users", schema=SCHEMA, key_properties=["id"])
+    sink.setup()
+    return sink
+
+
+def _rows(sink: SQLSink) -> list[tuple]:
+    with sink.connector._connect() as conn:
+        return list(conn.execute(sa.text("SELECT * FROM users ORDER BY id")))
+
+
+@pytest.mark.parametrize(
+    "method,loader_class",
+    [
+        (None, SQLiteBulkLoader),
+        ("sqlite", SQLiteBulkLoader),
+        ("executemany", ExecuteManyBulkLoader),
+        ("values", MultiRowValuesBulkLoader),
+    ],
+)
+def test_bulk_load(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    method: str | None,
+    loader_class: type[BulkLoader],
+):
+    monkeypatch.setattr(loader_class, "chunk_size", 2)
+    sink = _sink(tmp_path, bulk_load_method=method)
+    assert "bulk_load_method" in _Target.config_jsonschema["properties"]
+    assert isinstance(sink.connector.get_bulk_loader(), loader_class)
+
+    records = [
+        {"id": 1, "Full Name": "Ada", "note": "first"},
+        {"note": "no name", "id": 2},
+        {"id": 3, "Full Name": "Grace", "extra": "ignored"},
+        {"id": 4, "Full Name": "Alan", "note": "tab\there"},
+        {"id": 5},
+    ]
+    count = sink.bulk_insert_records(sink.full_table_name, SCHEMA, records)
+
+    assert count == 5
+    assert _rows(sink) == [
+        (1, "Ada", "first"),
+        (2, None, "no name"),
+        (3, "Grace", None),
+        (4, "Alan", "tab\there"),
+        (5, None, None),
+    ]
+
+
+def test_unsupported_bulk_load_method(tmp_path: Path):
+    sink = _sink(tmp_path, bulk_load_method="copy")
+    with pytest.raises(ConfigValidationError, match="'copy' is not supported"):
+        sink.connector.get_bulk_loader()
+
+
+def test_iter_rows(tmp_path: Path):
+    sink = _sink(tmp_path)
+    names = ["id", "full_name"]
+    records = [{"id": 1, "Full Name": "Ada"}, {"id": 2}, {"Full Name": "Bob", "id": 3}]
+    assert list(sink._iter_rows(records, names)) == [
+        (1, "Ada"),
+        (2, None),
+        (3, "Bob"),
+    ]
+
+    with pytest.raises(ConformedNameClashException):
+        list(sink._iter_rows([{"id": 1, "ID": 1}], names))
+
+
+def test_iter_rows_conform_record(tmp_path: Path):
+    class Sink(_Sink):
+        def conform_record(self, record: dict) -> dict:
+            return {**super().conform_record(record), "note": "conformed"}
+
+    target = _Target(config={"sqlalchemy_url": f"sqlite:///{tmp_path}/db.sqlite"})
+    sink = Sink(target, stream_name="users", schema=SCHEMA, key_properties=["id"])
+    rows = sink._iter_rows([{"id": 1}], ["id", "full_name", "note"])
+    assert list(rows) == [(1, None, "conformed")]
+
+
+class _StagedFileLoader(StagedFileBulkLoader):
+    name = "staged"
+
+    def __init__(self) -> None:
+        self.contents = b""
+
+    def copy_file(
+        self,
+        conn: sa.Connection,
+        table: sa.Table,
+        columns: Sequence[str],
+        file: t.IO[bytes],
+    ) -> None:
+        self.contents = file.read()
+        for line in io.BytesIO(self.contents):
+            values = [
+                None if value == "\\N" else value
+                for value in line.decode().rstrip("\n").split("\t")
+            ]
+            conn.execute(table.insert().values(dict(zip(columns, values, strict=True))))
+
+
+def test_staged_file_loader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    loader = _StagedFileLoader()
+    sink = _sink(tmp_path)
+    monkeypatch.setattr(sink.connector, "get_bulk_loader", lambda: loader)
+
+    records = [
+        {"id": 1, "Full Name": "Ada", "note": "line\nbreak\\"},
+        {"id": 2, "note": {"a": [True]}},
+    ]
+    assert sink.bulk_insert_records(sink.full_table_name, SCHEMA, records) == 2
+    assert loader.contents == (
+        b"1\tAda\tline\\nbreak\\\\\n"  # Escaped
+        b'2\t\\N\t{"a": [true]}\n'
+    )
@@ -9,10 +9,13 @@ import jsonschema
 import pytest
 
 from singer_sdk.exceptions import InvalidRecord
+from singer_sdk.helpers.capabilities import TARGET_VALIDATE_RECORDS_CONFIG
 from singer_sdk.sinks.core import (
     BaseJSONSchemaValidator,
     InvalidJSONSchema,
     JSONSchemaValidator,
+    get_cached_validator,
+    get_validator_class,
 )
 from tests.conftest import BatchSinkMock, TargetMock
 
@@ -170,6 +173,114 @@ def test_validate_fastjsonschema():
     assert isinstance(exc_info.value.__cause__, fastjsonschema.JsonSchemaValueException)
 
 
+@pytest.mark.parametrize("backend", ["jsonschema", "fastjsonschema", "msgspec"])
+def test_record_validator_backends(backend: str):
+    target = TargetMock(config={"record_validator": backend})
+    sink = BatchSinkMock(
+        target,
+        "users",
+        {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": ["string", "null"]},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["id"],
+        },
+        ["id"],
+    )
+    assert isinstance(sink._validator, get_validator_class(backend))
+
+    valid = {"id": 1, "name": None, "tags": ["a"]}
+    sink._validator.validate(valid)
+    sink._validator.validate({"id": 2.0})
+
+    invalid = [{"id": "1"}, {"id": 1.5}, {"name": "a"}, {"id": 1, "tags": [1]}]
+    for record in invalid:
+        with pytest.raises(InvalidRecord):
+            sink._validator.validate(record)
+
+    errors = sink._validator.validate_batch([valid, *invalid, valid])
+    assert [error.record for error in errors] == invalid
+
+
+def test_unknown_record_validator():
+    with pytest.raises(ValueError, match="Unsupported record validator: foo"):
+        get_validator_class("foo")
+
+    # Backends registered by other packages are not rejected by the config schema
+    setting = TARGET_VALIDATE_RECORDS_CONFIG["properties"]["record_validator"]
+    assert "enum" not in setting
+
+
+def test_cached_validator():
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    validator = get_cached_validator(
+        JSONSchemaValidator,
+        schema,
+        validate_formats=False,
+    )
+    assert validator is get_cached_validator(
+        JSONSchemaValidator,
+        {"properties": {"id": {"type": "integer"}}, "type": "object"},
+        validate_formats=False,
+    )
+    assert validator is not get_cached_validator(
+        JSONSchemaValidator,
+        schema,
+        validate_formats=True,
+    )
+    assert validator is not get_cached_validator(
+        JSONSchemaValidator,
+        {"type": "object", "properties": {"id": {"type": "string"}}},
+        validate_formats=False,
+    )
+
+
+@pytest.mark.parametrize("fail_on_error", [True, False])
+def test_validate_records_at_drain(
+    caplog: pytest.LogCaptureFixture,
+    fail_on_error: bool,
+):
+    class CustomSink(BatchSinkMock):
+        validate_records_at_drain = True
+        fail_on_record_validation_exception = fail_on_error
+
+    target = TargetMock()
+    sink = CustomSink(
+        target,
+        "users",
+        {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "created_at": {"type": "string", "format": "date-time"},
+            },
+        },
+        ["id"],
+    )
+    records = [
+        {"id": 1, "created_at": "2021-01-01T00:00:00+00:00"},
+        {"id": "2", "created_at": "2021-01-01T00:00:00+00:00"},
+    ]
+    for record in records:
+        context = sink._get_context(record)
+        sink._validate_and_parse(record)
+        sink.tally_record_read()
+        sink.process_record(record, context)
+
+    assert isinstance(records[0]["created_at"], datetime.datetime)
+    if fail_on_error:
+        with pytest.raises(InvalidRecord):
+            target.drain_one(sink)
+        assert not target.records_written
+    else:
+        target.drain_one(sink)
+        assert target.records_written == records
+        assert "Record validation failed" in caplog.text
+
+
 @pytest.fixture
 def default_draft_sink_stop():
     """Return a sink object with the default draft checks enabled."""
@@ -331,6 +442,31 @@ def test_bench_parse_timestamps_in_record(benchmark, bench_sink, bench_record):
     benchmark(run_parse_timestamps_in_record)
 
 
+@pytest.mark.parametrize("backend", ["jsonschema", "fastjsonschema", "msgspec"])
+def test_bench_validate_batch(benchmark, bench_record, backend: str):
+    """Run benchmark for validating a batch of records with each backend."""
+    number_of_runs = 1000
+
+    validator = get_validator_class(backend)(
+        {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "updated_at": {"type": "string", "format": "date-time"},
+                "deleted_at": {"type": "string", "format": "date-time"},
+            },
+        },
+        validate_formats=False,
+    )
+    records = [bench_record] * number_of_runs
+
+    def run_validate_batch():
+        assert not validator.validate_batch(records)
+
+    benchmark(run_validate_batch)
+
+
 def test_bench_validate_and_parse(benchmark, bench_sink, bench_record):
     """Run benchmark for Sink method _validate_and_parse."""
     number_of_runs = 1000
@@ -355,3 +491,33 @@ def test_bench_validate_record_with_schema(benchmark, bench_sink, bench_record):
             sink._validator.validate(record)
 
     benchmark(run_validate_record_with_schema)
+
+
+def test_parse_timestamps_in_record_schema_change(caplog: pytest.LogCaptureFixture):
+    target = TargetMock()
+    sink = BatchSinkMock(
+        target,
+        "users",
+        {"type": "object", "properties": {"id": {"type": "integer"}}},
+        ["id"],
+    )
+    record = {"id": 1, "created_at": "2021-01-01T00:00:00+00:00"}
+    sink._parse_timestamps_in_record(record, sink.schema, sink.datetime_error_treatment)
+    assert record["created_at"] == "2021-01-01T00:00:00+00:00"
+    assert "No schema for record field 'created_at'" in caplog.text
+
+    sink.schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "created_at": {"type": ["string", "null"], "format": "date-time"},
+            "created_on": {"anyOf": [{"type": "string", "format": "date"}]},
+        },
+    }
+    record = {"id": 1, "created_at": "2021-01-01T00:00:00+00:00", "created_on": None}
+    sink._parse_timestamps_in_record(record, sink.schema, sink.datetime_error_treatment)
+    assert record == {
+        "id": 1,
+        "created_at": datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+        "created_on": None,
+    }
@@ -53,5 +53,8 @@ def test_target_about_info(
         "add_record_metadata",
         "load_method",
         "batch_size_rows",
+        "batch_size_bytes",
+        "max_buffer_size_bytes",
+        "bulk_load_method",
     }
     assert set(about.settings["properties"]) == expected_settings | default_settings
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import datetime
+import io
+import json
+import threading
+import time
+import typing as t
+from contextlib import redirect_stdout
+
+import pytest
+import time_machine
+
+from singer_sdk import Stream, Tap
+from singer_sdk.helpers._concurrency import OrderedPrefetcher
+
+DATETIME = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class Parent(Stream):
+    """A sorted incremental parent stream."""
+
+    name = "parent"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+    }
+    replication_key = "id"
+    is_sorted = True
+    STATE_MSG_FREQUENCY = 3
+
+    def get_child_context(self, record: dict, context: dict | None) -> dict:  # noqa: ARG002
+        return {"pid": record["id"]}
+
+    def get_records(self, context: dict | None):  # noqa: ARG002
+        for i in range(1, 11):
+            yield {"id": i}
+
+
+class Child(Stream):
+    """A child stream with slow requests."""
+
+    name = "child"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "pid": {"type": ["integer", "array"], "items": {"type": "integer"}},
+        },
+    }
+    parent_stream_type = Parent
+    state_partitioning_keys: t.ClassVar[list[str]] = []
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.contexts: list[dict] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def get_records(self, context: dict | None):
+        with self._lock:
+            self.contexts.append(dict(context))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            pids = (
+                context["pid"] if isinstance(context["pid"], list) else [context["pid"]]
+            )
+            # Later parents are fetched faster
+            time.sleep(0.001 * (11 - pids[0]))
+            if self.config.get("fail_pid") in pids:
+                msg = "Cannot fetch child"
+                raise RuntimeError(msg)
+            return [{"id": i, "pid": pid} for pid in pids for i in range(2)]
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class FanOutTap(Tap):
+    name = "fan-out-tap"
+
+    def discover_streams(self):
+        child = Child(self)
+        child.max_parallel_contexts = self.config.get("max_parallel_contexts", 1)
+        child.context_batch_size = self.config.get("context_batch_size", 1)
+        return [Parent(self), child]
+
+
+def _sync(tap: Tap) -> list[dict]:
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        tap.sync_all()
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+def _child_records(messages: list[dict]) -> list[dict]:
+    return [
+        m["record"]
+        for m in messages
+        if m["type"] == "RECORD" and m["stream"] == "child"
+    ]
+
+
+@time_machine.travel(DATETIME, tick=False)
+def test_parallel_child_contexts():
+    sequential = _sync(FanOutTap())
+    tap = FanOutTap(config={"max_parallel_contexts": 3})
+    messages = _sync(tap)
+
+    assert _child_records(messages) == _child_records(sequential)
+    assert 1 < tap.streams["child"].max_running <= 3
+
+    # Each STATE message only covers parents whose children were written
+    synced_pid = 0
+    for message in messages:
+        if message["type"] == "RECORD" and message["stream"] == "child":
+            synced_pid = message["record"]["pid"]
+        elif message["type"] == "STATE":
+            bookmark = message["value"]["bookmarks"]["parent"]
+            value = bookmark.get("replication_key_value")
+            assert value is None or value <= synced_pid, bookmark
+
+    final_state = [m for m in messages if m["type"] == "STATE"][-1]
+    assert final_state == [m for m in sequential if m["type"] == "STATE"][-1]
+
+
+@pytest.mark.parametrize("max_parallel_contexts", [1, 2], ids=["serial", "parallel"])
+def test_child_context_batches(max_parallel_contexts: int):
+    tap = FanOutTap(
+        config={
+            "context_batch_size": 4,
+            "max_parallel_contexts": max_parallel_contexts,
+        },
+    )
+    messages = _sync(tap)
+
+    # Queued contexts are synced before each STATE message of the parent
+    assert tap.streams["child"].contexts == [
+        {"pid": [1, 2, 3]},
+        {"pid": [4, 5, 6]},
+        {"pid": [7, 8, 9]},
+        {"pid": [10]},
+    ]
+    assert [record["pid"] for record in _child_records(messages)] == [
+        pid for pid in range(1, 11) for _ in range(2)
+    ]
+
+
+def test_parallel_child_contexts_error():
+    tap = FanOutTap(config={"max_parallel_contexts": 3, "fail_pid": 4})
+    with pytest.raises(RuntimeError, match="Cannot fetch child"):
+        _sync(tap)
+
+    assert tap.streams["child"]._context_prefetcher is None
+
+
+def test_incremental_child_contexts_not_merged():
+    tap = FanOutTap(config={"context_batch_size": 4})
+    child = tap.streams["child"]
+    child.replication_key = "id"
+    child.state_partitioning_keys = None
+    _sync(tap)
+
+    # Each context keeps its own state partition
+    assert child.contexts == [{"pid": pid} for pid in range(1, 11)]
+    partitions = child.tap_state["bookmarks"]["child"]["partitions"]
+    assert [partition["context"] for partition in partitions] == child.contexts
+
+
+def test_ordered_prefetcher():
+    def produce(item: int):
+        for i in range(item):
+            yield item * 10 + i
+
+    prefetcher = OrderedPrefetcher(
+        produce,
+        max_workers=2,
+        max_pending=2,
+        buffer_size=1,
+    )
+    assert prefetcher.submit(3) == []
+    assert prefetcher.submit(1) == []
+    ((item, results),) = prefetcher.submit(2)
+    assert item == 3
+    assert list(results) == [30, 31, 32]
+    assert len(prefetcher) == 2
+    assert [(item, list(results)) for item, results in prefetcher.drain()] == [
+        (1, [10]),
+        (2, [20, 21]),
+    ]
+    prefetcher.close()
+
+
+def test_ordered_prefetcher_bounded():
+    produced = threading.Semaphore(0)
+
+    def produce(item: int):
+        for i in range(item):
+            produced.release()
+            yield i
+
+    prefetcher = OrderedPrefetcher(
+        produce,
+        max_workers=1,
+        max_pending=1,
+        buffer_size=2,
+    )
+    prefetcher.submit(100)
+    time.sleep(0.1)
+    # At most the buffered results and the one waiting to be put were produced
+    assert sum(produced.acquire(blocking=False) for _ in range(100)) <= 3
+    prefetcher.close()
+
+
+def test_ordered_prefetcher_error():
+    def produce(item: int):
+        yield item
+        msg = "Cannot produce"
+        raise RuntimeError(msg)
+
+    prefetcher = OrderedPrefetcher(produce, max_workers=1, max_pending=0, buffer_size=1)
+    ((_, results),) = prefetcher.submit(1)
+    with pytest.raises(RuntimeError, match="Cannot produce"):
+        list(results)
+    prefetcher.close()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import datetime
+import io
+import json
+import time
+import typing as t
+from contextlib import redirect_stdout
+
+import pytest
+import time_machine
+
+from singer_sdk import Stream, Tap
+
+DATETIME = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class NumbersStream(Stream):
+    """A sorted incremental stream."""
+
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "updated": {"type": "integer"},
+        },
+    }
+    replication_key = "updated"
+    is_sorted = True
+    STATE_MSG_FREQUENCY = 3
+
+    def get_child_context(self, record: dict, context: dict | None) -> dict:  # noqa: ARG002
+        return {"pid": record["id"]}
+
+    def get_records(self, context: dict | None):
+        start = self.get_starting_replication_key_value(context) or 0
+        for i in range(start + 1, 21):
+            # Give other streams a chance to run
+            time.sleep(0.0005)
+            if i == self.config.get("fail_at") and self.name == "b":
+                msg = "Cannot sync stream"
+                raise RuntimeError(msg)
+            yield {"id": i, "updated": i}
+
+
+class StreamA(NumbersStream):
+    name = "a"
+
+
+class ChildStream(Stream):
+    name = "a_child"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}, "pid": {"type": "integer"}},
+    }
+    parent_stream_type = StreamA
+
+    def get_records(self, context: dict | None):
+        yield {"id": 1, "pid": context["pid"]}
+
+
+class ConcurrentTap(Tap):
+    name = "concurrent-tap"
+
+    def discover_streams(self):
+        return [
+            StreamA(self),
+            ChildStream(self),
+            *(type(name, (NumbersStream,), {"name": name})(self) for name in "bcd"),
+        ]
+
+
+def _sync(tap: Tap) -> list[dict]:
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        tap.sync_all()
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+@time_machine.travel(DATETIME, tick=False)
+def test_concurrent_sync():
+    state = {
+        "bookmarks": {"d": {"replication_key": "updated", "replication_key_value": 15}}
+    }
+    sequential = _sync(ConcurrentTap(state=state))
+    messages = _sync(ConcurrentTap(config={"max_parallel_streams": 3}, state=state))
+
+    def stream_messages(output: list[dict], stream: str) -> list[dict]:
+        return [m for m in output if m.get("stream") == stream]
+
+    for stream in ("a", "b", "c", "d", "a_child"):
+        assert stream_messages(messages, stream) == stream_messages(sequential, stream)
+
+    # Each STATE message only covers records already written
+    latest: dict[str, int] = {"d": 15}
+    for message in messages:
+        if message["type"] == "RECORD" and message["stream"] in "abcd":
+            latest[message["stream"]] = message["record"]["updated"]
+        elif message["type"] == "STATE":
+            for name, bookmark in message["value"]["bookmarks"].items():
+                value = bookmark.get("replication_key_value")
+                assert value is None or value <= latest.get(name, 0), (name, bookmark)
+
+    final_state = [m for m in messages if m["type"] == "STATE"][-1]
+    assert final_state == [m for m in sequential if m["type"] == "STATE"][-1]
+    assert final_state["value"]["bookmarks"]["c"]["replication_key_value"] == 20
+
+
+def test_concurrent_sync_error():
+    tap = ConcurrentTap(config={"max_parallel_streams": 2, "fail_at": 5})
+    with pytest.raises(RuntimeError, match="Cannot sync stream"):
+        _sync(tap)
+
+    # The tap writes messages itself again
+    assert tap.state_writer is tap._state_writer
+    assert type(tap.message_writer).__name__ != "_QueuedMessageWriter"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import logging
 import sys
 import typing as t
 from decimal import Decimal
@@ -12,6 +13,7 @@ import sqlalchemy.types
 from sqlalchemy.dialects import registry, sqlite
 from sqlalchemy.engine.default import DefaultDialect
 
+from singer_sdk import metrics
 from singer_sdk.connectors import SQLConnector
 from singer_sdk.connectors.sql import (
     FullyQualifiedName,
@@ -581,6 +583,210 @@ class TestDummySQLConnector:
                 == "ALTER TABLE test_table ALTER COLUMN name TYPE VARCHAR"
             )
 
+    def test_get_column_ddl_statements(self, connector: DummySQLConnector):
+        engine = connector._engine
+        meta = sqlalchemy.MetaData()
+        _ = sqlalchemy.Table(
+            "test_table",
+            meta,
+            sqlalchemy.Column("id", sqlalchemy.Integer),
+            sqlalchemy.Column("name", sqlalchemy.Integer),
+        )
+        meta.create_all(engine)
+
+        schema = {
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+            },
+        }
+        statements = connector.get_column_ddl_statements("test_table", schema)
+        assert [str(statement.compile()) for statement in statements] == [
+            "ALTER TABLE test_table ALTER COLUMN name TYPE VARCHAR",
+            "ALTER TABLE test_table ADD COLUMN email VARCHAR",
+        ]
+
+    def test_prepare_table_batches_ddl(self, connector: DummySQLConnector):
+        connector.config["load_method"] = "append-only"
+        engine = connector._engine
+        meta = sqlalchemy.MetaData()
+        _ = sqlalchemy.Table(
+            "test_table",
+            meta,
+            sqlalchemy.Column("id", sqlalchemy.Integer),
+        )
+        meta.create_all(engine)
+
+        schema = {
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+            },
+        }
+        get_columns = sqlalchemy.engine.reflection.Inspector.get_columns
+        with (
+            mock.patch.object(
+                sqlalchemy.engine.reflection.Inspector,
+                "get_columns",
+                autospec=True,
+                side_effect=get_columns,
+            ) as mock_get_columns,
+            mock.patch.object(
+                connector,
+                "_connect",
+                wraps=connector._connect,
+            ) as mock_connect,
+        ):
+            connector.prepare_table("test_table", schema, primary_keys=["id"])
+            # The table is reflected once, and altered in a single transaction
+            mock_get_columns.assert_called_once()
+            mock_connect.assert_called_once()
+
+            # The connector's own DDL clears the reflection cache
+            columns = connector.get_table_columns("test_table")
+            assert list(columns) == ["id", "name", "email"]
+            assert mock_get_columns.call_count == 2
+
+            # Later preparations only use the cache
+            connector.prepare_table("test_table", schema, primary_keys=["id"])
+            assert connector.column_exists("test_table", "email")
+            assert mock_get_columns.call_count == 2
+            mock_connect.assert_called_once()
+
+    def test_reflection_cache(self, connector: DummySQLConnector):
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(sqlalchemy.text("CREATE TABLE test_table (id INTEGER)"))
+
+        assert list(connector.get_table_columns("test_table")) == ["id"]
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(
+                sqlalchemy.text("ALTER TABLE test_table ADD COLUMN name VARCHAR"),
+            )
+        assert list(connector.get_table_columns("test_table")) == ["id"]
+
+        connector.clear_reflection_cache("test_table")
+        assert list(connector.get_table_columns("test_table")) == ["id", "name"]
+
+    def test_reflection_cache_table_exists(self, connector: DummySQLConnector):
+        schema = {"properties": {"id": {"type": "integer"}}}
+        with mock.patch.object(
+            sqlalchemy.engine.reflection.Inspector,
+            "has_table",
+            autospec=True,
+            side_effect=sqlalchemy.engine.reflection.Inspector.has_table,
+        ) as has_table:
+            # Missing tables are not cached
+            assert not connector.table_exists("test_table")
+            assert not connector.table_exists("test_table")
+            assert has_table.call_count == 2
+
+            connector.create_empty_table("test_table", schema)
+            assert connector.table_exists("test_table")
+            assert connector.table_exists("test_table")
+            assert has_table.call_count == 3
+
+            connector.get_table("test_table")
+            connector.clear_reflection_cache()
+            connector.get_table("test_table")
+            assert connector.table_exists("test_table")
+            assert connector.column_exists("test_table", "id")
+            assert has_table.call_count == 3
+
+    def test_reflection_cache_overridden_ddl(self):
+        class Connector(DummySQLConnector):
+            def create_empty_table(self, full_table_name, schema, *args, **kwargs):  # noqa: ARG002
+                with self._connect() as conn, conn.begin():
+                    conn.execute(
+                        sqlalchemy.text(f"CREATE TABLE {full_table_name} (id INTEGER)"),
+                    )
+
+            def _create_empty_column(self, full_table_name, column_name, sql_type):  # noqa: ARG002
+                with self._connect() as conn, conn.begin():
+                    conn.execute(
+                        sqlalchemy.text(
+                            f"ALTER TABLE {full_table_name} ADD COLUMN {column_name} "
+                            "VARCHAR",
+                        ),
+                    )
+
+        connector = Connector(
+            config={"sqlalchemy_url": "sqlite:///", "load_method": "append-only"},
+        )
+        schema = {"properties": {"id": {"type": "integer"}}}
+        connector.prepare_table("test_table", schema, primary_keys=[])
+        assert connector.table_exists("test_table")
+        connector.prepare_table("test_table", schema, primary_keys=[])
+
+        assert not connector.column_exists("test_table", "name")
+        connector.prepare_column("test_table", "name", sqlalchemy.types.VARCHAR())
+        assert connector.column_exists("test_table", "name")
+
+    def test_reflection_cache_ttl(self, monkeypatch: pytest.MonkeyPatch):
+        class Connector(DummySQLConnector):
+            reflection_cache_ttl = 60
+
+        now = 0.0
+        connector = Connector(config={"sqlalchemy_url": "sqlite:///"})
+        monkeypatch.setattr(connector._reflection_cache, "_clock", lambda: now)
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(sqlalchemy.text("CREATE TABLE test_table (id INTEGER)"))
+
+        assert list(connector.get_table_columns("test_table")) == ["id"]
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(
+                sqlalchemy.text("ALTER TABLE test_table ADD COLUMN name VARCHAR"),
+            )
+
+        now = 59
+        assert list(connector.get_table_columns("test_table")) == ["id"]
+        now = 60
+        assert list(connector.get_table_columns("test_table")) == ["id", "name"]
+
+    def test_reflection_cache_metrics(
+        self,
+        connector: DummySQLConnector,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(sqlalchemy.text("CREATE TABLE test_table (id INTEGER)"))
+
+        for _ in range(3):
+            connector.get_table("test_table")
+
+        caplog.clear()
+        logger = metrics.get_metrics_logger()
+        with caplog.at_level(logging.INFO, logger=metrics.METRICS_LOGGER_NAME):
+            connector.log_reflection_cache_metrics(logger)
+
+        points = [
+            record.args[0]
+            for record in caplog.records
+            if record.name == metrics.METRICS_LOGGER_NAME
+        ]
+        assert {point.metric: point.value for point in points} == {
+            metrics.Metric.SQL_REFLECTION_CACHE_HIT_COUNT: 2,
+            metrics.Metric.SQL_REFLECTION_CACHE_MISS_COUNT: 1,
+        }
+        assert all(point.tags == {"table": "test_table"} for point in points)
+
+    def test_prepare_table_custom_prepare_column(self):
+        class Connector(DummySQLConnector):
+            def prepare_column(self, full_table_name, column_name, sql_type):  # noqa: ARG002
+                prepared.append(column_name)
+
+        prepared: list[str] = []
+        connector = Connector(
+            config={"sqlalchemy_url": "sqlite:///", "load_method": "append-only"},
+        )
+        with connector._engine.connect() as conn, conn.begin():
+            conn.execute(sqlalchemy.text("CREATE TABLE test_table (id INTEGER)"))
+
+        schema = {"properties": {"id": {"type": "integer"}, "name": {"type": "string"}}}
+        connector.prepare_table("test_table", schema, primary_keys=["id"])
+        assert prepared == ["id", "name"]
+
     @pytest.mark.parametrize(
         "exclude_schemas,expected_streams",
         [
@@ -0,0 +1,90 @@
+"""Test the JSONPath helpers."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from singer_sdk.helpers.jsonpath import (
+    _compile_extractor,
+    _compile_jsonpath,
+    _parse_simple_path,
+    extract_jsonpath,
+)
+
+INPUTS = [
+    {"data": [{"id": 1}, {"id": 2}], "meta": {"next": "abc", "empty": None}},
+    {"data": {"records": [{"id": 1}, None]}, "next-page": 3},
+    {"data": None, "meta": [{"next": 1}]},
+    {"data": "value", "meta": 0},
+    {"data": {"id": 1}, "my data": [1, 2]},
+    {"data": [], "true": [1]},
+    [{"id": 1}, {"id": 2}],
+    [],
+    {},
+    "value",
+    None,
+]
+
+
+@pytest.mark.parametrize(
+    "expression,path",
+    [
+        ("$", ((), False)),
+        ("$[*]", ((), True)),
+        ("$.data", (("data",), False)),
+        ("$.data[*]", (("data",), True)),
+        ("$.data.records[*]", (("data", "records"), True)),
+        ("$.meta.next", (("meta", "next"), False)),
+        ("$.next-page", (("next-page",), False)),
+        ("$['my data'][*]", (("my data",), True)),
+        ('$["data"].records[*]', (("data", "records"), True)),
+        ("$['true'][*]", (("true",), True)),
+        ("$.true[*]", None),
+        ("$.where", None),
+        ("$.data.*", None),
+        ("$..id", None),
+        ("$.data[0]", None),
+        ("$.data[?(@.id > 1)]", None),
+        ("data[*]", None),
+    ],
+)
+def test_parse_simple_path(expression: str, path: tuple | None):
+    assert _parse_simple_path(expression) == path
+
+
+@pytest.mark.parametrize("input", INPUTS)
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$",
+        "$[*]",
+        "$.data",
+        "$.data[*]",
+        "$.data.records[*]",
+        "$.meta.next",
+        "$.meta.empty",
+        "$.next-page",
+        "$['my data'][*]",
+        "$['true'][*]",
+    ],
+)
+def test_simple_path_matches_jsonpath_ng(expression: str, input: t.Any):  # noqa: A002
+    """The fast path matches the same values as jsonpath_ng."""
+    expected = [match.value for match in _compile_jsonpath(expression).find(input)]
+    assert list(extract_jsonpath(expression, input)) == expected
+
+
+def test_complex_path():
+    records = list(
+        extract_jsonpath(
+            "$.data[?(@.id > 1)]",
+            {"data": [{"id": 1}, {"id": 2}, {"id": 3}]},
+        )
+    )
+    assert records == [{"id": 2}, {"id": 3}]
+
+
+def test_cached_extractor():
+    assert _compile_extractor("$.data[*]") is _compile_extractor("$.data[*]")
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import copy
+import datetime
+import io
+import json
+import logging
+import time
+import typing as t
+from contextlib import redirect_stdout
+
+import pytest
+import time_machine
+
+from singer_sdk import Stream, Tap, metrics
+
+DATETIME = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class PartitionedStream(Stream):
+    """A sorted incremental stream with a partition per account."""
+
+    name = "events"
+    schema: t.ClassVar[dict] = {
+        "type": "object",
+        "properties": {
+            "account": {"type": "string"},
+            "id": {"type": "integer"},
+            "updated": {"type": "integer"},
+        },
+    }
+    replication_key = "updated"
+    is_sorted = True
+    STATE_MSG_FREQUENCY = 4
+    parallel_partitions_queue_size = 2
+
+    @property
+    def partitions(self) -> list[dict]:
+        return [{"account": account} for account in "abcde"]
+
+    def get_records(self, context: dict | None):
+        start = self.get_starting_replication_key_value(context) or 0
+        for i in range(start + 1, 11):
+            # Give other partitions a chance to run
+            time.sleep(0.0005)
+            if context["account"] == self.config.get("fail_account") and i == 3:
+                msg = "Cannot fetch partition"
+                raise RuntimeError(msg)
+            yield {"id": i, "updated": i}
+
+
+class PartitionedTap(Tap):
+    name = "partitioned-tap"
+
+    def discover_streams(self):
+        stream = PartitionedStream(self)
+        stream.max_parallel_partitions = self.config.get("max_parallel_partitions", 1)
+        return [stream]
+
+
+def _sync(tap: Tap) -> list[dict]:
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        tap.sync_all()
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+@time_machine.travel(DATETIME, tick=False)
+def test_parallel_partitions():
+    state = {
+        "bookmarks": {
+            "events": {
+                "partitions": [
+                    {
+                        "context": {"account": "c"},
+                        "replication_key": "updated",
+                        "replication_key_value": 6,
+                    }
+                ]
+            }
+        }
+    }
+    sequential = _sync(PartitionedTap(state=copy.deepcopy(state)))
+    messages = _sync(
+        PartitionedTap(
+            config={"max_parallel_partitions": 3},
+            state=copy.deepcopy(state),
+        )
+    )
+
+    def partition_records(output: list[dict], account: str) -> list[dict]:
+        return [
+            m["record"]
+            for m in output
+            if m["type"] == "RECORD" and m["record"]["account"] == account
+        ]
+
+    for account in "abcde":
+        assert partition_records(messages, account) == partition_records(
+            sequential, account
+        )
+
+    # Each STATE message only covers records already written
+    latest: dict[str, int] = {"c": 6}
+    for message in messages:
+        if message["type"] == "RECORD":
+            record = message["record"]
+            latest[record["account"]] = record["updated"]
+        elif message["type"] == "STATE":
+            for partition in message["value"]["bookmarks"]["events"]["partitions"]:
+                account = partition["context"]["account"]
+                value = partition.get(
+                    "replication_key_value",
+                    partition.get("progress_markers", {}).get("replication_key_value"),
+                )
+                assert value is None or value <= latest.get(account, 0), partition
+
+    final_state = [m for m in messages if m["type"] == "STATE"][-1]
+    assert final_state == [m for m in sequential if m["type"] == "STATE"][-1]
+
+
+def test_parallel_partitions_metrics(caplog: pytest.LogCaptureFixture):
+    tap = PartitionedTap(config={"max_parallel_partitions": 2})
+    with caplog.at_level(logging.INFO, logger=metrics.METRICS_LOGGER_NAME):
+        _sync(tap)
+
+    counts: dict[str, int] = {}
+    for record in caplog.records:
+        if record.name != metrics.METRICS_LOGGER_NAME:
+            continue
+        point = record.args[0].to_dict()
+        if point["metric"] == "record_count":
+            account = point["tags"]["context"]["account"]
+            counts[account] = counts.get(account, 0) + point["value"]
+    assert counts == dict.fromkeys("abcde", 10)
+
+
+def test_parallel_partitions_error():
+    tap = PartitionedTap(
+        config={"max_parallel_partitions": 2, "fail_account": "b"},
+    )
+    with pytest.raises(RuntimeError, match="Cannot fetch partition"):
+        _sync(tap)
+
+
+def test_parallel_partitions_error_stops_pending(monkeypatch: pytest.MonkeyPatch):
+    fetched = []
+    get_records = PartitionedStream.get_records
+
+    def tracking_get_records(self, context):
+        fetched.append(context["account"])
+        return get_records(self, context)
+
+    monkeypatch.setattr(PartitionedStream, "get_records", tracking_get_records)
+    tap = PartitionedTap(
+        config={"max_parallel_partitions": 2, "fail_account": "a"},
+    )
+    with pytest.raises(RuntimeError, match="Cannot fetch partition"):
+        _sync(tap)
+
+    # The worker of the failed partition may start the next one before the error
+    # is raised, but the partitions queued after it are never fetched
+    assert {"a", "b"} <= set(fetched)
+    assert set(fetched) <= {"a", "b", "c"}
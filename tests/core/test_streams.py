@@ -19,8 +19,9 @@ from singer_sdk.exceptions import (
 )
 from singer_sdk.helpers._compat import SingerSDKDeprecationWarning
 from singer_sdk.helpers._compat import datetime_fromisoformat as parse
+from singer_sdk.helpers._typing import TypeConformanceLevel
 from singer_sdk.helpers.jsonpath import _compile_jsonpath
-from singer_sdk.singerlib import Catalog, MetadataMapping
+from singer_sdk.singerlib import Catalog, MetadataMapping, RecordMessage
 from singer_sdk.streams.core import REPLICATION_FULL_TABLE, REPLICATION_INCREMENTAL
 from singer_sdk.streams.graphql import GraphQLStream
 from singer_sdk.streams.rest import RESTStream
@@ -345,12 +346,21 @@ def test_stream_invalid_replication_key(tap: SimpleTestTap):
         "nested_values",
     ],
 )
-def test_jsonpath_rest_stream(tap: Tap, path: str, content: str, result: list[dict]):
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_jsonpath_rest_stream(
+    tap: Tap,
+    path: str,
+    content: str,
+    result: list[dict],
+    stream_responses: bool,
+    monkeypatch: pytest.MonkeyPatch,
+):
     """Validate records are extracted correctly from the API response."""
     fake_response = requests.Response()
     fake_response._content = str.encode(content)
 
     RestTestStream.records_jsonpath = path
+    monkeypatch.setattr(RestTestStream, "stream_responses", stream_responses)
     stream = RestTestStream(tap)
 
     records = stream.parse_response(fake_response)
@@ -776,3 +786,82 @@ def test_post_process_transforms_record(tap: Tap):
     stream = TransformsRecord(tap)
     records = stream._sync_records(None, write_messages=False)
     assert all(record["extra"] == "transformed" for record in records)
+
+
+def test_generate_record_messages_override(
+    tap: Tap,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Record messages built by an overridden hook are written as they are."""
+
+    class CustomMessages(SimpleTestStream):
+        def _generate_record_messages(self, record):
+            for message in super()._generate_record_messages(record):
+                message.record["extra"] = "custom"
+                yield message
+
+    messages: list = []
+    monkeypatch.setattr(tap, "write_message", messages.append)
+
+    stream = CustomMessages(tap)
+    for _ in stream._sync_records(None):
+        pass
+
+    records = [message for message in messages if isinstance(message, RecordMessage)]
+    assert records
+    assert all(message.record["extra"] == "custom" for message in records)
+
+
+def test_record_conformer_invalidation(stream: Stream):
+    """The record conformer is compiled again when the schema changes."""
+    conformer = stream.record_conformer
+    assert stream.record_conformer is conformer
+    assert conformer.schema is stream.effective_schema
+
+    stream.apply_catalog(
+        catalog=Catalog.from_dict(
+            {
+                "streams": [
+                    {
+                        "tap_stream_id": stream.name,
+                        "metadata": MetadataMapping(),
+                        "key_properties": ["id"],
+                        "stream": stream.name,
+                        "schema": {
+                            "type": "object",
+                            "properties": {"id": {"type": "integer"}},
+                        },
+                    },
+                ],
+            },
+        ),
+    )
+    assert stream.record_conformer is not conformer
+    assert stream.record_conformer.conform({"id": 1, "value": "a"}) == (
+        {"id": 1},
+        ["value"],
+    )
+
+    conformer = stream.record_conformer
+    stream.TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
+    assert stream.record_conformer is not conformer
+    assert stream.record_conformer.conform({"id": 1, "value": "a"}) == (
+        {"id": 1, "value": "a"},
+        [],
+    )
+
+
+def test_record_conformer_schema_changed_in_place(stream: Stream):
+    """Changes made to the schema in place are picked up by the next sync."""
+    conformer = stream.record_conformer
+    assert stream.record_conformer is conformer
+
+    stream.effective_schema["properties"].pop("value")
+    assert stream.record_conformer is conformer
+
+    stream.sync()
+    assert stream.record_conformer is not conformer
+    assert stream.record_conformer.conform({"id": 1, "value": "a"}) == (
+        {"id": 1},
+        ["value"],
+    )
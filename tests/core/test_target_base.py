@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import copy
+import io
+import json
+import threading
+from contextlib import redirect_stdout
 
 import pytest
 
@@ -79,6 +83,8 @@ def test_target_about_info():
     assert "batch_config" in about.settings["properties"]
     assert "add_record_metadata" in about.settings["properties"]
     assert "batch_size_rows" in about.settings["properties"]
+    assert "batch_size_bytes" in about.settings["properties"]
+    assert "max_buffer_size_bytes" in about.settings["properties"]
 
 
 def test_sql_get_sink():
@@ -181,3 +187,143 @@ def test_batch_size_rows_and_max_size():
     assert sink_set._batch_size_rows == 100000
     assert sink_set.batch_size_rows == 100000
     assert sink_set.max_size == 100000
+
+
+def test_batch_size_bytes():
+    schema = {"properties": {"id": {"type": "integer"}}}
+    target = TargetMock(config={"batch_size_bytes": 100})
+    sink = BatchSinkMock(target, "foo", schema, [])
+    assert sink.batch_size_bytes == 100
+
+    sink.tally_record_read(size_bytes=60)
+    assert sink.current_size_bytes == 60
+    assert not sink.is_full
+
+    sink.tally_record_read(size_bytes=60)
+    assert sink.is_full
+
+    sink.mark_drained()
+    assert sink.current_size_bytes == 0
+    assert not sink.is_full
+
+
+def test_max_buffer_size_bytes():
+    target = TargetMock(config={"max_buffer_size_bytes": 1000})
+    schema = {"properties": {"id": {"type": "integer"}, "blob": {"type": "string"}}}
+    messages = [
+        {"type": "SCHEMA", "stream": "wide", "schema": schema, "key_properties": []},
+        {"type": "SCHEMA", "stream": "narrow", "schema": schema, "key_properties": []},
+    ]
+    for i in range(5):
+        messages.extend(
+            (
+                {
+                    "type": "RECORD",
+                    "stream": "wide",
+                    "record": {"id": i, "blob": "x" * 200},
+                },
+                {"type": "RECORD", "stream": "narrow", "record": {"id": i}},
+            )
+        )
+    lines = "".join(json.dumps(message) + "\n" for message in messages)
+
+    with redirect_stdout(io.StringIO()):
+        target.process_lines(io.StringIO(lines))
+
+    # Only the wide stream had to be drained to stay within the buffer size
+    assert target.num_batches_processed == 1
+    assert {record.get("blob") for record in target.records_written} == {"x" * 200}
+    assert target._sinks_active["wide"].current_size_bytes < 1000
+    assert target._sinks_active["narrow"].current_size == 5
+
+    target.drain_all()
+    assert target.num_batches_processed == 3
+    assert target._buffered_bytes == 0
+
+
+def test_listen_bulk_read():
+    target = TargetMock()
+    target.message_reader.bulk_read_size = 256
+    schema = {"properties": {"id": {"type": "integer"}}}
+    messages = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *(
+            {"type": "RECORD", "stream": "users", "record": {"id": i}}
+            for i in range(100)
+        ),
+        {"type": "STATE", "value": {"bookmarks": {"users": {}}}},
+    ]
+    lines = "".join(json.dumps(message) + "\n" for message in messages)
+
+    with redirect_stdout(io.StringIO()):
+        target.listen(io.StringIO(lines))
+
+    assert target.num_records_processed == 100
+    assert [record["id"] for record in target.records_written] == list(range(100))
+    assert target.state_messages_written == [{"bookmarks": {"users": {}}}]
+
+
+class BlockingSinkMock(BatchSinkMock):
+    max_inflight_batches = 2
+
+    def process_batch(self, context: dict) -> None:
+        assert self.target.release.wait(timeout=5)
+        if context["records"][0]["id"] < 0:
+            msg = "Cannot process batch"
+            raise RuntimeError(msg)
+        super().process_batch(context)
+
+
+class BackgroundDrainTargetMock(TargetMock):
+    default_sink_class = BlockingSinkMock
+    max_inflight_batches = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+
+
+def _record_lines(ids: list[int]) -> io.StringIO:
+    schema = {"properties": {"id": {"type": "integer"}}}
+    messages = [
+        {"type": "SCHEMA", "stream": "users", "schema": schema, "key_properties": []},
+        *({"type": "RECORD", "stream": "users", "record": {"id": i}} for i in ids),
+        {"type": "STATE", "value": {"bookmarks": {"users": {"id": ids[-1]}}}},
+    ]
+    return io.StringIO("".join(json.dumps(message) + "\n" for message in messages))
+
+
+def test_background_drain():
+    target = BackgroundDrainTargetMock(config={"batch_size_rows": 2})
+
+    with redirect_stdout(io.StringIO()):
+        target.process_lines(_record_lines([1, 2, 3, 4, 5]))
+
+    # Reading went on while the two full batches are blocked
+    sink = target._sinks_active["users"]
+    assert len(target._inflight_batches["users"]) == 2
+    assert sink.current_size == 1
+    assert target.num_batches_processed == 0
+    assert target.state_messages_written == []
+
+    target.release.set()
+    with redirect_stdout(io.StringIO()):
+        target.drain_all()
+
+    assert target.num_batches_processed == 3
+    assert sorted(record["id"] for record in target.records_written) == [1, 2, 3, 4, 5]
+    assert sink._total_records_written == 5
+    assert target.state_messages_written == [{"bookmarks": {"users": {"id": 5}}}]
+    assert not target._inflight_batches["users"]
+
+
+def test_background_drain_error():
+    target = BackgroundDrainTargetMock(config={"batch_size_rows": 2})
+    target.release.set()
+
+    with redirect_stdout(io.StringIO()):
+        target.process_lines(_record_lines([-1, -2, 3]))
+        with pytest.raises(RuntimeError, match="Cannot process batch"):
+            target.drain_all()
+
+    assert target.state_messages_written == []
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
 import decimal
 import itertools
@@ -12,8 +13,11 @@ import pytest
 import sqlalchemy as sa
 
 from singer_sdk.helpers._typing import (
+    EmptySchemaTypeError,
+    RecordConformer,
     TypeConformanceLevel,
     _conform_primitive_property,
+    _conform_record_data_types,
     conform_record_data_types,
 )
 from singer_sdk.typing import (
@@ -477,8 +481,91 @@ def test_iterate_properties_list():
     assert list_property in properties_list
 
 
-def test_bench_conform_record_data_types(benchmark: BenchmarkFixture):
-    """Run benchmark for conform_record_data_types method."""
+@pytest.mark.parametrize(
+    "level",
+    [
+        TypeConformanceLevel.RECURSIVE,
+        TypeConformanceLevel.ROOT_ONLY,
+        TypeConformanceLevel.NONE,
+    ],
+)
+def test_record_conformer(level: TypeConformanceLevel):
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "flag": {"type": ["boolean", "null"]},
+            "bit": {"type": "boolean"},
+            "created_at": {"type": "string", "format": "date-time"},
+            "day": {"type": ["string", "null"], "format": "date"},
+            "amount": {"type": "number"},
+            "blob": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "bits": {"type": "array", "items": {"type": "boolean"}},
+            "tuple": {"type": "array", "prefixItems": [{"type": "string"}]},
+            "untyped": {},
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"value": {"type": "number"}},
+                },
+            },
+            "metadata": {
+                "type": ["object", "null"],
+                "properties": {
+                    "key": {"type": "string"},
+                    "nested": {
+                        "type": "object",
+                        "properties": {"bit": {"type": "boolean"}},
+                    },
+                },
+            },
+            "free_form": {"type": "object", "additionalProperties": True},
+        },
+    }
+    record = {
+        "id": 1,
+        "flag": 0,
+        "bit": b"\x01",
+        "created_at": datetime.datetime(2021, 1, 1),  # noqa: DTZ001
+        "day": datetime.date(2021, 1, 1),
+        "amount": float("nan"),
+        "blob": b"\xab",
+        "tags": ["a", "b"],
+        "bits": [b"\x00", b"\x01"],
+        "tuple": ["a"],
+        "untyped": "value",
+        "items": [{"value": float("inf"), "extra": 1}, {"value": 1.5}],
+        "metadata": {
+            "key": "value",
+            "unknown": 1,
+            "nested": {"bit": b"\x00", "other": 2},
+        },
+        "free_form": {"key": datetime.date(2021, 1, 1)},
+        "unknown": True,
+    }
+
+    conformer = RecordConformer(schema, level)
+    expected = _conform_record_data_types(copy.deepcopy(record), schema, level, None)
+    assert conformer.conform(copy.deepcopy(record)) == expected
+    # The conformer can be reused
+    assert conformer.conform(copy.deepcopy(record)) == expected
+
+
+def test_record_conformer_untyped_list():
+    conformer = RecordConformer(
+        {"type": "object", "properties": {"value": {}}},
+        TypeConformanceLevel.RECURSIVE,
+    )
+    assert conformer.conform({"value": "a"}) == ({"value": "a"}, [])
+    with pytest.raises(EmptySchemaTypeError):
+        conformer.conform({"value": ["a"]})
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["function", "compiled"])
+def test_bench_conform_record_data_types(benchmark: BenchmarkFixture, compiled: bool):
+    """Run benchmark for conforming records, with and without a compiled plan."""
     number_of_runs = 1_000
     schema = {
         "type": "object",
@@ -526,4 +613,10 @@ def test_bench_conform_record_data_types(benchmark: BenchmarkFixture):
                 logger,
             )
 
-    benchmark(run_conform_record_data_types)
+    conformer = RecordConformer(schema, TypeConformanceLevel.RECURSIVE)
+
+    def run_record_conformer():
+        for rec in itertools.repeat(record, number_of_runs):
+            conformer.conform(rec)
+
+    benchmark(run_record_conformer if compiled else run_conform_record_data_types)
@@ -5,6 +5,7 @@ import json
 import typing as t
 
 import pytest
+import sqlalchemy as sa
 import time_machine
 from click.testing import CliRunner
 from tap_sqlite import SQLiteTap
@@ -153,3 +154,119 @@ def test_sqlite_state(sqlite_sample_tap_state_messages):
         for message in sqlite_sample_tap_state_messages
         for bookmark in message["value"]["bookmarks"].values()
     )
+
+
+@pytest.mark.parametrize("fetch_size", [None, 7])
+def test_sqlite_fetch_size(
+    sqlite_sample_db,
+    sqlite_sample_db_config: dict[str, t.Any],
+    fetch_size: int | None,
+):
+    _ = sqlite_sample_db
+    config = dict(sqlite_sample_db_config)
+    if fetch_size:
+        config["fetch_size"] = fetch_size
+    tap = SQLiteTap(config=config)
+    assert "fetch_size" in tap.config_jsonschema["properties"]
+    stream = t.cast("SQLStream", tap.streams["main-t1"])
+
+    execution_options = []
+
+    def before_execute(conn, clauseelement, multiparams, params, options):  # noqa: ARG001
+        execution_options.append(options)
+
+    engine = stream.connector._engine
+    sa.event.listen(engine, "before_execute", before_execute)
+    try:
+        records = list(stream.get_records(None))
+    finally:
+        sa.event.remove(engine, "before_execute", before_execute)
+
+    assert len(records) == 100
+    assert records[42] == {"c1": 42, "c2": "x=42", "c3": "y=42"}
+    assert execution_options[-1].get("yield_per") == fetch_size
+
+
+def _sync_messages(tap: SQLTap) -> list[dict]:
+    stdout, _ = tap_sync_test(tap)
+    return [json.loads(line) for line in stdout.readlines()]
+
+
+@pytest.mark.parametrize("max_parallel_partitions", [1, 3])
+def test_sqlite_key_range_partitions(
+    sqlite_sample_tap: SQLTap,
+    max_parallel_partitions: int,
+):
+    stream = t.cast("SQLStream", sqlite_sample_tap.streams["main-t1"])
+    stream.partition_count = 4
+    stream.max_parallel_partitions = max_parallel_partitions
+
+    partitions = stream.partitions
+    assert partitions == [
+        {"partition_key": "c1", "start": None, "end": 24},
+        {"partition_key": "c1", "start": 24, "end": 49},
+        {"partition_key": "c1", "start": 49, "end": 74},
+        {"partition_key": "c1", "start": 74, "end": None},
+    ]
+
+    messages = _sync_messages(sqlite_sample_tap)
+    ids = [
+        message["record"]["c1"]
+        for message in messages
+        if message["type"] == "RECORD" and message["stream"] == "main-t1"
+    ]
+    assert sorted(ids) == list(range(100))
+
+    state = sqlite_sample_tap.state["bookmarks"]["main-t1"]
+    contexts = [partition["context"] for partition in state["partitions"]]
+    assert sorted(contexts, key=partitions.index) == partitions
+
+
+def test_sqlite_quantile_partitions(sqlite_sample_tap: SQLTap):
+    stream = t.cast("SQLStream", sqlite_sample_tap.streams["main-t1"])
+    stream.partition_count = 4
+    stream.partition_key = "c2"
+
+    partitions = stream.partitions
+    assert partitions is not None
+    assert [p["start"] for p in partitions] == [None, "x=31", "x=54", "x=77"]
+
+    ids = [
+        record["c1"]
+        for partition in partitions
+        for record in stream.get_records(partition)
+    ]
+    assert sorted(ids) == list(range(100))
+
+
+def test_sqlite_partitions_resume(sqlite_sample_tap: SQLTap):
+    stream = t.cast("SQLStream", sqlite_sample_tap.streams["main-t2"])
+    stream.partition_count = 2
+
+    # The key ranges of the previous sync are reused
+    context = {"partition_key": "c1", "start": 30, "end": None}
+    sqlite_sample_tap.load_state(
+        {
+            "bookmarks": {
+                "main-t2": {
+                    "replication_key": "c1",
+                    "replication_key_value": 20,
+                    "partitions": [
+                        {
+                            "context": context,
+                            "replication_key": "c1",
+                            "replication_key_value": 90,
+                        },
+                    ],
+                },
+            },
+        },
+    )
+    assert stream.partitions == [context]
+    stream._write_starting_replication_value(context)
+    assert [r["c1"] for r in stream.get_records(context)] == list(range(90, 100))
+
+    # New key ranges resume from the bookmark of an unpartitioned sync
+    new_range = {"partition_key": "c1", "start": None, "end": 50}
+    stream._write_starting_replication_value(new_range)
+    assert [r["c1"] for r in stream.get_records(new_range)] == list(range(20, 50))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime
 import decimal
 import io
 import json
@@ -10,7 +11,7 @@ from textwrap import dedent
 
 import pytest
 
-from singer_sdk.singerlib import RecordMessage
+from singer_sdk.singerlib import RecordMessage, StateMessage
 from singer_sdk.singerlib.encoding.simple import (
     SimpleSingerReader,
     SimpleSingerWriter,
@@ -119,3 +120,196 @@ def test_encode_nan_values(float_value):
     assert out.getvalue() == (
         '{"type":"RECORD","stream":"test","record":{"id":1,"name":null}}\n'
     )
+
+
+@pytest.mark.parametrize(
+    "version,time_extracted",
+    [
+        pytest.param(None, None, id="plain"),
+        pytest.param(1, None, id="version"),
+        pytest.param(
+            None,
+            datetime.datetime(2023, 1, 1, 11, tzinfo=datetime.timezone.utc),
+            id="time-extracted",
+        ),
+        pytest.param(
+            2,
+            datetime.datetime(
+                2023, 1, 1, 4, tzinfo=datetime.timezone(datetime.timedelta(hours=-7))
+            ),
+            id="version-time-extracted-offset",
+        ),
+    ],
+)
+def test_write_record(version, time_extracted):
+    writer = SimpleSingerWriter()
+    record = {"id": 1, "name": "test", "value": decimal.Decimal("1.23")}
+    expected = writer.format_message(
+        RecordMessage(
+            stream='a"stream',
+            record=record,
+            version=version,
+            time_extracted=time_extracted,
+        ),
+    )
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_record(
+            'a"stream',
+            record,
+            version=version,
+            time_extracted=time_extracted,
+        )
+        writer.write_record(
+            'a"stream',
+            record,
+            version=version,
+            time_extracted=time_extracted,
+        )
+
+    assert out.getvalue().splitlines() == [expected, expected]
+
+
+def test_write_record_naive_time_extracted():
+    writer = SimpleSingerWriter()
+    with pytest.raises(ValueError, match="must be either None or an aware datetime"):
+        writer.write_record(
+            "test",
+            {"id": 1},
+            time_extracted=datetime.datetime(2023, 1, 1),  # noqa: DTZ001
+        )
+
+
+def test_write_message_buffered():
+    writer = SimpleSingerWriter(buffer_max_messages=3)
+    assert writer.is_buffered
+
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(RecordMessage(stream="test", record={"id": 1}))
+        writer.write_message(RecordMessage(stream="test", record={"id": 2}))
+        assert not out.getvalue()
+
+        # STATE messages force a flush, after the records they follow
+        writer.write_message(StateMessage(value={"bookmarks": {"test": {"id": 2}}}))
+        assert out.getvalue().splitlines() == [
+            '{"type":"RECORD","stream":"test","record":{"id":1}}',
+            '{"type":"RECORD","stream":"test","record":{"id":2}}',
+            '{"type":"STATE","value":{"bookmarks":{"test":{"id":2}}}}',
+        ]
+
+        # The record threshold triggers a flush
+        for i in range(3):
+            writer.write_message(RecordMessage(stream="test", record={"id": i}))
+        assert len(out.getvalue().splitlines()) == 6
+
+        writer.write_message(RecordMessage(stream="test", record={"id": 3}))
+        assert len(out.getvalue().splitlines()) == 6
+        writer.flush()
+        assert len(out.getvalue().splitlines()) == 7
+
+
+def test_write_message_buffered_bytes_threshold():
+    writer = SimpleSingerWriter(buffer_max_bytes=100)
+    message = RecordMessage(stream="test", record={"id": 1, "name": "test"})
+
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(message)
+        assert not out.getvalue()
+        writer.write_message(message)
+        assert len(out.getvalue().splitlines()) == 2
+
+
+def test_flush_without_base_initializer():
+    class Writer(SimpleSingerWriter):
+        def __init__(self) -> None:  # Does not call super().__init__()
+            pass
+
+    writer = Writer()
+    assert not writer.is_buffered
+    with redirect_stdout(io.StringIO()) as out:
+        writer.write_message(RecordMessage(stream="test", record={"id": 1}))
+        writer.flush()
+    assert len(out.getvalue().splitlines()) == 1
+
+
+@pytest.mark.parametrize(
+    "make_input",
+    [
+        pytest.param(io.StringIO, id="text"),
+        pytest.param(lambda text: io.BytesIO(text.encode()), id="binary"),
+        pytest.param(
+            lambda text: io.TextIOWrapper(io.BytesIO(text.encode()), encoding="utf-8"),
+            id="text-wrapper",
+        ),
+    ],
+)
+@pytest.mark.parametrize("bulk_read_size", [7, 64, 1024 * 1024])
+def test_process_lines_bulk(make_input, bulk_read_size):
+    lines = [
+        {"type": "SCHEMA", "stream": "users", "schema": {"properties": {}}},
+        {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+        {"type": "RECORD", "stream": "users", "record": {"id": 2}},
+        {"type": "RECORD", "stream": "items", "record": {"id": 3}},
+        {"type": "STATE", "value": {"bookmarks": {}}},
+        {"type": "RECORD", "stream": "items", "record": {"id": 4}},
+    ]
+    text = "\n".join(json.dumps(line) for line in lines) + "\n\n"
+
+    received = []
+    batches = []
+
+    def record_batch(messages: list[dict]) -> None:
+        batches.append([message["record"]["id"] for message in messages])
+
+    reader = SimpleSingerReader(bulk_read_size=bulk_read_size)
+    counter = reader.process_lines(
+        make_input(text),
+        {**CALLBACKS, "STATE": received.append, "SCHEMA": received.append},
+        {"RECORD": record_batch},
+    )
+
+    assert counter == {"SCHEMA": 1, "RECORD": 4, "STATE": 1}
+    assert received == [lines[0], lines[4]]
+    # Runs never span streams or other message types
+    assert [i for batch in batches for i in batch] == [1, 2, 3, 4]
+    assert all(len(batch) <= 2 for batch in batches)
+    if bulk_read_size > len(text):
+        assert batches == [[1, 2], [3], [4]]
+
+
+def test_process_lines_bulk_without_batch_callbacks():
+    records = []
+    reader = SimpleSingerReader(bulk_read_size=1024)
+    input_lines = io.StringIO(
+        '{"type": "RECORD", "stream": "users", "record": {"id": 1}}\n'
+        '{"type": "RECORD", "stream": "users", "record": {"id": 2}}',
+    )
+    reader.process_lines(input_lines, {**CALLBACKS, "RECORD": records.append})
+    assert [record["record"]["id"] for record in records] == [1, 2]
+
+
+@pytest.mark.parametrize("bulk_read_size", [None, 1024])
+def test_current_message_size(bulk_read_size):
+    sizes = []
+    reader = SimpleSingerReader(bulk_read_size=bulk_read_size)
+    lines = '{"type": "STATE", "value": {}}\n{"type": "STATE", "value": {"a": 1}}\n'
+    reader.process_lines(
+        io.StringIO(lines),
+        {"STATE": lambda _: sizes.append(reader.current_message_size)},
+    )
+    if bulk_read_size:
+        # Average line size of the block
+        assert sizes == [len(lines) // 2] * 2
+    else:
+        assert sizes == [len(line) for line in lines.splitlines(keepends=True)]
+
+
+def test_process_lines_bulk_errors():
+    reader = SimpleSingerReader(bulk_read_size=1024)
+    with pytest.raises(InvalidInputLine, match="Unable to parse"):
+        reader.process_lines(io.StringIO('{"type": "STATE"}\nnot-json\n'), CALLBACKS)
+
+    with pytest.raises(InvalidInputLine, match="missing required type"):
+        reader.process_lines(io.StringIO('{"value": {}}\n'), CALLBACKS)
+
+    with pytest.raises(ValueError, match="Unknown message type"):
+        reader.process_lines(io.StringIO('{"type": "UNKNOWN"}\n'), CALLBACKS)